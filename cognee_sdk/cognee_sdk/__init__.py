@@ -14,13 +14,36 @@ from cognee_sdk.exceptions import (
     TimeoutError,
     ValidationError,
 )
-from cognee_sdk.models import PipelineRunStatus, SearchType
+from cognee_sdk.models import (
+    AddResult,
+    CognifyResult,
+    CombinedSearchResult,
+    DataItem,
+    Dataset,
+    DeleteResult,
+    GraphData,
+    GraphDataRaw,
+    GraphEdge,
+    GraphNode,
+    HealthStatus,
+    MemifyResult,
+    PipelineRunStatus,
+    SearchHistoryItem,
+    SearchResult,
+    SearchType,
+    SearchTypeValue,
+    SyncResult,
+    SyncStatus,
+    UpdateResult,
+    User,
+)
 
 __version__ = "0.3.0"
 
 __all__ = [
     "CogneeClient",
     "SearchType",
+    "SearchTypeValue",
     "PipelineRunStatus",
     "CogneeSDKError",
     "CogneeAPIError",
@@ -29,4 +52,22 @@ __all__ = [
     "ValidationError",
     "ServerError",
     "TimeoutError",
+    "AddResult",
+    "CognifyResult",
+    "CombinedSearchResult",
+    "DataItem",
+    "Dataset",
+    "DeleteResult",
+    "GraphData",
+    "GraphDataRaw",
+    "GraphEdge",
+    "GraphNode",
+    "HealthStatus",
+    "MemifyResult",
+    "SearchHistoryItem",
+    "SearchResult",
+    "SyncResult",
+    "SyncStatus",
+    "UpdateResult",
+    "User",
 ]
@@ -5,20 +5,40 @@ Main client class for interacting with Cognee API server.
 """
 
 import asyncio
+import functools
 import gzip
 import hashlib
+import importlib
+import inspect
 import json
 import logging
 import mimetypes
+import os
+import ssl
 import time
 import warnings
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable, Sequence
 from io import BufferedReader
 from pathlib import Path
-from typing import Any, BinaryIO, Callable, Literal, Union
+from types import ModuleType
+from typing import Any, BinaryIO, Callable, ClassVar, Literal, TypeVar, Union, cast
 from uuid import UUID
 
 import httpx
+from pydantic import ConfigDict, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    _websockets: ModuleType | None = importlib.import_module("websockets")
+    _websockets_import_error: ImportError | None = None
+except ImportError as _err:  # pragma: no cover - optional dependency
+    _websockets = None
+    _websockets_import_error = _err
 
 from cognee_sdk.exceptions import (
     AuthenticationError,
@@ -30,6 +50,8 @@ from cognee_sdk.exceptions import (
     ValidationError,
 )
 from cognee_sdk.models import (
+    _PIPELINE_RUN_STATUSES,
+    _SEARCH_TYPE_VALUES,
     AddResult,
     CognifyResult,
     CombinedSearchResult,
@@ -37,18 +59,131 @@ from cognee_sdk.models import (
     Dataset,
     DeleteResult,
     GraphData,
+    GraphDataRaw,
     HealthStatus,
     MemifyResult,
     PipelineRunStatus,
     SearchHistoryItem,
     SearchResult,
     SearchType,
+    SearchTypeValue,
     SyncResult,
     SyncStatus,
     UpdateResult,
     User,
 )
 
+T = TypeVar("T")
+
+# orjson (optional "speedups" extra) parses bytes directly and is several times
+# faster than the stdlib decoder. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers only need to handle the stdlib exception.
+_json_loads: Callable[[bytes | str], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize UUIDs for the stdlib encoder; orjson handles them natively."""
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a request payload to JSON bytes, passing UUIDs through as-is."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def _default_ssl_context() -> ssl.SSLContext | bool:
+    """
+    Build the TLS context shared by every client, once per process.
+
+    httpx builds a fresh context for each AsyncClient, and loading the CA
+    bundle into it dominates client construction time. Contexts are safe to
+    share between clients and event loops.
+
+    Returns:
+        httpx's default SSL context, or True on httpx versions without
+        ``httpx.create_ssl_context`` (each client then builds its own)
+    """
+    create_ssl_context = getattr(httpx, "create_ssl_context", None)
+    if create_ssl_context is None:  # pragma: no cover - httpx < 0.28
+        return True
+    return cast(ssl.SSLContext, create_ssl_context())
+
+
+# Pre-resolved MIME types for the extensions most commonly uploaded to Cognee.
+# Homogeneous batch uploads hit this dict instead of the mimetypes registry.
+_MIME_CACHE: dict[str, str] = {
+    ".pdf": "application/pdf",
+    ".txt": "text/plain",
+    ".json": "application/json",
+    ".md": "text/markdown",
+    ".html": "text/html",
+    ".csv": "text/csv",
+}
+
+# Response validators created once at import. Validating through a TypeAdapter
+# runs the whole list/model in pydantic-core instead of one __init__ per item.
+# Core schemas are built lazily on first use: model adapters follow the models'
+# defer_build config, and container adapters are deferred explicitly.
+_DEFER_BUILD = ConfigDict(defer_build=True)
+_HEALTH_STATUS_ADAPTER: TypeAdapter[HealthStatus] = TypeAdapter(HealthStatus)
+_ADD_RESULT_ADAPTER: TypeAdapter[AddResult] = TypeAdapter(AddResult)
+_ADD_RESULT_LIST_ADAPTER: TypeAdapter[list[AddResult]] = TypeAdapter(list[AddResult], config=_DEFER_BUILD)
+_DELETE_RESULT_ADAPTER: TypeAdapter[DeleteResult] = TypeAdapter(DeleteResult)
+_COGNIFY_RESULT_ADAPTER: TypeAdapter[CognifyResult] = TypeAdapter(CognifyResult)
+# cognify() answers with either a single result or one result per dataset
+_COGNIFY_RESPONSE_ADAPTER: TypeAdapter[CognifyResult | dict[str, CognifyResult]] = TypeAdapter(
+    CognifyResult | dict[str, CognifyResult], config=_DEFER_BUILD
+)
+_DATASET_ADAPTER: TypeAdapter[Dataset] = TypeAdapter(Dataset)
+_DATASET_LIST_ADAPTER: TypeAdapter[list[Dataset]] = TypeAdapter(list[Dataset], config=_DEFER_BUILD)
+_UPDATE_RESULT_ADAPTER: TypeAdapter[UpdateResult] = TypeAdapter(UpdateResult)
+_DATA_ITEM_LIST_ADAPTER: TypeAdapter[list[DataItem]] = TypeAdapter(list[DataItem], config=_DEFER_BUILD)
+_GRAPH_DATA_ADAPTER: TypeAdapter[GraphData] = TypeAdapter(GraphData)
+_USER_ADAPTER: TypeAdapter[User] = TypeAdapter(User)
+_MEMIFY_RESULT_ADAPTER: TypeAdapter[MemifyResult] = TypeAdapter(MemifyResult)
+_SEARCH_RESULT_ADAPTER: TypeAdapter[SearchResult] = TypeAdapter(SearchResult)
+_SEARCH_RESULT_LIST_ADAPTER: TypeAdapter[list[SearchResult]] = TypeAdapter(
+    list[SearchResult], config=_DEFER_BUILD
+)
+_COMBINED_SEARCH_RESULT_ADAPTER: TypeAdapter[CombinedSearchResult] = TypeAdapter(
+    CombinedSearchResult
+)
+_SEARCH_HISTORY_ADAPTER: TypeAdapter[list[SearchHistoryItem]] = TypeAdapter(
+    list[SearchHistoryItem], config=_DEFER_BUILD
+)
+_DATASET_STATUS_ADAPTER: TypeAdapter[dict[UUID, PipelineRunStatus]] = TypeAdapter(
+    dict[UUID, PipelineRunStatus], config=_DEFER_BUILD
+)
+_SYNC_RESULT_ADAPTER: TypeAdapter[SyncResult] = TypeAdapter(SyncResult)
+_SYNC_STATUS_ADAPTER: TypeAdapter[SyncStatus] = TypeAdapter(SyncStatus)
+
+# Files larger than this are streamed from disk instead of read into memory
+_STREAMING_THRESHOLD = 1 * 1024 * 1024
+# Upper bound on the items sent in one POST /api/v1/add/batch request
+_ADD_BATCH_MAX_ITEMS = 100
+# Upper bound on the parsed request URLs kept per client (see _url)
+_URL_CACHE_MAX_SIZE = 256
+
+
+def _guess_mime(name: str) -> str:
+    """
+    Guess the MIME type of a file from its name.
+
+    Args:
+        name: File name or path
+
+    Returns:
+        MIME type string (defaults to "application/octet-stream")
+    """
+    return _MIME_CACHE.get(os.path.splitext(name)[1].lower()) or (
+        mimetypes.guess_type(name)[0] or "application/octet-stream"
+    )
+
 
 class CogneeClient:
     """
@@ -78,6 +213,12 @@ class CogneeClient:
         >>> asyncio.run(main())
     """
 
+    # Connection pools shared by clients created with share_connection_pool=True,
+    # keyed by (max_keepalive_connections, max_connections, http2)
+    _shared_transports: ClassVar[
+        dict[tuple[int | None, int | None, bool], httpx.AsyncHTTPTransport]
+    ] = {}
+
     def __init__(
         self,
         api_url: str,
@@ -94,6 +235,8 @@ class CogneeClient:
         enable_http2: bool = True,
         enable_cache: bool = True,
         cache_ttl: int = 300,
+        share_connection_pool: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """
         Initialize Cognee client.
@@ -115,6 +258,13 @@ class CogneeClient:
             enable_http2: Enable HTTP/2 support (default: True)
             enable_cache: Enable local caching for read operations (default: True)
             cache_ttl: Cache time-to-live in seconds (default: 300)
+            share_connection_pool: Reuse one connection pool across all clients created
+                                 with the same pool settings (default: False). Shared
+                                 pools are released by CogneeClient.shutdown(), not
+                                 by close(); use them within a single event loop
+            transport: Optional httpx transport to send requests through, e.g.
+                     httpx.MockTransport in tests. Takes precedence over
+                     share_connection_pool and is closed by close()
         """
         self.api_url = api_url.rstrip("/")
         self.api_token = api_token
@@ -131,6 +281,21 @@ class CogneeClient:
         self.max_connections = max_connections
         self.enable_http2 = enable_http2
 
+        # Whether the server exposes POST /api/v1/add/batch; None until first probed
+        self._batch_add_supported: bool | None = None
+
+        # Parsed request URLs keyed by endpoint; httpx would otherwise re-parse
+        # the same URL string on every request
+        self._urls: dict[str, httpx.URL] = {}
+
+        # In-flight health check shared by concurrent health_check() callers
+        self._health_check_task: asyncio.Future[HealthStatus] | None = None
+
+        # WebSocket endpoint base never changes per client
+        self._ws_base_url = self.api_url.replace("http://", "ws://").replace(
+            "https://", "wss://"
+        )
+
         # Initialize cache
         if enable_cache:
             self._cache: dict[str, tuple[Any, float]] = {}
@@ -165,14 +330,64 @@ class CogneeClient:
                     )
 
         # Create HTTP client with optimized connection pool and HTTP/2
+        limits = httpx.Limits(
+            max_keepalive_connections=max_keepalive_connections,
+            max_connections=max_connections,
+        )
+        if transport is None and share_connection_pool:
+            transport = self._get_shared_transport(limits, http2_enabled)
+        else:
+            share_connection_pool = False
+        self.share_connection_pool = share_connection_pool
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(timeout, connect=10.0),
-            limits=httpx.Limits(
-                max_keepalive_connections=max_keepalive_connections,
-                max_connections=max_connections,
-            ),
+            limits=limits,
             follow_redirects=True,
             http2=http2_enabled,
+            verify=_default_ssl_context(),
+            transport=transport,
+        )
+
+    @classmethod
+    def _get_shared_transport(cls, limits: httpx.Limits, http2: bool) -> httpx.AsyncHTTPTransport:
+        """
+        Get (or create) the shared connection pool for the given pool settings.
+
+        Args:
+            limits: Connection pool limits
+            http2: Whether HTTP/2 is enabled
+
+        Returns:
+            Transport shared by every client with the same settings
+        """
+        key = (limits.max_keepalive_connections, limits.max_connections, http2)
+        transport = cls._shared_transports.get(key)
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                verify=_default_ssl_context(), limits=limits, http2=http2
+            )
+            cls._shared_transports[key] = transport
+        return transport
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close all shared connection pools (see ``share_connection_pool``)."""
+        transports = list(cls._shared_transports.values())
+        cls._shared_transports.clear()
+        for transport in transports:
+            await transport.aclose()
+
+    @property
+    def api_token(self) -> str | None:
+        """Bearer token used to authenticate requests."""
+        return self._api_token
+
+    @api_token.setter
+    def api_token(self, value: str | None) -> None:
+        self._api_token = value
+        # Rebuilt only on rotation; every request reuses this dict by reference
+        self._auth_headers: dict[str, str] = (
+            {"Authorization": f"Bearer {value}"} if value else {}
         )
 
     def _get_headers(self, content_type: str = "application/json") -> dict[str, str]:
@@ -185,9 +400,7 @@ class CogneeClient:
         Returns:
             Dictionary of headers
         """
-        headers: dict[str, str] = {"Content-Type": content_type}
-        if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
+        headers: dict[str, str] = {"Content-Type": content_type, **self._auth_headers}
         
         # Add compression headers if enabled
         if self.enable_compression:
@@ -224,8 +437,13 @@ class CogneeClient:
         if "json" in kwargs:
             cache_data["json"] = kwargs["json"]
         
-        cache_str = json.dumps(cache_data, sort_keys=True)
-        return hashlib.md5(cache_str.encode()).hexdigest()
+        if orjson is not None:
+            cache_bytes = orjson.dumps(
+                cache_data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            cache_bytes = json.dumps(cache_data, sort_keys=True, default=_json_default).encode()
+        return hashlib.md5(cache_bytes).hexdigest()
     
     def _get_from_cache(self, cache_key: str) -> Any | None:
         """
@@ -311,7 +529,31 @@ class CogneeClient:
         
         return response
 
-    def _parse_json_response(self, response: httpx.Response) -> dict[str, Any] | list[dict[str, Any]]:
+    @staticmethod
+    def _load_json(response: httpx.Response) -> Any:
+        """
+        Decode a response body as JSON, reading the body buffer only once.
+
+        httpx's ``response.json()`` goes through ``response.text`` first, which
+        copies the body into a str before parsing. Decoding ``response.content``
+        directly skips that intermediate copy.
+
+        Args:
+            response: HTTP response object (already read)
+
+        Returns:
+            Decoded JSON data
+
+        Raises:
+            json.JSONDecodeError: If the body is not valid JSON
+        """
+        content = response.content
+        if isinstance(content, bytes) and content:
+            return _json_loads(content)
+        # Empty bodies go through httpx so callers get its usual decode error
+        return response.json()
+
+    def _parse_json_response(self, response: httpx.Response) -> Any:
         """
         Parse JSON response with error handling.
 
@@ -325,7 +567,7 @@ class CogneeClient:
             CogneeAPIError: If JSON parsing fails
         """
         try:
-            return response.json()
+            return self._load_json(response)
         except json.JSONDecodeError as e:
             # Provide more detailed error information
             error_preview = response.text[:200] if response.text else "(empty response)"
@@ -335,6 +577,64 @@ class CogneeClient:
                 None,
             ) from e
 
+    def _validate_response(self, response: httpx.Response, adapter: TypeAdapter[T]) -> T:
+        """
+        Parse and validate a JSON response in a single pydantic-core pass.
+
+        Raw bodies are handed to ``adapter.validate_json`` so no intermediate
+        Python dict tree is built.
+
+        Args:
+            response: HTTP response object
+            adapter: TypeAdapter for the expected response type
+
+        Returns:
+            Validated response data
+
+        Raises:
+            CogneeAPIError: If JSON parsing fails
+            pydantic.ValidationError: If the data does not match the expected type
+        """
+        content = response.content
+        if isinstance(content, bytes) and content:
+            try:
+                return adapter.validate_json(content)
+            except PydanticValidationError as e:
+                if any(error["type"] == "json_invalid" for error in e.errors()):
+                    error_preview = response.text[:200]
+                    raise CogneeAPIError(
+                        f"Invalid JSON response: {str(e)}. Response preview: {error_preview}",
+                        response.status_code,
+                        None,
+                    ) from e
+                raise
+        return adapter.validate_python(self._parse_json_response(response))
+
+    @staticmethod
+    def _try_validate_json(response: httpx.Response, adapter: TypeAdapter[T]) -> T | None:
+        """
+        Validate the raw response body against the expected shape, if it matches.
+
+        Fast path for endpoints whose body usually has one regular shape: the
+        bytes go straight to ``adapter.validate_json``. Irregular shapes and
+        invalid JSON return None so the caller can fall back to its dict-based
+        handling (and its error reporting).
+
+        Args:
+            response: HTTP response object
+            adapter: TypeAdapter for the usual response shape
+
+        Returns:
+            Validated response data, or None if the body does not match
+        """
+        content = response.content
+        if isinstance(content, bytes) and content:
+            try:
+                return adapter.validate_json(content)
+            except PydanticValidationError:
+                pass
+        return None
+
     async def _handle_error_response(self, response: httpx.Response) -> None:
         """
         Handle error responses and raise appropriate exceptions.
@@ -351,7 +651,7 @@ class CogneeClient:
         """
         error_data: dict | None = None
         try:
-            error_data = response.json()
+            error_data = self._load_json(response)
             error_message = (
                 error_data.get("error")
                 or error_data.get("detail")
@@ -380,6 +680,27 @@ class CogneeClient:
         else:
             raise CogneeAPIError(error_message, status_code, error_data)
 
+    def _url(self, endpoint: str) -> httpx.URL:
+        """
+        Return the parsed absolute URL for an API endpoint.
+
+        Fixed endpoints hit the per-client cache; once it holds
+        _URL_CACHE_MAX_SIZE entries (e.g. many per-dataset paths), new
+        endpoints are parsed without being cached.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/api/v1/datasets")
+
+        Returns:
+            Parsed httpx.URL
+        """
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = httpx.URL(f"{self.api_url}{endpoint}")
+            if len(self._urls) < _URL_CACHE_MAX_SIZE:
+                self._urls[endpoint] = url
+        return url
+
     async def _request(
         self,
         method: str,
@@ -407,7 +728,7 @@ class CogneeClient:
             TimeoutError: If request times out after all retries
             CogneeSDKError: If request fails after all retries
         """
-        url = f"{self.api_url}{endpoint}"
+        url = self._url(endpoint)
         headers = kwargs.pop("headers", {})
         
         # Cache is handled in individual methods (list_datasets, search, etc.)
@@ -417,24 +738,21 @@ class CogneeClient:
         # For multipart/form-data requests, don't set Content-Type header
         # Let httpx set it automatically with boundary
         if "files" in kwargs:
-            # Only set Authorization header for multipart requests
-            base_headers = {}
-            if self.api_token:
-                base_headers["Authorization"] = f"Bearer {self.api_token}"
+            # Only set Authorization header for multipart requests (shared, never mutated)
+            base_headers = self._auth_headers
             # Don't compress multipart data
         else:
             base_headers = self._get_headers()
             
-            # Compress JSON data if enabled
-            if self.enable_compression and "json" in kwargs:
-                json_data = kwargs["json"]
-                json_bytes = json.dumps(json_data).encode("utf-8")
+            # Serialize JSON ourselves so payloads may carry UUIDs directly
+            if "json" in kwargs:
+                json_bytes = _json_dumps(kwargs.pop("json"))
+                # Compress JSON data if enabled
                 compressed_data, was_compressed = self._compress_data(json_bytes)
                 if was_compressed:
-                    kwargs["content"] = compressed_data
-                    kwargs.pop("json")
+                    json_bytes = compressed_data
                     base_headers["Content-Encoding"] = "gzip"
-                    base_headers["Content-Type"] = "application/json"
+                kwargs["content"] = json_bytes
 
         # Merge headers, custom headers take precedence
         merged_headers = {**base_headers, **headers}
@@ -442,7 +760,7 @@ class CogneeClient:
         # Call request interceptor if provided
         if self.request_interceptor:
             try:
-                self.request_interceptor(method, url, merged_headers)
+                self.request_interceptor(method, str(url), merged_headers)
             except Exception as e:
                 # Don't fail the request if interceptor fails
                 if self.logger:
@@ -562,22 +880,54 @@ class CogneeClient:
         """
         Check API server health.
 
+        Concurrent calls share a single in-flight request: callers that arrive
+        while a health check is pending await its result instead of sending
+        another GET /health. Cancelling one caller does not cancel the shared
+        request for the others.
+
         Returns:
             Health status information
 
         Raises:
             CogneeAPIError: If health check fails
         """
+        task = self._health_check_task
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_health_status())
+            self._health_check_task = task
+            task.add_done_callback(self._clear_health_check_task)
+        return await asyncio.shield(task)
+
+    def _clear_health_check_task(self, task: "asyncio.Future[HealthStatus]") -> None:
+        """Forget a finished health check so the next call sends a fresh request."""
+        if self._health_check_task is task:
+            self._health_check_task = None
+        if not task.cancelled():
+            # Mark the exception retrieved in case every caller was cancelled
+            task.exception()
+
+    async def _fetch_health_status(self) -> HealthStatus:
+        """Send GET /health and parse the response."""
         response = await self._request("GET", "/health")
+        status = self._try_validate_json(response, _HEALTH_STATUS_ADAPTER)
+        if status is not None:
+            return status
         data = self._parse_json_response(response)
         if isinstance(data, dict):
-            return HealthStatus(**data)
+            return _HEALTH_STATUS_ADAPTER.validate_python(data)
         raise CogneeAPIError("Invalid health check response format", response.status_code, data)
 
     async def close(self) -> None:
         """Close HTTP client and release resources."""
+        if self.share_connection_pool:
+            # AsyncClient.aclose() would close the transport other clients still use
+            return
         await self.client.aclose()
 
+    async def aclose(self) -> None:
+        """Alias of close(), matching the httpx.AsyncClient naming."""
+        await self.close()
+
     async def __aenter__(self) -> "CogneeClient":
         """Async context manager entry."""
         return self
@@ -642,8 +992,6 @@ class CogneeClient:
         """
         # Maximum recommended file size (50MB) - files larger than this will use streaming
         MAX_RECOMMENDED_FILE_SIZE = 50 * 1024 * 1024
-        # Threshold for streaming upload (1MB) - files larger than this will stream (optimized from 10MB)
-        STREAMING_THRESHOLD = 1 * 1024 * 1024
 
         if isinstance(data, str):
             # Check if it's a file path
@@ -661,17 +1009,17 @@ class CogneeClient:
                             stacklevel=2
                         )
                     
-                    mime_type, _ = mimetypes.guess_type(str(file_path))
+                    mime_type = _guess_mime(str(file_path))
                     
                     # Use streaming for large files
-                    if use_streaming and file_size > STREAMING_THRESHOLD:
+                    if use_streaming and file_size > _STREAMING_THRESHOLD:
                         try:
                             # Return file object for streaming upload
                             file_obj = open(file_path, "rb")
                             return (
                                 "data",
                                 file_obj,  # File object for streaming
-                                mime_type or "application/octet-stream",
+                                mime_type,
                             )
                         except OSError as e:
                             raise CogneeSDKError(
@@ -685,7 +1033,7 @@ class CogneeClient:
                             return (
                                 "data",
                                 file_content,
-                                mime_type or "application/octet-stream",
+                                mime_type,
                             )
                         except OSError as e:
                             raise CogneeSDKError(
@@ -716,17 +1064,17 @@ class CogneeClient:
                         stacklevel=2
                     )
             
-            mime_type, _ = mimetypes.guess_type(str(data))
+            mime_type = _guess_mime(str(data))
             
             # Use streaming for large files
-            if use_streaming and file_size > STREAMING_THRESHOLD:
+            if use_streaming and file_size > _STREAMING_THRESHOLD:
                 try:
                     # Return file object for streaming upload
                     file_obj = open(data, "rb")
                     return (
                         "data",
                         file_obj,  # File object for streaming
-                        mime_type or "application/octet-stream",
+                        mime_type,
                     )
                 except OSError as e:
                     raise CogneeSDKError(f"Failed to open file {data} for streaming: {str(e)}") from e
@@ -738,7 +1086,7 @@ class CogneeClient:
                     return (
                         "data",
                         file_content,
-                        mime_type or "application/octet-stream",
+                        mime_type,
                     )
                 except OSError as e:
                     raise CogneeSDKError(f"Failed to read file {data}: {str(e)}") from e
@@ -767,19 +1115,19 @@ class CogneeClient:
                     pass
             
             # Use streaming for large file objects if size is known and exceeds threshold
-            if use_streaming and file_size > STREAMING_THRESHOLD and hasattr(data, "seek"):
+            if use_streaming and file_size > _STREAMING_THRESHOLD and hasattr(data, "seek"):
                 # Reset position to start for streaming
                 try:
                     data.seek(0)
                 except (OSError, AttributeError):
                     pass
                 
-                mime_type, _ = mimetypes.guess_type(file_name)
+                mime_type = _guess_mime(file_name)
                 # Return file object as-is for streaming (httpx will handle it)
                 return (
                     "data",
                     data,  # File object for streaming
-                    mime_type or "application/octet-stream",
+                    mime_type,
                 )
             else:
                 # Read entire content for small files or when streaming is disabled
@@ -793,11 +1141,11 @@ class CogneeClient:
                         except (OSError, AttributeError):
                             pass  # Ignore if seek fails
                     
-                    mime_type, _ = mimetypes.guess_type(file_name)
+                    mime_type = _guess_mime(file_name)
                     return (
                         "data",
                         content,
-                        mime_type or "application/octet-stream",
+                        mime_type,
                     )
                 except Exception as e:
                     raise CogneeSDKError(
@@ -829,7 +1177,8 @@ class CogneeClient:
                 - File path (Path object or string)
                 - File object (BinaryIO)
                 - List of any of the above
-            dataset_name: Name of the dataset to add data to
+            dataset_name: Name of the dataset to add data to; the server creates
+                the dataset if it does not exist yet
             dataset_id: UUID of an existing dataset (alternative to dataset_name)
             node_set: Optional list of node identifiers for graph organization
 
@@ -866,6 +1215,32 @@ class CogneeClient:
         else:
             data_list = data
 
+        response = await self._upload_files(
+            "/api/v1/add", data_list, dataset_name, dataset_id, node_set
+        )
+        return self._validate_response(response, _ADD_RESULT_ADAPTER)
+
+    async def _upload_files(
+        self,
+        endpoint: str,
+        data_list: Sequence[str | bytes | Path | BinaryIO],
+        dataset_name: str | None,
+        dataset_id: UUID | None,
+        node_set: list[str] | None,
+    ) -> httpx.Response:
+        """
+        POST data items as a multipart/form-data upload.
+
+        Args:
+            endpoint: API endpoint path
+            data_list: Data items to upload, one file part each
+            dataset_name: Name of the dataset
+            dataset_id: UUID of the dataset
+            node_set: Optional list of node identifiers
+
+        Returns:
+            HTTP response object
+        """
         # Prepare form data
         form_data: dict[str, Any] = {}
         if dataset_name:
@@ -873,7 +1248,7 @@ class CogneeClient:
         if dataset_id:
             form_data["datasetId"] = str(dataset_id)
         if node_set:
-            form_data["node_set"] = json.dumps(node_set)
+            form_data["node_set"] = _json_dumps(node_set).decode()
 
         # Prepare files for multipart/form-data using unified method
         files: list[tuple] = []
@@ -897,16 +1272,13 @@ class CogneeClient:
                     files.append((field_name, (file_name, content_or_file, mime_type)))
             
             # Send request (don't set Content-Type for multipart/form-data)
-            response = await self._request(
+            return await self._request(
                 "POST",
-                "/api/v1/add",
+                endpoint,
                 files=files,
                 data=form_data,
                 headers={},  # Let httpx set Content-Type for multipart
             )
-            
-            result_data = response.json()
-            return AddResult(**result_data)
         finally:
             # Close any files we opened for streaming
             for file_obj in opened_files:
@@ -943,8 +1315,27 @@ class CogneeClient:
         }
 
         response = await self._request("DELETE", "/api/v1/delete", params=params)
-        result_data = response.json()
-        return DeleteResult(**result_data)
+        return self._validate_response(response, _DELETE_RESULT_ADAPTER)
+
+    @staticmethod
+    def _validate_datasets(
+        datasets: list[str] | None, dataset_ids: list[UUID] | None
+    ) -> None:
+        """
+        Check that at least one dataset name or ID was given.
+
+        Args:
+            datasets: Dataset names
+            dataset_ids: Dataset IDs
+
+        Raises:
+            ValidationError: If neither datasets nor dataset_ids provided
+        """
+        if (not datasets) and (not dataset_ids):
+            raise ValidationError(
+                "Either datasets or dataset_ids must be provided",
+                400,
+            )
 
     async def cognify(
         self,
@@ -975,43 +1366,49 @@ class CogneeClient:
             ...     run_in_background=False
             ... )
         """
-        if (not datasets) and (not dataset_ids):
-            raise ValidationError(
-                "Either datasets or dataset_ids must be provided",
-                400,
-            )
+        self._validate_datasets(datasets, dataset_ids)
 
+        # Optional fields are only sent when set, built in a single dict literal
+        optional = (
+            ("datasets", datasets),
+            ("dataset_ids", dataset_ids),
+            ("custom_prompt", custom_prompt),
+        )
         payload: dict[str, Any] = {
             "run_in_background": run_in_background,
+            **{key: value for key, value in optional if value},
         }
-        if datasets:
-            payload["datasets"] = datasets
-        if dataset_ids:
-            payload["dataset_ids"] = [str(did) for did in dataset_ids]
-        if custom_prompt:
-            payload["custom_prompt"] = custom_prompt
 
         response = await self._request("POST", "/api/v1/cognify", json=payload)
 
-        result_data = response.json()
+        # Fast path: decode the raw body straight into models in one pydantic-core pass
+        parsed = self._try_validate_json(response, _COGNIFY_RESPONSE_ADAPTER)
+        if parsed is not None:
+            if isinstance(parsed, CognifyResult):
+                return {"default": parsed}
+            return parsed
+
+        result_data = self._parse_json_response(response)
         # Handle dictionary of results (one per dataset)
         if isinstance(result_data, dict):
             # Check if it's already a dict with dataset keys or a single result
             if "pipeline_run_id" in result_data or "status" in result_data:
                 # Single result, wrap in "default" key
-                return {"default": CognifyResult(**result_data)}
+                return {"default": _COGNIFY_RESULT_ADAPTER.validate_python(result_data)}
             else:
                 # Dictionary of results (one per dataset)
                 return {
-                    key: CognifyResult(**value) if isinstance(value, dict) else value
+                    key: _COGNIFY_RESULT_ADAPTER.validate_python(value)
+                    if isinstance(value, dict)
+                    else value
                     for key, value in result_data.items()
                 }
-        return {"default": CognifyResult(**result_data)}
+        return {"default": _COGNIFY_RESULT_ADAPTER.validate_python(result_data)}
 
     async def search(
         self,
         query: str,
-        search_type: SearchType = SearchType.GRAPH_COMPLETION,
+        search_type: SearchType | SearchTypeValue = SearchType.GRAPH_COMPLETION,
         datasets: list[str] | None = None,
         dataset_ids: list[UUID] | None = None,
         system_prompt: str | None = None,
@@ -1026,7 +1423,8 @@ class CogneeClient:
 
         Args:
             query: Search query string
-            search_type: Type of search to perform
+            search_type: Type of search to perform, as a SearchType member or its
+                        string value (e.g. "GRAPH_COMPLETION")
             datasets: List of dataset names to search within
             dataset_ids: List of dataset UUIDs to search within
             system_prompt: System prompt for completion searches
@@ -1043,7 +1441,7 @@ class CogneeClient:
             - If return_type="raw": List[dict[str, Any]]
 
         Raises:
-            ValidationError: If query is empty
+            ValidationError: If query is empty or search_type is unknown
             ServerError: If search fails
 
         Example:
@@ -1055,22 +1453,24 @@ class CogneeClient:
         """
         if not query:
             raise ValidationError("Query cannot be empty", 400)
-
+        search_type_value = _SEARCH_TYPE_VALUES.get(search_type)
+        if search_type_value is None:
+            raise ValidationError(f"Unknown search type: {search_type!r}", 400)
+
+        optional = (
+            ("datasets", datasets),
+            ("dataset_ids", dataset_ids),
+            ("system_prompt", system_prompt),
+            ("node_name", node_name),
+        )
         payload: dict[str, Any] = {
             "query": query,
-            "search_type": search_type.value,
+            "search_type": search_type_value,
             "top_k": top_k,
             "only_context": only_context,
             "use_combined_context": use_combined_context,
+            **{key: value for key, value in optional if value},
         }
-        if datasets:
-            payload["datasets"] = datasets
-        if dataset_ids:
-            payload["dataset_ids"] = [str(did) for did in dataset_ids]
-        if system_prompt:
-            payload["system_prompt"] = system_prompt
-        if node_name:
-            payload["node_name"] = node_name
 
         # Check cache for search queries
         cache_key = self._get_cache_key("POST", "/api/v1/search", json=payload) if self.enable_cache else ""
@@ -1099,13 +1499,17 @@ class CogneeClient:
 
         # Handle parsed return type (default)
         if isinstance(result_data, dict) and "result" in result_data:
-            result: CombinedSearchResult = CombinedSearchResult(**result_data)
-            return result
+            return _COMBINED_SEARCH_RESULT_ADAPTER.validate_python(result_data)
         elif isinstance(result_data, list):
             # Try to parse as SearchResult objects
             try:
+                if all(isinstance(item, dict) for item in result_data):
+                    # Validate the whole list in one pydantic-core call
+                    return _SEARCH_RESULT_LIST_ADAPTER.validate_python(result_data)
+                # Mixed lists (e.g. plain completion strings) keep non-dict items as-is
                 parsed_results: list[SearchResult] = [
-                    SearchResult(**item) if isinstance(item, dict) else item for item in result_data
+                    _SEARCH_RESULT_ADAPTER.validate_python(item) if isinstance(item, dict) else item
+                    for item in result_data
                 ]
                 return parsed_results
             except Exception:
@@ -1132,18 +1536,22 @@ class CogneeClient:
         cache_key = self._get_cache_key("GET", "/api/v1/datasets") if self.enable_cache else ""
         if cache_key:
             cached_data = self._get_from_cache(cache_key)
+            if isinstance(cached_data, bytes):
+                return _DATASET_LIST_ADAPTER.validate_json(cached_data)
             if cached_data is not None:
-                result_data = cached_data
+                return _DATASET_LIST_ADAPTER.validate_python(cached_data)
+
+        response = await self._request("GET", "/api/v1/datasets")
+        datasets = self._validate_response(response, _DATASET_LIST_ADAPTER)
+        if cache_key:
+            # Cache the raw body: a single bytes object instead of a tree of
+            # dicts, re-validated straight from JSON on the next hit
+            content = response.content
+            if isinstance(content, bytes) and content:
+                self._set_cache(cache_key, content)
             else:
-                response = await self._request("GET", "/api/v1/datasets")
-                result_data = self._parse_json_response(response)
-                # Cache the result
-                if cache_key:
-                    self._set_cache(cache_key, result_data)
-        else:
-            response = await self._request("GET", "/api/v1/datasets")
-            result_data = self._parse_json_response(response)
-        return [Dataset(**item) for item in result_data]
+                self._set_cache(cache_key, self._parse_json_response(response))
+        return datasets
 
     async def create_dataset(self, name: str) -> Dataset:
         """
@@ -1168,8 +1576,7 @@ class CogneeClient:
 
         payload = {"name": name}
         response = await self._request("POST", "/api/v1/datasets", json=payload)
-        result_data = response.json()
-        return Dataset(**result_data)
+        return self._validate_response(response, _DATASET_ADAPTER)
 
     # ==================== Dataset Management API (P1) ====================
 
@@ -1216,7 +1623,7 @@ class CogneeClient:
 
             form_data: dict[str, Any] = {}
             if node_set:
-                form_data["node_set"] = json.dumps(node_set)
+                form_data["node_set"] = _json_dumps(node_set).decode()
 
             params = {
                 "data_id": str(data_id),
@@ -1232,10 +1639,13 @@ class CogneeClient:
                 headers={},
             )
 
-            result_data = response.json()
+            update_result = self._try_validate_json(response, _UPDATE_RESULT_ADAPTER)
+            if update_result is not None:
+                return update_result
+            result_data = self._parse_json_response(response)
             # Handle dictionary of results (one per dataset)
             if isinstance(result_data, dict):
-                return UpdateResult(**result_data)
+                return _UPDATE_RESULT_ADAPTER.validate_python(result_data)
             return UpdateResult(status="success", message="Update completed", data_id=None)
         finally:
             # Close file if we opened it for streaming
@@ -1258,6 +1668,50 @@ class CogneeClient:
         """
         await self._request("DELETE", f"/api/v1/datasets/{dataset_id}")
 
+    async def delete_datasets(
+        self,
+        dataset_ids: Sequence[UUID],
+        *,
+        concurrency: int | None = None,
+    ) -> list[Exception | None]:
+        """
+        Delete multiple datasets concurrently, one request per dataset.
+
+        Failures do not cancel the remaining deletions; each one is reported
+        in the returned list instead of being raised.
+
+        Args:
+            dataset_ids: UUIDs of the datasets to delete
+            concurrency: Maximum number of in-flight requests. Defaults to
+                        max_keepalive_connections, capped at max_connections.
+
+        Returns:
+            List in the same order as dataset_ids holding None for each deleted
+            dataset and the raised exception for each failed one
+
+        Raises:
+            ValidationError: If concurrency is less than 1
+
+        Example:
+            >>> errors = await client.delete_datasets([d.id for d in datasets])
+            >>> failed = [i for i, e in zip(dataset_ids, errors) if e is not None]
+        """
+        if concurrency is None:
+            concurrency = self.max_keepalive_connections
+        elif concurrency < 1:
+            raise ValidationError("concurrency must be at least 1", 400)
+
+        semaphore = asyncio.Semaphore(min(concurrency, self.max_connections))
+
+        async def delete_one(dataset_id: UUID) -> None:
+            async with semaphore:
+                await self.delete_dataset(dataset_id)
+
+        results = await asyncio.gather(
+            *(delete_one(dataset_id) for dataset_id in dataset_ids), return_exceptions=True
+        )
+        return [result if isinstance(result, Exception) else None for result in results]
+
     async def get_dataset_data(self, dataset_id: UUID) -> list[DataItem]:
         """
         Get all data items in a dataset.
@@ -1271,11 +1725,8 @@ class CogneeClient:
         Raises:
             NotFoundError: If dataset not found
         """
-        from cognee_sdk.models import DataItem
-
         response = await self._request("GET", f"/api/v1/datasets/{dataset_id}/data")
-        result_data = response.json()
-        return [DataItem(**item) for item in result_data]
+        return self._validate_response(response, _DATA_ITEM_LIST_ADAPTER)
 
     async def get_dataset_graph(self, dataset_id: UUID) -> GraphData:
         """
@@ -1291,8 +1742,27 @@ class CogneeClient:
             NotFoundError: If dataset not found
         """
         response = await self._request("GET", f"/api/v1/datasets/{dataset_id}/graph")
-        result_data = response.json()
-        return GraphData(**result_data)
+        return self._validate_response(response, _GRAPH_DATA_ADAPTER)
+
+    async def get_dataset_graph_raw(self, dataset_id: UUID) -> GraphDataRaw:
+        """
+        Get the knowledge graph data for a dataset in columnar form.
+
+        Skips building a GraphNode/GraphEdge model per element, which keeps
+        large graphs cheap to fetch. Rows can still be materialized lazily
+        with GraphDataRaw.nodes() and GraphDataRaw.edges().
+
+        Args:
+            dataset_id: UUID of the dataset
+
+        Returns:
+            GraphDataRaw with parallel node and edge columns
+
+        Raises:
+            NotFoundError: If dataset not found
+        """
+        response = await self._request("GET", f"/api/v1/datasets/{dataset_id}/graph")
+        return GraphDataRaw.from_json_data(self._parse_json_response(response))
 
     async def get_dataset_status(self, dataset_ids: list[UUID]) -> dict[UUID, PipelineRunStatus]:
         """
@@ -1312,11 +1782,17 @@ class CogneeClient:
 
         params = {"dataset": [str(did) for did in dataset_ids]}
         response = await self._request("GET", "/api/v1/datasets/status", params=params)
-        result_data = response.json()
+        # UUID keys and status values are parsed by pydantic-core from the raw body
+        statuses = self._try_validate_json(response, _DATASET_STATUS_ADAPTER)
+        if statuses is not None:
+            return statuses
+        result_data = self._parse_json_response(response)
 
         # Convert string keys to UUID and status strings to enum
         return {
-            UUID(key): PipelineRunStatus(value) if isinstance(value, str) else value
+            UUID(key): (_PIPELINE_RUN_STATUSES.get(value) or PipelineRunStatus(value))
+            if isinstance(value, str)
+            else value
             for key, value in result_data.items()
         }
 
@@ -1361,7 +1837,7 @@ class CogneeClient:
         response = await self._request("POST", "/api/v1/auth/login", json=payload)
 
         # Extract token from response (format may vary)
-        result_data = response.json()
+        result_data = self._parse_json_response(response)
         token: str | None = result_data.get("access_token") or result_data.get("token")
         if token:
             self.api_token = token
@@ -1388,8 +1864,7 @@ class CogneeClient:
 
         payload = {"email": email, "password": password}
         response = await self._request("POST", "/api/v1/auth/register", json=payload)
-        result_data = response.json()
-        return User(**result_data)
+        return self._validate_response(response, _USER_ADAPTER)
 
     async def get_current_user(self) -> User:
         """
@@ -1402,8 +1877,7 @@ class CogneeClient:
             AuthenticationError: If not authenticated
         """
         response = await self._request("GET", "/api/v1/auth/me")
-        result_data = response.json()
-        return User(**result_data)
+        return self._validate_response(response, _USER_ADAPTER)
 
     # ==================== Memify API (P1) ====================
 
@@ -1441,25 +1915,21 @@ class CogneeClient:
                 400,
             )
 
+        optional = (
+            ("dataset_name", dataset_name),
+            ("dataset_id", dataset_id),
+            ("extraction_tasks", extraction_tasks),
+            ("enrichment_tasks", enrichment_tasks),
+            ("data", data),
+            ("node_name", node_name),
+        )
         payload: dict[str, Any] = {
             "run_in_background": run_in_background,
+            **{key: value for key, value in optional if value},
         }
-        if dataset_name:
-            payload["dataset_name"] = dataset_name
-        if dataset_id:
-            payload["dataset_id"] = str(dataset_id)
-        if extraction_tasks:
-            payload["extraction_tasks"] = extraction_tasks
-        if enrichment_tasks:
-            payload["enrichment_tasks"] = enrichment_tasks
-        if data:
-            payload["data"] = data
-        if node_name:
-            payload["node_name"] = node_name
 
         response = await self._request("POST", "/api/v1/memify", json=payload)
-        result_data = response.json()
-        return MemifyResult(**result_data)
+        return self._validate_response(response, _MEMIFY_RESULT_ADAPTER)
 
     async def get_search_history(self) -> list[SearchHistoryItem]:
         """
@@ -1472,8 +1942,7 @@ class CogneeClient:
             AuthenticationError: If not authenticated
         """
         response = await self._request("GET", "/api/v1/search")
-        result_data = response.json()
-        return [SearchHistoryItem(**item) for item in result_data]
+        return self._validate_response(response, _SEARCH_HISTORY_ADAPTER)
 
     # ==================== Visualization API (P2) ====================
 
@@ -1510,21 +1979,18 @@ class CogneeClient:
         Raises:
             ServerError: If sync fails
         """
-        payload: dict[str, Any] = {}
-        if dataset_ids:
-            payload["dataset_ids"] = [str(did) for did in dataset_ids]
+        payload: dict[str, Any] = {"dataset_ids": dataset_ids} if dataset_ids else {}
 
         response = await self._request("POST", "/api/v1/sync", json=payload)
-        result_data = response.json()
+        sync_result = self._try_validate_json(response, _SYNC_RESULT_ADAPTER)
+        if sync_result is not None:
+            return sync_result
+        result_data = self._parse_json_response(response)
 
-        # Handle dictionary of results
-        if isinstance(result_data, dict) and "run_id" in result_data:
-            return SyncResult(**result_data)
-        # If multiple results, return the first one
-        elif isinstance(result_data, dict):
-            first_key = next(iter(result_data))
-            return SyncResult(**result_data[first_key])
-        return SyncResult(**result_data)
+        # A dict without run_id maps keys to results; return the first one
+        if isinstance(result_data, dict) and "run_id" not in result_data:
+            result_data = next(iter(result_data.values()))
+        return _SYNC_RESULT_ADAPTER.validate_python(result_data)
 
     async def get_sync_status(self) -> SyncStatus:
         """
@@ -1534,19 +2000,24 @@ class CogneeClient:
             SyncStatus with information about running syncs
         """
         response = await self._request("GET", "/api/v1/sync/status")
-        result_data = response.json()
-        return SyncStatus(**result_data)
+        return self._validate_response(response, _SYNC_STATUS_ADAPTER)
 
     # ==================== WebSocket Support (P2) ====================
 
     async def subscribe_cognify_progress(
-        self, pipeline_run_id: UUID
+        self, pipeline_run_id: UUID, buffer_size: int = 64
     ) -> "AsyncIterator[dict[str, Any]]":
         """
         Subscribe to Cognify processing progress via WebSocket.
 
+        Frames are read by a background task into a bounded queue. When the
+        consumer falls behind and the queue fills up, reading pauses, so
+        backpressure propagates to the server instead of buffering without limit.
+
         Args:
             pipeline_run_id: UUID of the pipeline run to monitor
+            buffer_size: Maximum number of decoded updates buffered ahead of
+                        the consumer (default: 64)
 
         Yields:
             Progress updates as dictionaries with status and payload
@@ -1562,41 +2033,57 @@ class CogneeClient:
             ...     if update['status'] == 'completed':
             ...         break
         """
-        try:
-            import websockets
-        except ImportError as err:
+        websockets = _websockets
+        if websockets is None:
             raise ImportError(
                 "websockets package is required for WebSocket support. "
                 "Install it with: pip install cognee-sdk[websocket]"
-            ) from err
+            ) from _websockets_import_error
 
-        # Convert HTTP URL to WebSocket URL
-        ws_url = self.api_url.replace("http://", "ws://").replace("https://", "wss://")
-        endpoint = f"/api/v1/cognify/subscribe/{pipeline_run_id}"
+        closed = object()  # Sentinel marking a cleanly closed connection
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=buffer_size)
 
-        # Prepare headers
-        headers: dict[str, str] = {}
-        if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
+        # From websockets 14, websockets.connect is the new asyncio client: it
+        # takes additional_headers instead of the legacy extra_headers, and its
+        # recv() can hand text frames over as raw bytes, skipping the UTF-8
+        # decode to str that the JSON parser would redo anyway
+        new_client = "additional_headers" in inspect.signature(websockets.connect).parameters
+        headers_kwarg = "additional_headers" if new_client else "extra_headers"
+        recv_kwargs: dict[str, Any] = {"decode": False} if new_client else {}
 
         # Connect to WebSocket
         async with websockets.connect(
-            f"{ws_url}{endpoint}",
-            extra_headers=headers,
+            f"{self._ws_base_url}/api/v1/cognify/subscribe/{pipeline_run_id}",
+            **{headers_kwarg: self._auth_headers},
         ) as websocket:
-            while True:
+
+            async def reader() -> None:
                 try:
-                    message = await websocket.recv()
-                    data = json.loads(message)
+                    while True:
+                        message = await websocket.recv(**recv_kwargs)
+                        # Blocks while the consumer lags, which stops recv()
+                        await queue.put(_json_loads(message))
+                except websockets.exceptions.ConnectionClosed:
+                    await queue.put(closed)
+                except Exception as e:
+                    await queue.put(e)
+
+            reader_task = asyncio.ensure_future(reader())
+            try:
+                while True:
+                    data = await queue.get()
+                    if data is closed:
+                        break
+                    if isinstance(data, Exception):
+                        raise ServerError(f"WebSocket error: {str(data)}", 500) from data
                     yield data
 
                     # Exit when processing is completed
                     if data.get("status") in ("completed", "PipelineRunCompleted"):
                         break
-                except websockets.exceptions.ConnectionClosed:
-                    break
-                except Exception as e:
-                    raise ServerError(f"WebSocket error: {str(e)}", 500) from e
+            finally:
+                reader_task.cancel()
+                await asyncio.gather(reader_task, return_exceptions=True)
 
     # ==================== Advanced Features (P2) ====================
 
@@ -1610,7 +2097,8 @@ class CogneeClient:
         continue_on_error: bool = False,
         return_errors: bool = False,
         adaptive_concurrency: bool = True,
-    ) -> list[AddResult] | tuple[list[AddResult], list[Exception]]:
+        use_batch_endpoint: bool = False,
+    ) -> list[AddResult] | tuple[list[AddResult | None], list[Exception]]:
         """
         Add multiple data items in batch with concurrent control and error handling.
 
@@ -1620,19 +2108,27 @@ class CogneeClient:
             dataset_id: UUID of the dataset
             node_set: Optional list of node identifiers
             max_concurrent: Maximum number of concurrent operations. If None and adaptive_concurrency=True,
-                          will be automatically determined based on data size (default: None)
+                          will be automatically determined based on data size. Never exceeds
+                          max_connections (default: None)
             continue_on_error: If True, continue processing even if some items fail (default: False)
             return_errors: If True, return tuple of (results, errors) instead of just results (default: False)
             adaptive_concurrency: If True, automatically adjust concurrency based on data size (default: True)
+            use_batch_endpoint: If True, upload items through POST /api/v1/add/batch in requests
+                              of up to 100 items. Falls back to per-item add() calls if the server
+                              lacks the endpoint; the outcome of the probe is remembered for this
+                              client (default: False)
 
         Returns:
             If return_errors=False: List of AddResult objects
-            If return_errors=True: Tuple of (list of AddResult objects, list of Exception objects)
+            If return_errors=True: Tuple of (list of AddResult objects, list of Exception objects).
+            With continue_on_error=True the results list keeps one slot per input item, so it
+            is typed list[AddResult | None]
             
             When continue_on_error=True, failed items will have None in results list and error in errors list.
+            When continue_on_error=False, items not yet started when the first error occurs are skipped.
 
         Raises:
-            ValidationError: If data_list is empty
+            ValidationError: If data_list is empty or max_concurrent is less than 1
             ServerError: If any operation fails and continue_on_error=False (first error encountered)
 
         Example:
@@ -1651,17 +2147,29 @@ class CogneeClient:
             ...     return_errors=True
             ... )
         """
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValidationError("max_concurrent must be at least 1", 400)
+
         if not data_list:
             if return_errors:
                 return [], []
             return []
 
+        # Results the batch endpoint stored for the leading items; whatever it
+        # did not store continues on the per-item path below
+        stored: list[AddResult] = []
+        if use_batch_endpoint and self._batch_add_supported is not False:
+            stored = await self._add_batch_request(data_list, dataset_name, dataset_id, node_set)
+            if len(stored) == len(data_list):
+                return ([*stored], []) if return_errors else stored
+        remaining = data_list[len(stored) :]
+
         # Adaptive concurrency: adjust based on data size
         if adaptive_concurrency and max_concurrent is None:
             # Estimate average data size
             total_size = 0
-            sample_count = min(10, len(data_list))  # Sample first 10 items
-            for item in data_list[:sample_count]:
+            sample_count = min(10, len(remaining))  # Sample first 10 items
+            for item in remaining[:sample_count]:
                 if isinstance(item, (str, bytes)):
                     total_size += len(item) if isinstance(item, bytes) else len(item.encode())
                 elif isinstance(item, Path) and item.exists():
@@ -1680,15 +2188,23 @@ class CogneeClient:
         # Default concurrency if not set
         if max_concurrent is None:
             max_concurrent = 10
-
-        # Use semaphore to control concurrent operations
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def add_with_semaphore(
-            item: str | bytes | Path | BinaryIO,
-        ) -> tuple[int, AddResult | None, Exception | None]:
-            """Add a single item with semaphore control and error handling."""
-            async with semaphore:
+        # Workers beyond the connection pool size would only queue for a connection
+        max_concurrent = min(max_concurrent, self.max_connections)
+
+        # Run a fixed pool of workers that pull items from a shared iterator, so
+        # at most max_concurrent coroutines exist at once regardless of batch size.
+        outcomes: list[tuple[AddResult | None, Exception | None]] = [
+            (result, None) for result in stored
+        ] + [(None, None)] * len(remaining)
+        pending = iter(enumerate(remaining, start=len(stored)))
+        failed = False
+
+        async def worker() -> None:
+            """Add items one at a time until the batch is drained (or stopped on error)."""
+            nonlocal failed
+            for index, item in pending:
+                if failed and not continue_on_error:
+                    return
                 try:
                     result = await self.add(
                         data=item,
@@ -1696,51 +2212,281 @@ class CogneeClient:
                         dataset_id=dataset_id,
                         node_set=node_set,
                     )
-                    return (0, result, None)  # (index_offset, result, error)
+                    outcomes[index] = (result, None)
                 except Exception as e:
-                    return (0, None, e)
+                    outcomes[index] = (None, e)
+                    failed = True
+
+        await asyncio.gather(*(worker() for _ in range(min(max_concurrent, len(remaining)))))
+
+        errors = [error for _, error in outcomes if error is not None]
 
-        # Create tasks with index tracking
-        tasks = [add_with_semaphore(item) for item in data_list]
-        
         if continue_on_error:
-            # Continue processing even if some fail
-            results_list: list[AddResult | None] = []
-            errors_list: list[Exception] = []
-            
-            task_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for task_result in task_results:
-                if isinstance(task_result, Exception):
-                    # Task itself failed (shouldn't happen, but handle it)
-                    results_list.append(None)
-                    errors_list.append(task_result)
-                else:
-                    _, result, error = task_result
-                    results_list.append(result)
-                    if error is not None:
-                        errors_list.append(error)
-            
-            # Filter out None results if return_errors is False
-            if return_errors:
-                return results_list, errors_list
-            else:
-                # Return only successful results
-                return [r for r in results_list if r is not None]
-        else:
-            # Stop on first error (default behavior)
-            task_results = await asyncio.gather(*tasks)
-            
-            # Check for errors and raise the first one encountered
-            for _, result, error in task_results:
-                if error is not None:
-                    raise error
-            
-            # All succeeded, collect results
-            results = [result for _, result, _ in task_results if result is not None]
-            
             if return_errors:
-                errors = [err for _, _, err in task_results if err is not None]
-                return results, errors
-            else:
-                return results
+                return [result for result, _ in outcomes], errors
+            # Return only successful results
+            return [result for result, _ in outcomes if result is not None]
+
+        # Stop on first error (default behavior): items not yet started are
+        # skipped, and the first error in input order is raised
+        if errors:
+            raise errors[0]
+
+        if return_errors:
+            return [result for result, _ in outcomes], errors
+        return [result for result, _ in outcomes if result is not None]
+
+    async def _add_batch_request(
+        self,
+        data_list: list[str | bytes | Path | BinaryIO],
+        dataset_name: str | None,
+        dataset_id: UUID | None,
+        node_set: list[str] | None,
+    ) -> list[AddResult]:
+        """
+        Upload a whole batch via POST /api/v1/add/batch.
+
+        Items are sent in requests of up to _ADD_BATCH_MAX_ITEMS each. Batches
+        containing files above the streaming threshold are left to the per-item
+        path, so one large upload does not hold up (or retry) the small ones.
+        Uploading stops at the first failed request; the chunks already stored
+        are kept, so the caller only re-sends the items after them.
+
+        Args:
+            data_list: Data items to add
+            dataset_name: Name of the dataset
+            dataset_id: UUID of the dataset
+            node_set: Optional list of node identifiers
+
+        Returns:
+            AddResults for the leading items the server stored, in input order.
+            Empty if the whole batch should be uploaded per item (endpoint
+            missing, large files, or the first request failed)
+        """
+        if not dataset_name and not dataset_id:
+            return []  # Let the per-item path report the validation error
+        if any(self._is_streamed_file(item) for item in data_list):
+            return []  # Large files upload individually
+
+        results: list[AddResult] = []
+        for start in range(0, len(data_list), _ADD_BATCH_MAX_ITEMS):
+            try:
+                response = await self._upload_files(
+                    "/api/v1/add/batch",
+                    data_list[start : start + _ADD_BATCH_MAX_ITEMS],
+                    dataset_name,
+                    dataset_id,
+                    node_set,
+                )
+            except CogneeAPIError as e:
+                # Only the first probe may mark the endpoint unsupported; once a
+                # batch request has succeeded, a 404 is about the request itself
+                if self._batch_add_supported is None and self._is_missing_route(e):
+                    self._batch_add_supported = False
+                # The per-item path uploads the items not stored yet and applies
+                # continue_on_error / return_errors to each failure
+                break
+
+            self._batch_add_supported = True
+            batch: list[AddResult] = self._validate_response(response, _ADD_RESULT_LIST_ADAPTER)
+            results.extend(batch)
+        return results
+
+    @staticmethod
+    def _is_missing_route(error: CogneeAPIError) -> bool:
+        """
+        Check whether an API error means the endpoint itself does not exist.
+
+        A 405, or a 404 carrying the framework's bare "Not Found" detail, is
+        route-level; other 404s name a missing resource such as a dataset.
+
+        Args:
+            error: Error raised by the request
+
+        Returns:
+            True if the server does not serve the requested route
+        """
+        if error.status_code == 405:
+            return True
+        return error.status_code == 404 and (error.response or {}).get("detail") == "Not Found"
+
+    @staticmethod
+    def _is_streamed_file(item: str | bytes | Path | BinaryIO) -> bool:
+        """
+        Check whether an item is a file path large enough to be streamed from disk.
+
+        Args:
+            item: Data item to check
+
+        Returns:
+            True if the item names an existing file above the streaming threshold
+        """
+        if isinstance(item, str):
+            if not item.startswith(("/", "file://", "s3://")):
+                return False
+            item = Path(item.replace("file://", ""))
+        elif not isinstance(item, Path):
+            return False
+        try:
+            return item.is_file() and item.stat().st_size > _STREAMING_THRESHOLD
+        except OSError:
+            return False
+
+    async def add_many(
+        self,
+        items: Sequence[str | bytes | Path | BinaryIO],
+        dataset_name: str | None = None,
+        dataset_id: UUID | None = None,
+        node_set: list[str] | None = None,
+        *,
+        concurrency: int | None = None,
+    ) -> list[AddResult]:
+        """
+        Add multiple data items concurrently, one request per item.
+
+        Unlike add_batch(), this is a fail-fast API: the first failure cancels
+        all in-flight uploads and is raised to the caller.
+
+        Args:
+            items: Data items to add
+            dataset_name: Name of the dataset
+            dataset_id: UUID of the dataset
+            node_set: Optional list of node identifiers
+            concurrency: Maximum number of in-flight uploads. Defaults to
+                        max_keepalive_connections so the connection pool is
+                        saturated without opening extra connections.
+
+        Returns:
+            List of AddResult objects in the same order as items
+
+        Raises:
+            ValidationError: If neither dataset_name nor dataset_id is provided, or
+                            concurrency is less than 1
+            CogneeSDKError: First error raised by any individual upload
+
+        Example:
+            >>> results = await client.add_many(
+            ...     ["text1", "text2", "text3"],
+            ...     dataset_name="my-dataset",
+            ... )
+        """
+        if not dataset_name and not dataset_id:
+            raise ValidationError(
+                "Either dataset_name or dataset_id must be provided",
+                400,
+            )
+        if concurrency is None:
+            concurrency = self.max_keepalive_connections
+        elif concurrency < 1:
+            raise ValidationError("concurrency must be at least 1", 400)
+        if not items:
+            return []
+
+        semaphore = asyncio.Semaphore(min(concurrency, self.max_connections))
+
+        async def add_one(item: str | bytes | Path | BinaryIO) -> AddResult:
+            async with semaphore:
+                return await self.add(
+                    data=item,
+                    dataset_name=dataset_name,
+                    dataset_id=dataset_id,
+                    node_set=node_set,
+                )
+
+        # Equivalent to asyncio.TaskGroup semantics, which requires Python 3.11+
+        tasks = [asyncio.ensure_future(add_one(item)) for item in items]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def add_batch_iter(
+        self,
+        data_list: Iterable[str | bytes | Path | BinaryIO],
+        dataset_name: str | None = None,
+        dataset_id: UUID | None = None,
+        node_set: list[str] | None = None,
+        max_concurrent: int = 16,
+    ) -> AsyncIterator[AddResult]:
+        """
+        Add multiple data items concurrently, yielding results as they complete.
+
+        Streaming counterpart of add_batch(): results are handed to the caller
+        through a bounded queue, so workers pause when the consumer falls
+        behind and memory stays bounded by max_concurrent rather than by the
+        size of data_list. data_list may be any iterable, including a lazy
+        generator. Results are yielded in completion order, not input order.
+
+        Args:
+            data_list: Iterable of data items to add
+            dataset_name: Name of the dataset
+            dataset_id: UUID of the dataset
+            node_set: Optional list of node identifiers
+            max_concurrent: Maximum number of concurrent operations, capped at
+                          max_connections (default: 16)
+
+        Yields:
+            AddResult for each item, as soon as its upload finishes
+
+        Raises:
+            ValidationError: If neither dataset_name nor dataset_id is provided,
+                           or max_concurrent is less than 1
+            CogneeSDKError: First error raised by any individual upload; the
+                           remaining uploads are cancelled
+
+        Example:
+            >>> async for result in client.add_batch_iter(
+            ...     (line for line in open("corpus.txt")),
+            ...     dataset_name="my-dataset",
+            ... ):
+            ...     print(result.data_id)
+        """
+        if not dataset_name and not dataset_id:
+            raise ValidationError(
+                "Either dataset_name or dataset_id must be provided",
+                400,
+            )
+        if max_concurrent < 1:
+            raise ValidationError("max_concurrent must be at least 1", 400)
+
+        pending = iter(data_list)
+        queue: asyncio.Queue[AddResult | BaseException | None] = asyncio.Queue(
+            maxsize=max_concurrent
+        )
+
+        async def worker() -> None:
+            try:
+                for item in pending:
+                    result = await self.add(
+                        data=item,
+                        dataset_name=dataset_name,
+                        dataset_id=dataset_id,
+                        node_set=node_set,
+                    )
+                    # Blocks while the queue is full, throttling the producer
+                    await queue.put(result)
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(max_concurrent, self.max_connections))
+        ]
+        remaining = len(workers)
+        try:
+            while remaining:
+                outcome = await queue.get()
+                if outcome is None:
+                    remaining -= 1
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    yield outcome
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
@@ -4,12 +4,14 @@ Data models for Cognee SDK.
 All models use Pydantic BaseModel for type validation and serialization.
 """
 
+import sys
+from collections.abc import Iterator
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class SearchType(str, Enum):
@@ -32,6 +34,26 @@ class SearchType(str, Enum):
     CHUNKS_LEXICAL = "CHUNKS_LEXICAL"
 
 
+# Wire values accepted wherever a SearchType is expected
+SearchTypeValue = Literal[
+    "SUMMARIES",
+    "CHUNKS",
+    "RAG_COMPLETION",
+    "GRAPH_COMPLETION",
+    "GRAPH_SUMMARY_COMPLETION",
+    "CODE",
+    "CYPHER",
+    "NATURAL_LANGUAGE",
+    "GRAPH_COMPLETION_COT",
+    "GRAPH_COMPLETION_CONTEXT_EXTENSION",
+    "FEELING_LUCKY",
+    "FEEDBACK",
+    "TEMPORAL",
+    "CODING_RULES",
+    "CHUNKS_LEXICAL",
+]
+
+
 class PipelineRunStatus(str, Enum):
     """Pipeline run status enumeration."""
 
@@ -41,6 +63,16 @@ class PipelineRunStatus(str, Enum):
     FAILED = "failed"
 
 
+# SearchType and PipelineRunStatus are closed enums; the client resolves members
+# and plain strings with these lookups instead of Enum.value / EnumMeta.__call__
+_SEARCH_TYPE_VALUES: dict[SearchType | str, str] = {
+    key: member.value for member in SearchType for key in (member, member.value)
+}
+_PIPELINE_RUN_STATUSES: dict[str, PipelineRunStatus] = {
+    member.value: member for member in PipelineRunStatus
+}
+
+
 class User(BaseModel):
     """User model."""
 
@@ -48,6 +80,8 @@ class User(BaseModel):
     email: str = Field(..., description="User email address")
     created_at: datetime | None = Field(None, description="Account creation timestamp")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Dataset(BaseModel):
     """Dataset model."""
@@ -58,7 +92,7 @@ class Dataset(BaseModel):
     updated_at: datetime | None = Field(None, alias="updatedAt", description="Last update timestamp")
     owner_id: UUID | None = Field(None, alias="ownerId", description="Dataset owner ID")
     
-    model_config = ConfigDict(populate_by_name=True)  # Allow both snake_case and camelCase
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)  # Allow both snake_case and camelCase
 
 
 class DataItem(BaseModel):
@@ -73,7 +107,7 @@ class DataItem(BaseModel):
     raw_data_location: str | None = Field(None, alias="rawDataLocation", description="Raw data storage location")
     dataset_id: UUID | None = Field(None, alias="datasetId", description="Dataset ID")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class AddResult(BaseModel):
@@ -83,28 +117,35 @@ class AddResult(BaseModel):
     message: str | None = Field(None, description="Status message")
     data_id: UUID | None = Field(None, description="Created data ID")
     dataset_id: UUID | None = Field(None, description="Dataset ID")
-    pipeline_run_id: UUID | None = Field(None, alias="pipeline_run_id", description="Pipeline run ID")
-    dataset_name: str | None = Field(None, alias="dataset_name", description="Dataset name")
-    data_ingestion_info: list[dict[str, Any]] | None = Field(None, alias="data_ingestion_info", description="Data ingestion information")
+    pipeline_run_id: UUID | None = Field(None, description="Pipeline run ID")
+    dataset_name: str | None = Field(None, description="Dataset name")
+    data_ingestion_info: list[dict[str, Any]] | None = Field(None, description="Data ingestion information")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True, defer_build=True)
+    __match_args__ = ("status", "message", "data_id")
     
-    def __init__(self, **data: Any) -> None:
-        """Initialize AddResult, extracting data_id from data_ingestion_info if needed."""
-        # Extract data_id from data_ingestion_info if present
-        if "data_ingestion_info" in data and data["data_ingestion_info"]:
-            ingestion_info = data["data_ingestion_info"]
-            if isinstance(ingestion_info, list) and len(ingestion_info) > 0:
-                first_info = ingestion_info[0]
-                if isinstance(first_info, dict) and "data_id" in first_info:
-                    if "data_id" not in data or data["data_id"] is None:
-                        data["data_id"] = first_info["data_id"]
-        
-        # Set default message if not provided
-        if "message" not in data or data["message"] is None:
-            data["message"] = f"Data added successfully. Status: {data.get('status', 'unknown')}"
-        
-        super().__init__(**data)
+    @model_validator(mode="before")
+    @classmethod
+    def _fill_data_id(cls, data: Any) -> Any:
+        """Extract data_id from data_ingestion_info if not provided."""
+        if not isinstance(data, dict) or data.get("data_id") is not None:
+            return data
+
+        ingestion_info = data.get("data_ingestion_info")
+        if ingestion_info and isinstance(ingestion_info, list):
+            first_info = ingestion_info[0]
+            if isinstance(first_info, dict) and "data_id" in first_info:
+                # Don't mutate the caller's dict
+                return {**data, "data_id": first_info["data_id"]}
+
+        return data
+
+    def model_post_init(self, __context: Any) -> None:
+        """Default the message from the validated status if not provided."""
+        if self.message is None:
+            # The model is frozen, so bypass the pydantic __setattr__ guard
+            object.__setattr__(self, "message", f"Data added successfully. Status: {self.status}")
+            self.__pydantic_fields_set__.add("message")
 
 
 class DeleteResult(BaseModel):
@@ -113,6 +154,9 @@ class DeleteResult(BaseModel):
     status: str = Field(..., description="Operation status")
     message: str = Field(..., description="Status message")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    __match_args__ = ("status", "message")
+
 
 class CognifyResult(BaseModel):
     """Result model for cognify operation."""
@@ -123,6 +167,8 @@ class CognifyResult(BaseModel):
     duration: float | None = Field(None, description="Processing duration in seconds")
     message: str | None = Field(None, description="Status message")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class MemifyResult(BaseModel):
     """Result model for memify operation."""
@@ -131,6 +177,9 @@ class MemifyResult(BaseModel):
     status: str = Field(..., description="Pipeline status")
     message: str | None = Field(None, description="Status message")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    __match_args__ = ("pipeline_run_id", "status", "message")
+
 
 class UpdateResult(BaseModel):
     """Result model for update operation."""
@@ -139,6 +188,9 @@ class UpdateResult(BaseModel):
     message: str = Field(..., description="Status message")
     data_id: UUID | None = Field(None, description="Updated data ID")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    __match_args__ = ("status", "message", "data_id")
+
 
 class SearchResult(BaseModel):
     """Search result model.
@@ -154,7 +206,7 @@ class SearchResult(BaseModel):
     metadata: dict[str, Any] | None = Field(None, description="Additional metadata")
 
     # Allow additional fields
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 class CombinedSearchResult(BaseModel):
@@ -164,6 +216,8 @@ class CombinedSearchResult(BaseModel):
     context: list[str] | None = Field(None, description="Context chunks")
     metadata: dict[str, Any] | None = Field(None, description="Additional metadata")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class SearchHistoryItem(BaseModel):
     """Search history item model."""
@@ -173,6 +227,8 @@ class SearchHistoryItem(BaseModel):
     user: str = Field(..., description="User who performed the search")
     created_at: datetime = Field(..., description="Search timestamp")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class GraphNode(BaseModel):
     """Graph node model."""
@@ -181,6 +237,8 @@ class GraphNode(BaseModel):
     label: str = Field(..., description="Node label")
     properties: dict[str, Any] = Field(default_factory=dict, description="Node properties")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class GraphEdge(BaseModel):
     """Graph edge model."""
@@ -189,6 +247,8 @@ class GraphEdge(BaseModel):
     target: UUID = Field(..., description="Target node ID")
     label: str = Field(..., description="Edge label")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class GraphData(BaseModel):
     """Graph data model."""
@@ -196,6 +256,65 @@ class GraphData(BaseModel):
     nodes: list[GraphNode] = Field(..., description="List of graph nodes")
     edges: list[GraphEdge] = Field(..., description="List of graph edges")
 
+    model_config = ConfigDict(defer_build=True)
+
+
+class GraphDataRaw(BaseModel):
+    """Columnar (struct-of-arrays) view of graph data.
+
+    Node and edge attributes are kept in parallel lists of raw values, so a
+    large graph costs a handful of lists instead of one model per node and
+    edge. IDs stay as the strings sent by the server. Use nodes() and edges()
+    to materialize validated GraphNode/GraphEdge objects on demand, or hand
+    the columns to numpy/pandas for vectorized analysis.
+    """
+
+    node_ids: list[str] = Field(default_factory=list, description="Node IDs")
+    node_labels: list[str] = Field(default_factory=list, description="Node labels")
+    node_properties: list[dict[str, Any]] = Field(
+        default_factory=list, description="Node properties"
+    )
+    edge_sources: list[str] = Field(default_factory=list, description="Edge source node IDs")
+    edge_targets: list[str] = Field(default_factory=list, description="Edge target node IDs")
+    edge_labels: list[str] = Field(default_factory=list, description="Edge labels")
+
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def from_json_data(cls, data: dict[str, Any]) -> "GraphDataRaw":
+        """Build columns from a decoded graph response without per-item validation.
+
+        Labels come from a small vocabulary repeated across the whole graph, so
+        they are interned: every row with the same label shares one string.
+        """
+        nodes = data.get("nodes") or []
+        edges = data.get("edges") or []
+        intern = sys.intern
+        return cls.model_construct(
+            node_ids=[node["id"] for node in nodes],
+            node_labels=[intern(node["label"]) for node in nodes],
+            node_properties=[node.get("properties") or {} for node in nodes],
+            edge_sources=[edge["source"] for edge in edges],
+            edge_targets=[edge["target"] for edge in edges],
+            edge_labels=[intern(edge["label"]) for edge in edges],
+        )
+
+    def nodes(self) -> Iterator[GraphNode]:
+        """Yield one validated GraphNode per row."""
+        for node_id, label, properties in zip(
+            self.node_ids, self.node_labels, self.node_properties, strict=True
+        ):
+            yield GraphNode.model_validate(
+                {"id": node_id, "label": label, "properties": properties}
+            )
+
+    def edges(self) -> Iterator[GraphEdge]:
+        """Yield one validated GraphEdge per row."""
+        for source, target, label in zip(
+            self.edge_sources, self.edge_targets, self.edge_labels, strict=True
+        ):
+            yield GraphEdge.model_validate({"source": source, "target": target, "label": label})
+
 
 class SyncResult(BaseModel):
     """Result model for sync operation."""
@@ -208,6 +327,8 @@ class SyncResult(BaseModel):
     timestamp: datetime | None = Field(None, description="Sync initiation timestamp")
     user_id: UUID | None = Field(None, description="User ID who initiated sync")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class SyncStatus(BaseModel):
     """Sync status model."""
@@ -218,9 +339,15 @@ class SyncStatus(BaseModel):
         None, description="Information about the latest running sync"
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    __match_args__ = ("has_running_sync", "running_sync_count", "latest_running_sync")
+
 
 class HealthStatus(BaseModel):
     """Health check status model."""
 
     status: str = Field(..., description="Health status")
     version: str | None = Field(None, description="API version")
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    __match_args__ = ("status", "version")
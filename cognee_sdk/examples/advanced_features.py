@@ -6,7 +6,7 @@ This example demonstrates advanced features:
 2. Smart retry mechanism
 3. Batch operations with error handling
 4. Request logging and interceptors
-5. Custom connection pool configuration
+5. Custom connection pool configuration, shared by all examples
 """
 
 import asyncio
@@ -21,42 +21,20 @@ async def main():
     """Main example function."""
     # Example 1: Client with logging enabled
     print("=== Example 1: Request Logging ===")
-    client_with_logging = CogneeClient(
+    # Logging is configured when the client is created, so this demo uses its
+    # own short-lived client; everything below shares a single client.
+    async with CogneeClient(
         api_url="http://localhost:8000",
         enable_logging=True,  # Enable request/response logging
-    )
-
-    try:
+    ) as client_with_logging:
         datasets = await client_with_logging.list_datasets()
         print(f"Found {len(datasets)} datasets (check logs above)")
-    finally:
-        await client_with_logging.close()
-
-    # Example 2: Client with interceptors
-    print("\n=== Example 2: Request/Response Interceptors ===")
-
-    def request_interceptor(method: str, url: str, headers: dict):
-        """Custom request interceptor."""
-        print(f"  → Request: {method} {url}")
 
-    def response_interceptor(response):
-        """Custom response interceptor."""
-        print(f"  ← Response: {response.status_code}")
-
-    client_with_interceptors = CogneeClient(
-        api_url="http://localhost:8000",
-        request_interceptor=request_interceptor,
-        response_interceptor=response_interceptor,
-    )
-
-    try:
-        await client_with_interceptors.health_check()
-    finally:
-        await client_with_interceptors.close()
-
-    # Example 3: Custom connection pool configuration
-    print("\n=== Example 3: Custom Connection Pool ===")
-    client_custom_pool = CogneeClient(
+    # Example 2: Custom connection pool configuration
+    # Create one client and reuse it: every client owns its own connection pool,
+    # so recreating clients throws away warm connections (and TLS sessions).
+    print("\n=== Example 2: Custom Connection Pool ===")
+    client = CogneeClient(
         api_url="http://localhost:8000",
         max_keepalive_connections=20,  # More keepalive connections
         max_connections=50,            # More total connections
@@ -65,19 +43,39 @@ async def main():
     try:
         # This is useful for high-concurrency scenarios
         print("Client configured with custom connection pool")
-        await client_custom_pool.health_check()
-    finally:
-        await client_custom_pool.close()
+        await client.health_check()
 
-    # Example 4: Streaming upload for large files
-    print("\n=== Example 4: Streaming Upload ===")
-    client = CogneeClient(api_url="http://localhost:8000")
+        # Example 3: Client with interceptors
+        print("\n=== Example 3: Request/Response Interceptors ===")
 
-    try:
-        # Create a large file (> 10MB - triggers streaming)
+        def request_interceptor(method: str, url: str, headers: dict):
+            """Custom request interceptor."""
+            print(f"  → Request: {method} {url}")
+
+        def response_interceptor(response):
+            """Custom response interceptor."""
+            print(f"  ← Response: {response.status_code}")
+
+        # Interceptors are read on every request, so they can be attached to
+        # (and removed from) an existing client
+        client.request_interceptor = request_interceptor
+        client.response_interceptor = response_interceptor
+        try:
+            await client.health_check()
+        finally:
+            client.request_interceptor = None
+            client.response_interceptor = None
+
+        # Example 4: Streaming upload for large files
+        print("\n=== Example 4: Streaming Upload ===")
+
+        # Create a large file (> 1MB - triggers streaming)
         with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as f:
-            large_data = b"Streaming upload test " * (500 * 1024)  # ~12MB
-            f.write(large_data)
+            # Write ~12MB in 64KB chunks so the demo itself never holds the
+            # whole file in memory
+            chunk = b"Streaming upload test " * 3000  # ~64KB
+            for _ in range(12 * 1024 * 1024 // len(chunk)):
+                f.write(chunk)
             large_file = Path(f.name)
 
         try:
@@ -8,17 +8,32 @@ import asyncio
 
 from cognee_sdk import CogneeClient, SearchType
 
+# Upper bound on in-flight requests; keep it at or below the client's
+# connection pool size so requests never queue for a connection.
+MAX_CONCURRENT = 10
+
+
+async def gather_bounded(coros, limit=MAX_CONCURRENT):
+    """Await coroutines concurrently with at most ``limit`` in flight, preserving order."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
 
 async def main():
     """Main example function."""
     client = CogneeClient(api_url="http://localhost:8000")
 
     try:
-        # Example 1: Concurrent dataset creation
+        # Example 1: Concurrent dataset creation (bounded fan-out)
         print("Creating multiple datasets concurrently...")
         dataset_names = ["dataset1", "dataset2", "dataset3"]
         tasks = [client.create_dataset(name) for name in dataset_names]
-        datasets = await asyncio.gather(*tasks)
+        datasets = await gather_bounded(tasks)
         print(f"Created {len(datasets)} datasets")
 
         # Example 2: Concurrent data addition
@@ -30,7 +45,7 @@ async def main():
             )
             for ds in datasets
         ]
-        add_results = await asyncio.gather(*add_tasks)
+        add_results = await gather_bounded(add_tasks)
         print(f"Added data to {len(add_results)} datasets")
 
         # Example 3: Concurrent searches
@@ -48,7 +63,7 @@ async def main():
             )
             for i, query in enumerate(search_queries)
         ]
-        search_results = await asyncio.gather(*search_tasks)
+        search_results = await gather_bounded(search_tasks)
         print(f"Completed {len(search_results)} searches")
 
         # Example 4: Batch operations with concurrent control
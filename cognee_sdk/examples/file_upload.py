@@ -74,14 +74,17 @@ async def main():
 
         # Example 6: Streaming upload for large files
         print("\nDemonstrating streaming upload for large files...")
-        print("Note: Files > 10MB automatically use streaming upload")
+        print("Note: Files > 1MB passed as a path are streamed from disk in chunks")
         print("Files > 50MB will trigger warnings but still work")
         
         # Create a large file for demonstration (12MB - triggers streaming)
         import tempfile
         with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as f:
-            large_data = b"Large file content " * (600 * 1024)  # ~12MB
-            f.write(large_data)
+            # Write ~12MB in 64KB chunks so the demo itself never holds the
+            # whole file in memory
+            chunk = b"Large file content " * 3500  # ~64KB
+            for _ in range(12 * 1024 * 1024 // len(chunk)):
+                f.write(chunk)
             large_file = Path(f.name)
 
         try:
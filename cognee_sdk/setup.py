@@ -0,0 +1,59 @@
+"""Optional Cython build of ``cognee_sdk.models``.
+
+Project metadata lives in ``pyproject.toml``; this file only adds a compiled
+extension for ``models.py`` when Cython is importable at build time. Cython is
+not a build requirement, so regular (isolated) installs stay pure Python. To
+opt in, install Cython and build without isolation:
+
+    pip install cython
+    pip install --no-build-isolation .
+
+Set ``SKIP_CYTHON=1`` to force a pure-Python build. If compilation fails for
+any reason the build falls back to the pure-Python module.
+"""
+
+import os
+
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+
+
+class OptionalBuildExt(build_ext):
+    """build_ext that skips extensions which fail to compile."""
+
+    def run(self) -> None:
+        try:
+            super().run()
+        except Exception as e:  # noqa: BLE001
+            self._skip(e)
+
+    def build_extension(self, ext: Extension) -> None:
+        try:
+            super().build_extension(ext)
+        except Exception as e:  # noqa: BLE001
+            self._skip(e)
+
+    def _skip(self, error: Exception) -> None:
+        print(f"WARNING: building Cython extension failed ({error}); using pure Python models")
+
+
+def _ext_modules() -> list[Extension]:
+    if os.environ.get("SKIP_CYTHON"):
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize(
+        ["cognee_sdk/models.py"],
+        language_level=3,
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            # Keep cyfunction introspection working for pydantic validators
+            "binding": True,
+        },
+    )
+
+
+setup(ext_modules=_ext_modules(), cmdclass={"build_ext": OptionalBuildExt})
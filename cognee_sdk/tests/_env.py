@@ -0,0 +1,11 @@
+"""Connection settings shared by the debug and test-data scripts."""
+
+import os
+
+API_URL = os.getenv("API_URL", "http://192.168.66.11")
+# Set API_TOKEN in the environment for servers that require authentication
+API_TOKEN = os.getenv("API_TOKEN", "")
+# Built once; scripts pass it instead of formatting the header per request
+DEFAULT_HEADERS = {"Authorization": f"Bearer {API_TOKEN}"} if API_TOKEN else {}
+# COGNEE_TEST_VERBOSE=1 prints per-item progress and full tracebacks
+VERBOSE = os.getenv("COGNEE_TEST_VERBOSE") == "1"
@@ -0,0 +1,15 @@
+"""Shared pytest configuration for the SDK test suite."""
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+if uvloop is not None:
+
+    # Needs pytest-asyncio >= 1.4.0 (the dev pin). Not an optional hook, so an
+    # older release rejects it at startup instead of ignoring uvloop silently
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
@@ -2,12 +2,14 @@
 Unit tests for advanced features.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
 from cognee_sdk import CogneeClient
+from cognee_sdk.exceptions import ServerError, ValidationError
 from cognee_sdk.models import AddResult
 
 
@@ -43,3 +45,177 @@ async def test_add_batch(client):
         assert len(results) == 3
         assert all(isinstance(r, AddResult) for r in results)
         assert mock_add.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_add_batch_dispatches_concurrently(client):
+    """Test add_batch overlaps uploads with the default concurrency settings."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_add(data, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return AddResult(status="success", data_id=uuid4())
+
+    with patch.object(client, "add", side_effect=fake_add):
+        results = await client.add_batch(
+            data_list=["data1", "data2", "data3"],
+            dataset_name="test-dataset",
+        )
+
+    assert len(results) == 3
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_add_many(client):
+    """Test concurrent add_many preserves input order."""
+    data_list = ["data1", "data2", "data3"]
+
+    async def fake_add(data, **kwargs):
+        return AddResult(status="success", message=data, data_id=uuid4())
+
+    with patch.object(client, "add", side_effect=fake_add) as mock_add:
+        results = await client.add_many(data_list, dataset_name="test-dataset")
+
+        assert [r.message for r in results] == data_list
+        assert mock_add.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_add_many_bounded_concurrency(client):
+    """Test add_many never exceeds the requested concurrency."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_add(data, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return AddResult(status="success", data_id=uuid4())
+
+    with patch.object(client, "add", side_effect=fake_add):
+        results = await client.add_many(
+            [f"data{i}" for i in range(20)],
+            dataset_name="test-dataset",
+            concurrency=4,
+        )
+
+    assert len(results) == 20
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_add_many_fails_fast(client):
+    """Test add_many raises the first error and cancels pending uploads."""
+    started = []
+
+    async def fake_add(data, **kwargs):
+        started.append(data)
+        if data == "bad":
+            raise ServerError("boom", 500)
+        await asyncio.sleep(1)
+        return AddResult(status="success", data_id=uuid4())
+
+    with patch.object(client, "add", side_effect=fake_add):
+        with pytest.raises(ServerError):
+            await client.add_many(
+                ["bad", "ok1", "ok2", "ok3"],
+                dataset_name="test-dataset",
+                concurrency=2,
+            )
+
+    assert "ok3" not in started
+
+
+@pytest.mark.asyncio
+async def test_add_many_validation_error(client):
+    """Test add_many requires a dataset."""
+    with pytest.raises(ValidationError):
+        await client.add_many(["data1"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_add_many_invalid_concurrency(client, concurrency):
+    """Test add_many rejects a concurrency below 1."""
+    with patch.object(client, "add", new_callable=AsyncMock) as mock_add:
+        with pytest.raises(ValidationError, match="concurrency"):
+            await client.add_many(["data1"], dataset_name="test-dataset", concurrency=concurrency)
+
+    mock_add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_batch_iter_streams_all_results(client):
+    """Test add_batch_iter yields one result per item from a lazy iterable."""
+
+    async def fake_add(data, **kwargs):
+        await asyncio.sleep(0)
+        return AddResult(status=data)
+
+    with patch.object(client, "add", side_effect=fake_add):
+        statuses = [
+            result.status
+            async for result in client.add_batch_iter(
+                (f"data{i}" for i in range(10)),
+                dataset_name="test-dataset",
+                max_concurrent=3,
+            )
+        ]
+
+    assert sorted(statuses) == sorted(f"data{i}" for i in range(10))
+
+
+@pytest.mark.asyncio
+async def test_add_batch_iter_backpressure(client):
+    """Test add_batch_iter stops starting uploads while the consumer lags."""
+    started = []
+
+    async def fake_add(data, **kwargs):
+        started.append(data)
+        return AddResult(status="success")
+
+    with patch.object(client, "add", side_effect=fake_add):
+        stream = client.add_batch_iter(
+            [f"data{i}" for i in range(100)],
+            dataset_name="test-dataset",
+            max_concurrent=2,
+        )
+        await stream.__anext__()
+        await asyncio.sleep(0.01)
+        await stream.aclose()
+
+    # Queue holds max_concurrent results, plus one blocked put per worker
+    assert len(started) <= 6
+
+
+@pytest.mark.asyncio
+async def test_add_batch_iter_raises_first_error(client):
+    """Test add_batch_iter surfaces an upload failure to the consumer."""
+
+    async def fake_add(data, **kwargs):
+        if data == "bad":
+            raise ServerError("boom", 500)
+        return AddResult(status="success")
+
+    with patch.object(client, "add", side_effect=fake_add):
+        with pytest.raises(ServerError):
+            async for _ in client.add_batch_iter(
+                ["ok", "bad", "ok"], dataset_name="test-dataset", max_concurrent=1
+            ):
+                pass
+
+
+@pytest.mark.asyncio
+async def test_add_batch_iter_validation_error(client):
+    """Test add_batch_iter requires a dataset."""
+    with pytest.raises(ValidationError):
+        async for _ in client.add_batch_iter(["data1"]):
+            pass
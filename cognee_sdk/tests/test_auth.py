@@ -3,6 +3,7 @@ Unit tests for authentication API.
 """
 
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 
@@ -10,6 +11,8 @@ from cognee_sdk import CogneeClient
 from cognee_sdk.exceptions import ValidationError
 from cognee_sdk.models import User
 
+_FAKE_USER_ID = str(uuid4())
+
 
 @pytest.fixture
 def client():
@@ -29,28 +32,17 @@ async def test_login(client):
 
         assert token == "test-token-123"
         assert client.api_token == "test-token-123"
+        assert client._auth_headers == {"Authorization": "Bearer test-token-123"}
+        assert client._get_headers()["Authorization"] == "Bearer test-token-123"
         mock_request.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_login_validation_error(client):
-    """Test login with empty credentials."""
-    with pytest.raises(ValidationError):
-        await client.login("", "password")
-
-    with pytest.raises(ValidationError):
-        await client.login("user@example.com", "")
-
-
 @pytest.mark.asyncio
 async def test_register(client):
     """Test user registration."""
-    from uuid import uuid4
-
-    user_id = uuid4()
     mock_response = MagicMock()
     mock_response.json.return_value = {
-        "id": str(user_id),
+        "id": _FAKE_USER_ID,
         "email": "newuser@example.com",
         "created_at": "2025-01-01T00:00:00Z",
     }
@@ -65,24 +57,22 @@ async def test_register(client):
 
 
 @pytest.mark.asyncio
-async def test_register_validation_error(client):
-    """Test register with empty credentials."""
+@pytest.mark.parametrize("method", ["login", "register"])
+@pytest.mark.parametrize(
+    "email,password", [("", "password"), ("user@example.com", "")], ids=["no-email", "no-password"]
+)
+async def test_credentials_validation_error(client, method, email, password):
+    """Test login and register with empty credentials."""
     with pytest.raises(ValidationError):
-        await client.register("", "password")
-
-    with pytest.raises(ValidationError):
-        await client.register("user@example.com", "")
+        await getattr(client, method)(email, password)
 
 
 @pytest.mark.asyncio
 async def test_get_current_user(client):
     """Test getting current user."""
-    from uuid import uuid4
-
-    user_id = uuid4()
     mock_response = MagicMock()
     mock_response.json.return_value = {
-        "id": str(user_id),
+        "id": _FAKE_USER_ID,
         "email": "user@example.com",
     }
 
@@ -4,9 +4,12 @@ Unit tests for CogneeClient.
 Tests core functionality using mocked HTTP requests.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+import json
+import ssl
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
 
+import httpx
 import pytest
 
 from cognee_sdk import CogneeClient, SearchType
@@ -22,6 +25,87 @@ from cognee_sdk.models import (
     DeleteResult,
 )
 
+# Fixed IDs for canned responses, generated once per module
+_FAKE_DATASET_ID = str(uuid4())
+_FAKE_OTHER_DATASET_ID = str(uuid4())
+_FAKE_DATA_ID = str(uuid4())
+_FAKE_OWNER_ID = str(uuid4())
+_FAKE_PIPELINE_RUN_ID = str(uuid4())
+
+# Canned (status, body) responses keyed by request path, encoded once at import
+_HEALTH_ROUTES = {
+    "/health": (200, json.dumps({"status": "healthy", "version": "1.0.0"}).encode()),
+}
+_ADD_BODY = json.dumps(
+    {
+        "status": "success",
+        "message": "Data added",
+        "data_id": _FAKE_DATA_ID,
+        "dataset_id": _FAKE_DATASET_ID,
+    }
+).encode()
+_DELETE_BODY = json.dumps({"status": "success", "message": "Data deleted"}).encode()
+_COGNIFY_BODY = json.dumps(
+    {
+        "default": {
+            "pipeline_run_id": _FAKE_PIPELINE_RUN_ID,
+            "status": "completed",
+            "entity_count": 10,
+            "duration": 5.5,
+        }
+    }
+).encode()
+_SEARCH_BODY = json.dumps(
+    [
+        {"id": "1", "text": "Result 1", "score": 0.9},
+        {"id": "2", "text": "Result 2", "score": 0.8},
+    ]
+).encode()
+_DATASET_BODY = {
+    "name": "new-dataset",
+    "created_at": "2025-01-01T00:00:00Z",
+    "owner_id": _FAKE_OWNER_ID,
+}
+_DATASETS_BODY = json.dumps(
+    [
+        {**_DATASET_BODY, "id": _FAKE_DATASET_ID, "name": "dataset1"},
+        {**_DATASET_BODY, "id": _FAKE_OTHER_DATASET_ID, "name": "dataset2"},
+    ]
+).encode()
+_CREATE_DATASET_BODY = json.dumps({**_DATASET_BODY, "id": _FAKE_DATASET_ID}).encode()
+_ERROR_BODIES = {
+    401: json.dumps({"error": "Unauthorized"}).encode(),
+    404: json.dumps({"error": "Not found"}).encode(),
+    500: json.dumps({"error": "Internal server error"}).encode(),
+}
+
+
+def _mock_transport_client(
+    routes: dict[str, tuple[int, bytes]],
+    sent: list[httpx.Request] | None = None,
+) -> CogneeClient:
+    """Create a client whose requests are answered from ``routes`` by httpx.MockTransport.
+
+    Requests are appended to ``sent`` when it is given.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if sent is not None:
+            sent.append(request)
+        status, body = routes[request.url.path]
+        return httpx.Response(status, content=body, headers={"Content-Type": "application/json"})
+
+    return CogneeClient(
+        api_url="http://localhost:8000",
+        api_token="test-token",
+        retry_delay=0.0,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def _error_client(status: int) -> CogneeClient:
+    return _mock_transport_client({"/api/v1/datasets": (status, _ERROR_BODIES[status])})
+
 
 @pytest.fixture
 def client():
@@ -29,17 +113,6 @@ def client():
     return CogneeClient(api_url="http://localhost:8000", api_token="test-token")
 
 
-@pytest.fixture
-def mock_response():
-    """Create a mock HTTP response."""
-    response = MagicMock()
-    response.status_code = 200
-    response.json = MagicMock(return_value={})
-    response.text = ""
-    response.content = b""
-    return response
-
-
 @pytest.mark.asyncio
 async def test_client_initialization(client):
     """Test client initialization."""
@@ -49,223 +122,154 @@ async def test_client_initialization(client):
     assert client.max_retries == 3
 
 
-@pytest.mark.asyncio
-async def test_health_check(client, mock_response):
-    """Test health check."""
-    mock_response.json.return_value = {"status": "healthy", "version": "1.0.0"}
+def test_api_token_rotation_updates_auth_headers(client):
+    """Test the cached Authorization header follows api_token changes."""
+    headers = client._auth_headers
+    assert headers == {"Authorization": "Bearer test-token"}
+    # Reused by reference until the token changes
+    assert client._auth_headers is headers
 
-    with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await client.health_check()
+    client.api_token = "rotated"
+    assert client._get_headers()["Authorization"] == "Bearer rotated"
 
-        assert result.status == "healthy"
-        assert result.version == "1.0.0"
-        mock_request.assert_called_once()
+    client.api_token = None
+    assert "Authorization" not in client._get_headers()
 
 
 @pytest.mark.asyncio
-async def test_add_text_data(client, mock_response):
-    """Test adding text data."""
-    mock_response.json.return_value = {
-        "status": "success",
-        "message": "Data added",
-        "data_id": str(uuid4()),
-        "dataset_id": str(uuid4()),
-    }
-
-    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await client.add(
-            data="Test data",
-            dataset_name="test-dataset",
-        )
+async def test_health_check():
+    """Test health check."""
+    client = _mock_transport_client(_HEALTH_ROUTES)
+    result = await client.health_check()
 
-        assert isinstance(result, AddResult)
-        assert result.status == "success"
-        mock_request.assert_called_once()
+    assert result.status == "healthy"
+    assert result.version == "1.0.0"
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_add_validation_error(client):
-    """Test add with missing dataset name."""
-    with pytest.raises(ValidationError):
-        await client.add(data="test", dataset_name=None, dataset_id=None)
+async def test_add_text_data():
+    """Test adding text data."""
+    sent: list[httpx.Request] = []
+    client = _mock_transport_client({"/api/v1/add": (200, _ADD_BODY)}, sent)
+    result = await client.add(
+        data="Test data",
+        dataset_name="test-dataset",
+    )
+
+    assert isinstance(result, AddResult)
+    assert result.status == "success"
+    assert str(result.data_id) == _FAKE_DATA_ID
+    assert [r.method for r in sent] == ["POST"]
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_delete(client, mock_response):
+async def test_delete():
     """Test deleting data."""
-    mock_response.json.return_value = {
-        "status": "success",
-        "message": "Data deleted",
-    }
-
-    data_id = uuid4()
-    dataset_id = uuid4()
-
-    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await client.delete(data_id=data_id, dataset_id=dataset_id)
+    sent: list[httpx.Request] = []
+    client = _mock_transport_client({"/api/v1/delete": (200, _DELETE_BODY)}, sent)
+    result = await client.delete(data_id=UUID(_FAKE_DATA_ID), dataset_id=UUID(_FAKE_DATASET_ID))
 
-        assert isinstance(result, DeleteResult)
-        assert result.status == "success"
-        mock_request.assert_called_once()
+    assert isinstance(result, DeleteResult)
+    assert result.status == "success"
+    assert [r.method for r in sent] == ["DELETE"]
+    assert sent[0].url.params["data_id"] == _FAKE_DATA_ID
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_cognify(client, mock_response):
+async def test_cognify():
     """Test cognify operation."""
-    mock_response.json.return_value = {
-        "default": {
-            "pipeline_run_id": str(uuid4()),
-            "status": "completed",
-            "entity_count": 10,
-            "duration": 5.5,
-        }
-    }
-
-    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await client.cognify(datasets=["test-dataset"])
+    sent: list[httpx.Request] = []
+    client = _mock_transport_client({"/api/v1/cognify": (200, _COGNIFY_BODY)}, sent)
+    result = await client.cognify(datasets=["test-dataset"])
 
-        assert isinstance(result, dict)
-        assert "default" in result
-        mock_request.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_cognify_validation_error(client):
-    """Test cognify with missing datasets."""
-    with pytest.raises(ValidationError):
-        await client.cognify(datasets=None, dataset_ids=None)
+    assert isinstance(result, dict)
+    assert "default" in result
+    assert len(sent) == 1
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_search(client, mock_response):
+async def test_search():
     """Test search operation."""
-    mock_response.json.return_value = [
-        {"id": "1", "text": "Result 1", "score": 0.9},
-        {"id": "2", "text": "Result 2", "score": 0.8},
-    ]
-
-    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        results = await client.search(
-            query="test query",
-            search_type=SearchType.GRAPH_COMPLETION,
-        )
-
-        assert isinstance(results, list)
-        assert len(results) == 2
-        mock_request.assert_called_once()
-
+    sent: list[httpx.Request] = []
+    client = _mock_transport_client({"/api/v1/search": (200, _SEARCH_BODY)}, sent)
+    results = await client.search(
+        query="test query",
+        search_type=SearchType.GRAPH_COMPLETION,
+    )
 
-@pytest.mark.asyncio
-async def test_search_validation_error(client):
-    """Test search with empty query."""
-    with pytest.raises(ValidationError):
-        await client.search(query="")
+    assert isinstance(results, list)
+    assert len(results) == 2
+    assert len(sent) == 1
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_list_datasets(client, mock_response):
+async def test_list_datasets():
     """Test listing datasets."""
-    mock_response.json.return_value = [
-        {
-            "id": str(uuid4()),
-            "name": "dataset1",
-            "created_at": "2025-01-01T00:00:00Z",
-            "owner_id": str(uuid4()),
-        },
-        {
-            "id": str(uuid4()),
-            "name": "dataset2",
-            "created_at": "2025-01-01T00:00:00Z",
-            "owner_id": str(uuid4()),
-        },
-    ]
-
-    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        datasets = await client.list_datasets()
+    sent: list[httpx.Request] = []
+    client = _mock_transport_client({"/api/v1/datasets": (200, _DATASETS_BODY)}, sent)
+    datasets = await client.list_datasets()
 
-        assert isinstance(datasets, list)
-        assert len(datasets) == 2
-        assert all(isinstance(d, Dataset) for d in datasets)
-        mock_request.assert_called_once()
+    assert isinstance(datasets, list)
+    assert len(datasets) == 2
+    assert all(isinstance(d, Dataset) for d in datasets)
+    assert [r.method for r in sent] == ["GET"]
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_create_dataset(client, mock_response):
+async def test_create_dataset():
     """Test creating a dataset."""
-    dataset_id = uuid4()
-    owner_id = uuid4()
-    mock_response.json.return_value = {
-        "id": str(dataset_id),
-        "name": "new-dataset",
-        "created_at": "2025-01-01T00:00:00Z",
-        "owner_id": str(owner_id),
-    }
-
-    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        dataset = await client.create_dataset("new-dataset")
-
-        assert isinstance(dataset, Dataset)
-        assert dataset.name == "new-dataset"
-        mock_request.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_create_dataset_validation_error(client):
-    """Test creating dataset with empty name."""
-    with pytest.raises(ValidationError):
-        await client.create_dataset("")
-
-
-@pytest.mark.asyncio
-async def test_authentication_error(client):
-    """Test handling authentication errors."""
-    mock_response = MagicMock()
-    mock_response.status_code = 401
-    mock_response.json.return_value = {"error": "Unauthorized"}
-    mock_response.text = "Unauthorized"
-
-    with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
+    sent: list[httpx.Request] = []
+    client = _mock_transport_client({"/api/v1/datasets": (200, _CREATE_DATASET_BODY)}, sent)
+    dataset = await client.create_dataset("new-dataset")
 
-        with pytest.raises(AuthenticationError):
-            await client.list_datasets()
+    assert isinstance(dataset, Dataset)
+    assert dataset.name == "new-dataset"
+    assert [r.method for r in sent] == ["POST"]
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_not_found_error(client):
-    """Test handling not found errors."""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_response.json.return_value = {"error": "Not found"}
-    mock_response.text = "Not found"
-
-    with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-
-        with pytest.raises(NotFoundError):
-            await client.list_datasets()
+@pytest.mark.parametrize(
+    "method,kwargs",
+    [
+        ("add", {"data": "test", "dataset_name": None, "dataset_id": None}),
+        ("cognify", {"datasets": None, "dataset_ids": None}),
+        ("search", {"query": ""}),
+        ("create_dataset", {"name": ""}),
+    ],
+    ids=[
+        "add-missing-dataset",
+        "cognify-missing-datasets",
+        "search-empty-query",
+        "create-empty-name",
+    ],
+)
+async def test_validation_error(client, method, kwargs):
+    """Test that invalid arguments raise ValidationError before any request is sent."""
+    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+        with pytest.raises(ValidationError):
+            await getattr(client, method)(**kwargs)
+        mock_request.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_server_error(client):
-    """Test handling server errors."""
-    mock_response = MagicMock()
-    mock_response.status_code = 500
-    mock_response.json.return_value = {"error": "Internal server error"}
-    mock_response.text = "Internal server error"
-
-    with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
+@pytest.mark.parametrize(
+    "status,error_class",
+    [(401, AuthenticationError), (404, NotFoundError), (500, ServerError)],
+)
+async def test_error_status_mapping(status, error_class):
+    """Test that error statuses raise the matching exception."""
+    client = _error_client(status)
 
-        with pytest.raises(ServerError):
-            await client.list_datasets()
+    with pytest.raises(error_class):
+        await client.list_datasets()
+    await client.close()
 
 
 @pytest.mark.asyncio
@@ -276,6 +280,14 @@ async def test_close(client):
         mock_close.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_aclose(client):
+    """Test aclose() closes the shared HTTP client like close()."""
+    with patch.object(client.client, "aclose", new_callable=AsyncMock) as mock_close:
+        await client.aclose()
+        mock_close.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_context_manager(client):
     """Test using client as async context manager."""
@@ -315,6 +327,61 @@ async def test_client_initialization_url_normalization():
     assert client.api_url == "http://localhost:8000"
 
 
+def test_clients_share_ssl_context():
+    """Test clients reuse one TLS context instead of reloading CA certificates each time."""
+    first = CogneeClient(api_url="https://a:8000")
+    second = CogneeClient(api_url="https://b:8000")
+
+    first_ctx = first.client._transport._pool._ssl_context
+    assert first_ctx is second.client._transport._pool._ssl_context
+    assert first_ctx.verify_mode == ssl.CERT_REQUIRED
+
+
+@pytest.mark.asyncio
+async def test_shared_connection_pool():
+    """Test clients with share_connection_pool reuse one transport until shutdown()."""
+    import httpx
+
+    first = CogneeClient(api_url="http://a:8000", share_connection_pool=True, enable_http2=False)
+    second = CogneeClient(api_url="http://b:8000", share_connection_pool=True, enable_http2=False)
+    other = CogneeClient(
+        api_url="http://a:8000",
+        share_connection_pool=True,
+        enable_http2=False,
+        max_connections=10,
+    )
+    try:
+        assert first.client._transport is second.client._transport
+        assert first.client._transport is not other.client._transport
+
+        with patch.object(
+            httpx.AsyncHTTPTransport, "aclose", new_callable=AsyncMock
+        ) as mock_transport_close:
+            await first.close()
+            mock_transport_close.assert_not_called()
+
+            await CogneeClient.shutdown()
+            assert mock_transport_close.await_count == 2
+        assert CogneeClient._shared_transports == {}
+    finally:
+        await CogneeClient.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_custom_transport_takes_precedence_over_shared_pool():
+    """Test that an explicit transport is used instead of a shared pool."""
+    client = _mock_transport_client(_HEALTH_ROUTES)
+    transport = client.client._transport
+    shared = CogneeClient(
+        api_url="http://localhost:8000", share_connection_pool=True, transport=transport
+    )
+
+    assert shared.client._transport is transport
+    assert shared.share_connection_pool is False
+    assert CogneeClient._shared_transports == {}
+    await client.close()
+
+
 @pytest.mark.asyncio
 async def test_close_idempotency(client):
     """Test that close() can be called multiple times safely."""
@@ -5,31 +5,138 @@
 import asyncio
 import json
 import logging
-import os
-import tempfile
-import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import httpx
 import pytest
 
+try:
+    import websockets.exceptions
+except ImportError:
+    websockets = None
+
 from cognee_sdk import CogneeClient
 from cognee_sdk.exceptions import (
     AuthenticationError,
     CogneeAPIError,
     CogneeSDKError,
     ServerError,
-    ValidationError,
 )
 from cognee_sdk.models import AddResult
 
+# 错误响应需要关联请求对象
+_REQUEST = httpx.Request("GET", "http://localhost:8000/health")
+
+# 测试共用的ID、响应和消息，在模块加载时构建一次
+_DATA_ID = uuid4()
+_DATASET_ID = uuid4()
+_OTHER_DATASET_ID = uuid4()
+_PIPELINE_RUN_ID = uuid4()
+_RUN_ID = uuid4()
+# AddResult 不可变，mock 的 add() 调用可以共享同一个实例
+_ADD_RESULT = AddResult(status="success", message="Added", data_id=_DATA_ID)
+_HEALTH_RESP = httpx.Response(200, json={"status": "ok"})
+_HTTP_500_ERROR = httpx.HTTPStatusError(
+    "Server Error", request=_REQUEST, response=httpx.Response(500, request=_REQUEST)
+)
+_HTTP_400_ERROR = httpx.HTTPStatusError(
+    "Bad Request", request=_REQUEST, response=httpx.Response(400, request=_REQUEST)
+)
+_WS_MESSAGES = (
+    json.dumps({"status": "processing", "message": "Step 1"}),
+    json.dumps({"status": "processing", "message": "Step 2"}),
+    json.dumps({"status": "completed", "message": "Done"}),
+)
+
+
+# 当前测试的响应模板，由 _respond() 设置
+_current_response: ContextVar[httpx.Response | None] = ContextVar(
+    "_current_response", default=None
+)
+_sent_requests: ContextVar[list[httpx.Request]] = ContextVar("_sent_requests")
+
+
+def _dispatch(request: httpx.Request) -> httpx.Response:
+    """MockTransport 处理函数：按当前测试设置的模板返回一个新的响应"""
+    template = _current_response.get()
+    if template is None:
+        raise AssertionError(f"Unexpected request: {request.method} {request.url}")
+    _sent_requests.get().append(request)
+    return httpx.Response(
+        template.status_code, headers=template.headers, content=template.content
+    )
+
+
+@contextmanager
+def _respond(response: httpx.Response) -> Iterator[list[httpx.Request]]:
+    """让共享客户端的请求都返回 response 的副本，并返回已发送请求的列表"""
+    sent: list[httpx.Request] = []
+    response_token = _current_response.set(response)
+    sent_token = _sent_requests.set(sent)
+    try:
+        yield sent
+    finally:
+        _sent_requests.reset(sent_token)
+        _current_response.reset(response_token)
+
+
+@pytest.fixture(scope="module")
+def base_client():
+    """模块内共享的客户端；请求经由 MockTransport 发送，无需每个测试重新创建"""
+    client = CogneeClient(
+        api_url="http://localhost:8000", transport=httpx.MockTransport(_dispatch)
+    )
+    yield client
+    asyncio.run(client.close())
+
+
+@pytest.fixture(scope="module")
+def base_logging_client():
+    """模块内共享的启用日志的客户端"""
+    client = CogneeClient(
+        api_url="http://localhost:8000",
+        enable_logging=True,
+        transport=httpx.MockTransport(_dispatch),
+    )
+    yield client
+    asyncio.run(client.close())
+
+
+def _isolate(client, monkeypatch):
+    """为共享客户端的每个测试重置可变状态（响应缓存、URL缓存、批量端点探测结果、进行中的健康检查）"""
+    monkeypatch.setattr(client, "_cache", {})
+    monkeypatch.setattr(client, "_urls", {})
+    monkeypatch.setattr(client, "_batch_add_supported", None)
+    monkeypatch.setattr(client, "_health_check_task", None)
+    return client
+
+
+@pytest.fixture
+def client(base_client, monkeypatch):
+    """共享客户端，每个测试使用独立的客户端状态"""
+    return _isolate(base_client, monkeypatch)
+
+
+@pytest.fixture
+def logging_client(base_logging_client, monkeypatch):
+    """共享的启用日志的客户端，每个测试使用独立的客户端状态"""
+    return _isolate(base_logging_client, monkeypatch)
+
+
+@pytest.fixture
+def no_retry_delay(client, monkeypatch):
+    """重试之间不等待（退避延迟为0），无需 mock asyncio.sleep"""
+    monkeypatch.setattr(client, "retry_delay", 0)
+
 
 class TestLoggingFeature:
     """测试日志功能（119-127行）"""
 
-    @pytest.mark.asyncio
     async def test_logging_enabled(self):
         """测试启用日志功能"""
         client = CogneeClient(
@@ -40,7 +147,6 @@ class TestLoggingFeature:
         assert client.logger.name == "cognee_sdk"
         assert client.logger.level == logging.DEBUG
 
-    @pytest.mark.asyncio
     async def test_logging_disabled(self):
         """测试禁用日志功能"""
         client = CogneeClient(
@@ -49,7 +155,6 @@ class TestLoggingFeature:
         )
         assert client.logger is None
 
-    @pytest.mark.asyncio
     async def test_logging_with_existing_handler(self):
         """测试日志功能，当logger已有handler时"""
         # 创建一个已有handler的logger
@@ -57,30 +162,26 @@ class TestLoggingFeature:
         existing_handler = logging.StreamHandler()
         existing_logger.addHandler(existing_handler)
 
-        client = CogneeClient(
-            api_url="http://localhost:8000",
-            enable_logging=True,
-        )
-        # 应该不会重复添加handler
-        assert client.logger is not None
+        try:
+            client = CogneeClient(
+                api_url="http://localhost:8000",
+                enable_logging=True,
+            )
+            # 应该不会重复添加handler
+            assert client.logger is not None
+        finally:
+            # 移除测试添加的handler，避免影响同一进程中的其他测试
+            existing_logger.removeHandler(existing_handler)
 
 
 class TestRequestLogging:
     """测试请求日志（279行）"""
 
-    @pytest.mark.asyncio
-    async def test_request_logging(self):
+    async def test_request_logging(self, logging_client):
         """测试请求日志记录"""
-        client = CogneeClient(
-            api_url="http://localhost:8000",
-            enable_logging=True,
-        )
+        client = logging_client
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "ok"}
-
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(_HEALTH_RESP):
             await client.health_check()
 
         # 验证logger被调用（通过检查是否有debug调用）
@@ -90,89 +191,59 @@ class TestRequestLogging:
 class TestInterceptors:
     """测试请求和响应拦截器（270-275, 303-308行）"""
 
-    @pytest.mark.asyncio
-    async def test_request_interceptor_success(self):
+    async def test_request_interceptor_success(self, client, monkeypatch):
         """测试请求拦截器成功执行"""
         interceptor_called = []
 
         def request_interceptor(method, url, headers):
             interceptor_called.append((method, url, headers))
 
-        client = CogneeClient(
-            api_url="http://localhost:8000",
-            request_interceptor=request_interceptor,
-        )
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "ok"}
+        monkeypatch.setattr(client, "request_interceptor", request_interceptor)
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(_HEALTH_RESP):
             await client.health_check()
 
         assert len(interceptor_called) > 0
 
-    @pytest.mark.asyncio
-    async def test_request_interceptor_failure(self):
+    async def test_request_interceptor_failure(self, logging_client, monkeypatch):
         """测试请求拦截器失败时的处理（274-275行）"""
         def request_interceptor(method, url, headers):
             raise Exception("Interceptor error")
 
-        client = CogneeClient(
-            api_url="http://localhost:8000",
-            request_interceptor=request_interceptor,
-            enable_logging=True,  # 需要logger来记录警告
-        )
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "ok"}
+        # 需要logger来记录警告
+        client = logging_client
+        monkeypatch.setattr(client, "request_interceptor", request_interceptor)
 
         # 拦截器失败不应该影响请求
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(_HEALTH_RESP):
             result = await client.health_check()
             assert result is not None
 
-    @pytest.mark.asyncio
-    async def test_response_interceptor_success(self):
+    async def test_response_interceptor_success(self, client, monkeypatch):
         """测试响应拦截器成功执行"""
         interceptor_called = []
 
         def response_interceptor(response):
             interceptor_called.append(response)
 
-        client = CogneeClient(
-            api_url="http://localhost:8000",
-            response_interceptor=response_interceptor,
-        )
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "ok"}
+        monkeypatch.setattr(client, "response_interceptor", response_interceptor)
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(_HEALTH_RESP):
             await client.health_check()
 
         assert len(interceptor_called) > 0
 
-    @pytest.mark.asyncio
-    async def test_response_interceptor_failure(self):
+    async def test_response_interceptor_failure(self, logging_client, monkeypatch):
         """测试响应拦截器失败时的处理（307-308行）"""
         def response_interceptor(response):
             raise Exception("Interceptor error")
 
-        client = CogneeClient(
-            api_url="http://localhost:8000",
-            response_interceptor=response_interceptor,
-            enable_logging=True,  # 需要logger来记录警告
-        )
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "ok"}
+        # 需要logger来记录警告
+        client = logging_client
+        monkeypatch.setattr(client, "response_interceptor", response_interceptor)
 
         # 拦截器失败不应该影响请求
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(_HEALTH_RESP):
             result = await client.health_check()
             assert result is not None
 
@@ -180,46 +251,31 @@ class TestInterceptors:
 class TestErrorHandling:
     """测试错误处理分支"""
 
-    @pytest.mark.asyncio
-    async def test_json_decode_error(self):
+    async def test_json_decode_error(self, client):
         """测试JSON解析错误（171-174行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
+        mock_response = httpx.Response(200, text="invalid json {")
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "invalid json {"
-        mock_response.json.side_effect = json.JSONDecodeError("Expecting value", "doc", 0)
-
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             with pytest.raises(CogneeAPIError) as exc_info:
                 await client.health_check()
             assert "Invalid JSON response" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_json_decode_error_empty_response(self):
+    async def test_json_decode_error_empty_response(self, client):
         """测试JSON解析错误，空响应"""
-        client = CogneeClient(api_url="http://localhost:8000")
+        mock_response = httpx.Response(200, text="")
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = ""
-        mock_response.json.side_effect = json.JSONDecodeError("Expecting value", "doc", 0)
-
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             with pytest.raises(CogneeAPIError) as exc_info:
                 await client.health_check()
             assert "Invalid JSON response" in str(exc_info.value)
             assert "empty response" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_retry(self):
+    async def test_rate_limit_retry(self, client, no_retry_delay):
         """测试429速率限制重试（318-322行）"""
-        client = CogneeClient(api_url="http://localhost:8000", max_retries=3)
-
-        # 第一次返回429，第二次返回200
+        # 第一次返回429，第二次返回200；仍可重试的429不会读取响应体
         mock_responses = [
-            MagicMock(status_code=429, text="Rate limit exceeded"),
-            MagicMock(status_code=200, json=lambda: {"status": "ok"}),
+            httpx.Response(429),
+            _HEALTH_RESP,
         ]
 
         call_count = 0
@@ -231,42 +287,30 @@ class TestErrorHandling:
             return response
 
         with patch.object(client.client, "request", side_effect=mock_request):
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                result = await client.health_check()
-                assert result is not None
+            result = await client.health_check()
+            assert result is not None
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_max_retries(self):
+    async def test_rate_limit_max_retries(self, client, monkeypatch, no_retry_delay):
         """测试429速率限制达到最大重试次数（322行）"""
-        client = CogneeClient(api_url="http://localhost:8000", max_retries=2)
+        monkeypatch.setattr(client, "max_retries", 2)
 
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-        mock_response.text = "Rate limit exceeded"
-        mock_response.json.return_value = {"error": "Rate limit exceeded"}
+        mock_response = httpx.Response(429, json={"error": "Rate limit exceeded"})
 
-        with patch.object(client.client, "request", return_value=mock_response):
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                with pytest.raises(CogneeAPIError):
-                    await client.health_check()
+        with _respond(mock_response):
+            with pytest.raises(CogneeAPIError):
+                await client.health_check()
 
-    @pytest.mark.asyncio
-    async def test_5xx_retry_exhausted(self):
+    async def test_5xx_retry_exhausted(self, client, monkeypatch, no_retry_delay):
         """测试5xx错误重试耗尽（335-336行）"""
-        client = CogneeClient(api_url="http://localhost:8000", max_retries=2)
+        monkeypatch.setattr(client, "max_retries", 2)
 
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_response.json.return_value = {"error": "Internal Server Error"}
+        mock_response = httpx.Response(500, json={"error": "Internal Server Error"})
 
-        with patch.object(client.client, "request", return_value=mock_response):
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                with pytest.raises(ServerError):
-                    await client.health_check()
+        with _respond(mock_response):
+            with pytest.raises(ServerError):
+                await client.health_check()
 
-    @pytest.mark.asyncio
-    async def test_unreachable_error_handling(self):
+    async def test_unreachable_error_handling(self, client, monkeypatch):
         """测试不可达的错误处理路径（339行）
         
         注意：339行是一个fallback，理论上不应该被执行，因为所有>=400的状态码
@@ -275,102 +319,62 @@ class TestErrorHandling:
         这在HTTP协议中是不可能的。我们可以通过直接调用_handle_error_response来
         间接验证这个路径的存在。
         """
-        client = CogneeClient(api_url="http://localhost:8000", max_retries=1)
+        monkeypatch.setattr(client, "max_retries", 1)
 
         # 由于339行实际上很难触发（所有>=400的状态码都会被前面的分支处理），
         # 我们通过测试_handle_error_response来间接覆盖这个逻辑
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-        mock_response.json.return_value = {"error": "Bad Request"}
+        mock_response = httpx.Response(400, json={"error": "Bad Request"})
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             with pytest.raises(CogneeAPIError):
                 await client.health_check()
 
-    @pytest.mark.asyncio
-    async def test_http_status_error_retry(self):
+    async def test_http_status_error_retry(self, client, no_retry_delay):
         """测试HTTP状态错误重试（352-355行）"""
-        client = CogneeClient(api_url="http://localhost:8000", max_retries=3)
-
         # 第一次抛出HTTPStatusError (5xx)，第二次成功
-        error_response = MagicMock()
-        error_response.status_code = 500
-
-        success_response = MagicMock()
-        success_response.status_code = 200
-        success_response.json.return_value = {"status": "ok"}
-
-        call_count = 0
-
-        async def mock_request(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise httpx.HTTPStatusError("Server Error", request=MagicMock(), response=error_response)
-            return success_response
-
-        with patch.object(client.client, "request", side_effect=mock_request):
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                result = await client.health_check()
-                assert result is not None
+        with patch.object(
+            client.client, "request", side_effect=[_HTTP_500_ERROR, _HEALTH_RESP]
+        ) as mock_request:
+            result = await client.health_check()
+            assert result is not None
+            assert mock_request.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_http_status_error_no_retry(self):
+    async def test_http_status_error_no_retry(self, client):
         """测试HTTP状态错误不重试（4xx）"""
-        client = CogneeClient(api_url="http://localhost:8000", max_retries=3)
-
-        error_response = MagicMock()
-        error_response.status_code = 400
-
-        async def mock_request(*args, **kwargs):
-            raise httpx.HTTPStatusError("Bad Request", request=MagicMock(), response=error_response)
-
-        with patch.object(client.client, "request", side_effect=mock_request):
+        with patch.object(
+            client.client, "request", side_effect=_HTTP_400_ERROR
+        ) as mock_request:
             with pytest.raises(httpx.HTTPStatusError):
                 await client.health_check()
+            assert mock_request.call_count == 1
 
 
 class TestFileUploadEdgeCases:
     """测试文件上传边界情况"""
 
-    @pytest.mark.asyncio
-    async def test_large_file_warning(self):
+    async def test_large_file_warning(self, client, tmp_path):
         """测试大文件警告（464行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        # 创建一个大于100MB的临时文件
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as f:
-            # 写入超过100MB的数据
-            large_data = b"x" * (101 * 1024 * 1024)  # 101MB
-            f.write(large_data)
-            temp_path = Path(f.name)
-
-        try:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
+        # 创建一个大于100MB的临时文件：只设置文件大小（稀疏文件），不实际写入数据
+        temp_path = tmp_path / "large.txt"
+        with open(temp_path, "wb") as f:
+            f.truncate(101 * 1024 * 1024)
+
+        mock_response = httpx.Response(
+            200,
+            json={
                 "status": "success",
                 "message": "Data added",
-                "data_id": str(uuid4()),
-            }
-
-            with patch.object(client.client, "request", return_value=mock_response):
-                with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-                    await client.add(data=temp_path, dataset_name="test-dataset")
-                    # 应该产生警告
-                    assert len(w) > 0
-                    assert any("exceeds recommended limit" in str(warning.message) for warning in w)
-        finally:
-            if temp_path.exists():
-                os.unlink(temp_path)
+                "data_id": str(_DATA_ID),
+            },
+        )
 
-    @pytest.mark.asyncio
-    async def test_file_open_error_streaming(self):
-        """测试文件打开错误（流式上传）（484-487行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
+        with patch.object(client.client, "request", return_value=mock_response):
+            # 应该产生警告
+            with pytest.warns(UserWarning, match="exceeds recommended limit"):
+                await client.add(data=temp_path, dataset_name="test-dataset")
 
+    async def test_file_open_error_streaming(self, client):
+        """测试文件打开错误（流式上传）（484-487行）"""
         # 创建一个不存在的文件路径
         non_existent_file = Path("/nonexistent/path/to/file.txt")
 
@@ -378,42 +382,28 @@ class TestFileUploadEdgeCases:
             await client.add(data=non_existent_file, dataset_name="test-dataset")
         assert "Failed to open file" in str(exc_info.value) or "Failed to read file" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_file_read_error(self):
+    async def test_file_read_error(self, client, tmp_path):
         """测试文件读取错误（498-501行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 创建一个文件但模拟读取失败
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as f:
-            f.write(b"test content")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "test.txt"
+        temp_path.write_bytes(b"test content")
 
-        try:
-            # 模拟文件读取失败
-            with patch("builtins.open", side_effect=OSError("Permission denied")):
-                with pytest.raises(CogneeSDKError) as exc_info:
-                    await client.add(data=temp_path, dataset_name="test-dataset")
-                assert "Failed to read file" in str(exc_info.value)
-        finally:
-            if temp_path.exists():
-                os.unlink(temp_path)
+        # 模拟文件读取失败
+        with patch("builtins.open", side_effect=OSError("Permission denied")):
+            with pytest.raises(CogneeSDKError) as exc_info:
+                await client.add(data=temp_path, dataset_name="test-dataset")
+            assert "Failed to read file" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_path_open_error_streaming(self):
+    async def test_path_open_error_streaming(self, client):
         """测试Path对象打开错误（流式上传）（539-540行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 创建一个不存在的Path对象
         non_existent_path = Path("/nonexistent/path/to/file.txt")
 
         with pytest.raises(CogneeSDKError):
             await client.add(data=non_existent_path, dataset_name="test-dataset")
 
-    @pytest.mark.asyncio
-    async def test_binary_io_seek_error(self):
+    async def test_binary_io_seek_error(self, client):
         """测试BinaryIO seek错误（566-567, 574-575, 582-583行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 创建一个不支持seek的文件对象
         class NonSeekableIO:
             def read(self):
@@ -427,13 +417,14 @@ class TestFileUploadEdgeCases:
 
         non_seekable = NonSeekableIO()
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Data added",
-            "data_id": str(uuid4()),
-        }
+        mock_response = httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "message": "Data added",
+                "data_id": str(_DATA_ID),
+            },
+        )
 
         # 应该能处理不支持seek的文件对象
         with patch.object(client.client, "request", return_value=mock_response):
@@ -444,11 +435,8 @@ class TestFileUploadEdgeCases:
 class TestBatchOperationsEdgeCases:
     """测试批量操作边界情况"""
 
-    @pytest.mark.asyncio
-    async def test_add_batch_empty_list_with_return_errors(self):
+    async def test_add_batch_empty_list_with_return_errors(self, client):
         """测试空列表，return_errors=True（1434-1435行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         results, errors = await client.add_batch(
             data_list=[],
             dataset_name="test-dataset",
@@ -457,11 +445,8 @@ class TestBatchOperationsEdgeCases:
         assert results == []
         assert errors == []
 
-    @pytest.mark.asyncio
-    async def test_add_batch_empty_list_without_return_errors(self):
+    async def test_add_batch_empty_list_without_return_errors(self, client):
         """测试空列表，return_errors=False（1436行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         results = await client.add_batch(
             data_list=[],
             dataset_name="test-dataset",
@@ -469,11 +454,8 @@ class TestBatchOperationsEdgeCases:
         )
         assert results == []
 
-    @pytest.mark.asyncio
-    async def test_add_batch_continue_on_error_task_exception(self):
+    async def test_add_batch_continue_on_error_task_exception(self, client):
         """测试continue_on_error时任务本身抛出异常（1468-1471行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         async def failing_add(*args, **kwargs):
             raise Exception("Task failed")
 
@@ -488,11 +470,8 @@ class TestBatchOperationsEdgeCases:
             assert all(r is None for r in results)
             assert len(errors) == 2
 
-    @pytest.mark.asyncio
-    async def test_add_batch_continue_on_error_without_return_errors(self):
+    async def test_add_batch_continue_on_error_without_return_errors(self, client):
         """测试continue_on_error，return_errors=False（1481-1483行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         call_count = 0
 
         async def mock_add(*args, **kwargs):
@@ -500,7 +479,7 @@ class TestBatchOperationsEdgeCases:
             call_count += 1
             if call_count == 2:
                 raise ServerError("Error", 500)
-            return AddResult(status="success", message="Added", data_id=uuid4())
+            return _ADD_RESULT
 
         with patch.object(client, "add", side_effect=mock_add):
             results = await client.add_batch(
@@ -513,11 +492,8 @@ class TestBatchOperationsEdgeCases:
             assert len(results) == 2
             assert all(isinstance(r, AddResult) for r in results)
 
-    @pytest.mark.asyncio
-    async def test_add_batch_stop_on_error_with_return_errors(self):
+    async def test_add_batch_stop_on_error_with_return_errors(self, client):
         """测试stop on error，return_errors=True（1496-1498行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         call_count = 0
 
         async def mock_add(*args, **kwargs):
@@ -525,7 +501,7 @@ class TestBatchOperationsEdgeCases:
             call_count += 1
             if call_count == 2:
                 raise ServerError("Error", 500)
-            return AddResult(status="success", message="Added", data_id=uuid4())
+            return _ADD_RESULT
 
         with patch.object(client, "add", side_effect=mock_add):
             with pytest.raises(ServerError):
@@ -540,78 +516,59 @@ class TestBatchOperationsEdgeCases:
 class TestSearchEdgeCases:
     """测试搜索边界情况"""
 
-    @pytest.mark.asyncio
-    async def test_search_return_raw_list(self):
+    async def test_search_return_raw_list(self, client):
         """测试返回原始列表（888-893行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {"id": "1", "text": "result 1"},
-            {"id": "2", "text": "result 2"},
-        ]
+        mock_response = httpx.Response(
+            200,
+            json=[
+                {"id": "1", "text": "result 1"},
+                {"id": "2", "text": "result 2"},
+            ],
+        )
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             results = await client.search("test query", return_type="raw")
             assert isinstance(results, list)
             assert len(results) == 2
 
-    @pytest.mark.asyncio
-    async def test_search_return_raw_dict(self):
+    async def test_search_return_raw_dict(self, client):
         """测试返回原始字典（888-893行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "1", "text": "result 1"}
+        mock_response = httpx.Response(200, json={"id": "1", "text": "result 1"})
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             results = await client.search("test query", return_type="raw")
             assert isinstance(results, list)
             assert len(results) == 1
 
-    @pytest.mark.asyncio
-    async def test_search_return_raw_other(self):
+    async def test_search_return_raw_other(self, client):
         """测试返回原始其他类型（888-893行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = "string result"
+        mock_response = httpx.Response(200, json="string result")
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             results = await client.search("test query", return_type="raw")
             assert isinstance(results, list)
             assert len(results) == 0 or len(results) == 1
 
-    @pytest.mark.asyncio
-    async def test_search_parse_failure_fallback(self):
+    async def test_search_parse_failure_fallback(self, client):
         """测试解析失败回退（906-913行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 返回无法解析为SearchResult的列表
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {"invalid": "data"},  # 缺少必需字段
-        ]
+        mock_response = httpx.Response(
+            200,
+            json=[
+                {"invalid": "data"},  # 缺少必需字段
+            ],
+        )
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             results = await client.search("test query", return_type="parsed")
             # 应该回退到原始数据
             assert isinstance(results, list)
 
-    @pytest.mark.asyncio
-    async def test_search_fallback_to_dict_list(self):
+    async def test_search_fallback_to_dict_list(self, client):
         """测试回退到字典列表（911-913行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"single": "result"}
+        mock_response = httpx.Response(200, json={"single": "result"})
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             results = await client.search("test query", return_type="parsed")
             # 应该回退
             assert isinstance(results, list)
@@ -620,25 +577,16 @@ class TestSearchEdgeCases:
 class TestWebSocketFeature:
     """测试WebSocket功能（1356-1381行）"""
 
-    @pytest.mark.asyncio
-    async def test_websocket_subscribe(self):
-        """测试WebSocket订阅功能"""
-        pytest.importorskip("websockets")
-
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        pipeline_run_id = uuid4()
+    pytestmark = pytest.mark.skipif(websockets is None, reason="websockets not installed")
 
+    async def test_websocket_subscribe(self, client):
+        """测试WebSocket订阅功能"""
         # 模拟WebSocket连接和消息
         mock_websocket = AsyncMock()
         mock_websocket.__aenter__ = AsyncMock(return_value=mock_websocket)
         mock_websocket.__aexit__ = AsyncMock(return_value=None)
 
-        messages = [
-            json.dumps({"status": "processing", "message": "Step 1"}),
-            json.dumps({"status": "processing", "message": "Step 2"}),
-            json.dumps({"status": "completed", "message": "Done"}),
-        ]
+        messages = list(_WS_MESSAGES)
 
         async def mock_recv():
             if messages:
@@ -649,23 +597,15 @@ class TestWebSocketFeature:
 
         with patch("websockets.connect", return_value=mock_websocket):
             results = []
-            async for update in client.subscribe_cognify_updates(pipeline_run_id):
+            async for update in client.subscribe_cognify_updates(_PIPELINE_RUN_ID):
                 results.append(update)
                 if update.get("status") == "completed":
                     break
 
             assert len(results) > 0
 
-    @pytest.mark.asyncio
-    async def test_websocket_connection_closed(self):
+    async def test_websocket_connection_closed(self, client):
         """测试WebSocket连接关闭（1378-1379行）"""
-        pytest.importorskip("websockets")
-        import websockets.exceptions
-
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        pipeline_run_id = uuid4()
-
         mock_websocket = AsyncMock()
         mock_websocket.__aenter__ = AsyncMock(return_value=mock_websocket)
         mock_websocket.__aexit__ = AsyncMock(return_value=None)
@@ -675,21 +615,14 @@ class TestWebSocketFeature:
 
         with patch("websockets.connect", return_value=mock_websocket):
             results = []
-            async for update in client.subscribe_cognify_updates(pipeline_run_id):
+            async for update in client.subscribe_cognify_updates(_PIPELINE_RUN_ID):
                 results.append(update)
 
             # 连接关闭时应该正常退出
             assert True  # 没有异常就说明正常
 
-    @pytest.mark.asyncio
-    async def test_websocket_error(self):
+    async def test_websocket_error(self, client):
         """测试WebSocket错误（1380-1381行）"""
-        pytest.importorskip("websockets")
-
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        pipeline_run_id = uuid4()
-
         mock_websocket = AsyncMock()
         mock_websocket.__aenter__ = AsyncMock(return_value=mock_websocket)
         mock_websocket.__aexit__ = AsyncMock(return_value=None)
@@ -697,19 +630,14 @@ class TestWebSocketFeature:
 
         with patch("websockets.connect", return_value=mock_websocket):
             with pytest.raises(ServerError) as exc_info:
-                async for update in client.subscribe_cognify_updates(pipeline_run_id):
+                async for update in client.subscribe_cognify_updates(_PIPELINE_RUN_ID):
                     pass
             assert "WebSocket error" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_websocket_with_https(self):
         """测试HTTPS URL转换为WSS（1356行）"""
-        pytest.importorskip("websockets")
-
         client = CogneeClient(api_url="https://api.example.com")
 
-        pipeline_run_id = uuid4()
-
         mock_websocket = AsyncMock()
         mock_websocket.__aenter__ = AsyncMock(return_value=mock_websocket)
         mock_websocket.__aexit__ = AsyncMock(return_value=None)
@@ -720,7 +648,7 @@ class TestWebSocketFeature:
         with patch("websockets.connect") as mock_connect:
             mock_connect.return_value = mock_websocket
             try:
-                async for _ in client.subscribe_cognify_updates(pipeline_run_id):
+                async for _ in client.subscribe_cognify_updates(_PIPELINE_RUN_ID):
                     break
             except:
                 pass
@@ -732,18 +660,13 @@ class TestWebSocketFeature:
             if url:
                 assert url.startswith("wss://")
 
-    @pytest.mark.asyncio
     async def test_websocket_with_token(self):
         """测试WebSocket带token（1361-1362行）"""
-        pytest.importorskip("websockets")
-
         client = CogneeClient(
             api_url="http://localhost:8000",
             api_token="test-token",
         )
 
-        pipeline_run_id = uuid4()
-
         mock_websocket = AsyncMock()
         mock_websocket.__aenter__ = AsyncMock(return_value=mock_websocket)
         mock_websocket.__aexit__ = AsyncMock(return_value=None)
@@ -754,7 +677,7 @@ class TestWebSocketFeature:
         with patch("websockets.connect") as mock_connect:
             mock_connect.return_value = mock_websocket
             try:
-                async for _ in client.subscribe_cognify_updates(pipeline_run_id):
+                async for _ in client.subscribe_cognify_updates(_PIPELINE_RUN_ID):
                     break
             except:
                 pass
@@ -772,132 +695,109 @@ class TestWebSocketFeature:
 class TestOtherEdgeCases:
     """测试其他边界情况"""
 
-    @pytest.mark.asyncio
-    async def test_non_retryable_status_codes(self):
+    @pytest.mark.parametrize("status_code", [400, 401, 403, 404, 422])
+    async def test_non_retryable_status_codes(self, client, status_code):
         """测试不可重试的状态码（323-325行）"""
-        client = CogneeClient(api_url="http://localhost:8000", max_retries=3)
+        mock_response = httpx.Response(status_code, json={"error": f"Error {status_code}"})
 
-        for status_code in [400, 401, 403, 404, 422]:
-            mock_response = MagicMock()
-            mock_response.status_code = status_code
-            mock_response.text = f"Error {status_code}"
-            mock_response.json.return_value = {"error": f"Error {status_code}"}
-
-            with patch.object(client.client, "request", return_value=mock_response):
-                with pytest.raises(CogneeAPIError):
-                    await client.health_check()
+        with _respond(mock_response) as sent:
+            with pytest.raises(CogneeAPIError):
+                await client.health_check()
+            # 不可重试的状态码只发送一次请求
+            assert len(sent) == 1
 
-    @pytest.mark.asyncio
-    async def test_other_4xx_errors(self):
+    async def test_other_4xx_errors(self, client):
         """测试其他4xx错误（327-328行）"""
-        client = CogneeClient(api_url="http://localhost:8000", max_retries=3)
-
         # 测试不在NON_RETRYABLE_STATUS_CODES中的4xx错误
-        mock_response = MagicMock()
-        mock_response.status_code = 418  # I'm a teapot
-        mock_response.text = "I'm a teapot"
-        mock_response.json.return_value = {"error": "I'm a teapot"}
+        mock_response = httpx.Response(418, json={"error": "I'm a teapot"})
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             with pytest.raises(CogneeAPIError):
                 await client.health_check()
 
-    @pytest.mark.asyncio
-    async def test_cognify_default_result(self):
+    async def test_cognify_default_result(self, client):
         """测试cognify默认结果（817行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "default": {
-                "status": "success",
-                "message": "Cognify completed",
-                "pipeline_run_id": str(uuid4()),
-            }
-        }
+        mock_response = httpx.Response(
+            200,
+            json={
+                "default": {
+                    "status": "success",
+                    "message": "Cognify completed",
+                    "pipeline_run_id": str(_PIPELINE_RUN_ID),
+                }
+            },
+        )
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             result = await client.cognify(datasets=["test-dataset"])
             assert result is not None
 
-    @pytest.mark.asyncio
-    async def test_update_result_fallback(self):
+    async def test_update_result_fallback(self, client):
         """测试update结果回退（1021行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
         # 不包含data_id，会触发fallback
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Update completed",
-        }
+        mock_response = httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "message": "Update completed",
+            },
+        )
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             result = await client.update(
-                data_id=uuid4(),
-                dataset_id=uuid4(),
+                data_id=_DATA_ID,
+                dataset_id=_DATASET_ID,
                 data="test data",
             )
             assert result.status == "success"
             assert result.data_id is None  # fallback时data_id为None
 
-    @pytest.mark.asyncio
-    async def test_update_file_close_error(self):
+    async def test_update_file_close_error(self, client, tmp_path):
         """测试update文件关闭错误（1027-1028行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 创建一个临时文件
-        with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".txt") as f:
-            f.write("test content")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "test.txt"
+        temp_path.write_text("test content")
 
-        try:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
+        mock_response = httpx.Response(
+            200,
+            json={
                 "status": "success",
                 "message": "Updated",
-                "data_id": str(uuid4()),
-            }
-
-            # 模拟文件关闭时出错
-            mock_file = MagicMock()
-            mock_file.close = MagicMock(side_effect=Exception("Close error"))
-            mock_file.read = MagicMock(return_value=b"test content")
-            mock_file.seek = MagicMock()
-            mock_file.tell = MagicMock(return_value=0)
-
-            with patch.object(client.client, "request", return_value=mock_response):
-                with patch("builtins.open", return_value=mock_file):
-                    # 应该能正常处理，即使关闭文件时出错
-                    result = await client.update(
-                        data_id=uuid4(),
-                        dataset_id=uuid4(),
-                        data=temp_path,
-                    )
-                    assert result is not None
-        finally:
-            if temp_path.exists():
-                os.unlink(temp_path)
-
-    @pytest.mark.asyncio
-    async def test_memify_with_all_params(self):
-        """测试memify所有参数（1232, 1238, 1240行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
+                "data_id": str(_DATA_ID),
+            },
+        )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Memify completed",
-            "pipeline_run_id": str(uuid4()),
-        }
+        # 模拟文件关闭时出错
+        mock_file = MagicMock()
+        mock_file.close = MagicMock(side_effect=Exception("Close error"))
+        mock_file.read = MagicMock(return_value=b"test content")
+        mock_file.seek = MagicMock()
+        mock_file.tell = MagicMock(return_value=0)
 
         with patch.object(client.client, "request", return_value=mock_response):
+            with patch("builtins.open", return_value=mock_file):
+                # 应该能正常处理，即使关闭文件时出错
+                result = await client.update(
+                    data_id=_DATA_ID,
+                    dataset_id=_DATASET_ID,
+                    data=temp_path,
+                )
+                assert result is not None
+
+    async def test_memify_with_all_params(self, client):
+        """测试memify所有参数（1232, 1238, 1240行）"""
+        mock_response = httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "message": "Memify completed",
+                "pipeline_run_id": str(_PIPELINE_RUN_ID),
+            },
+        )
+
+        with _respond(mock_response):
             result = await client.memify(
-                dataset_id=uuid4(),
+                dataset_id=_DATASET_ID,
                 dataset_name="test-dataset",
                 extraction_tasks=["task1"],
                 enrichment_tasks=["task2"],
@@ -906,39 +806,36 @@ class TestOtherEdgeCases:
             )
             assert result is not None
 
-    @pytest.mark.asyncio
-    async def test_sync_result_multiple(self):
+    async def test_sync_result_multiple(self, client):
         """测试sync多个结果（1306-1308行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "dataset1": {
-                "status": "success",
-                "message": "Synced",
-                "run_id": str(uuid4()),
-                "dataset_ids": [str(uuid4())],
-                "dataset_names": ["dataset1"],
-            },
-            "dataset2": {
-                "status": "success",
-                "message": "Synced",
-                "run_id": str(uuid4()),
-                "dataset_ids": [str(uuid4())],
-                "dataset_names": ["dataset2"],
+        mock_response = httpx.Response(
+            200,
+            json={
+                "dataset1": {
+                    "status": "success",
+                    "message": "Synced",
+                    "run_id": str(_RUN_ID),
+                    "dataset_ids": [str(_DATASET_ID)],
+                    "dataset_names": ["dataset1"],
+                },
+                "dataset2": {
+                    "status": "success",
+                    "message": "Synced",
+                    "run_id": str(_RUN_ID),
+                    "dataset_ids": [str(_OTHER_DATASET_ID)],
+                    "dataset_names": ["dataset2"],
+                },
             },
-        }
+        )
 
-        with patch.object(client.client, "request", return_value=mock_response):
-            result = await client.sync_to_cloud(dataset_ids=[uuid4(), uuid4()])
+        with _respond(mock_response):
+            result = await client.sync_to_cloud(dataset_ids=[_DATASET_ID, _OTHER_DATASET_ID])
             assert result is not None
             assert result.status == "success"
 
-    @pytest.mark.asyncio
-    async def test_request_failed_unknown_reason(self):
+    async def test_request_failed_unknown_reason(self, client, monkeypatch):
         """测试请求失败未知原因（365-367行）"""
-        client = CogneeClient(api_url="http://localhost:8000", max_retries=1)
+        monkeypatch.setattr(client, "max_retries", 1)
 
         # 模拟一个不会设置last_exception的情况
         # 这很难直接触发，但我们可以通过模拟一个特殊的异常情况
@@ -955,11 +852,8 @@ class TestOtherEdgeCases:
                 # 预期会失败
                 pass
 
-    @pytest.mark.asyncio
-    async def test_file_object_seek_restore_error(self):
+    async def test_file_object_seek_restore_error(self, client):
         """测试文件对象seek恢复错误（601-602行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         class MockFileObject:
             def __init__(self):
                 self.content = b"test content"
@@ -978,24 +872,22 @@ class TestOtherEdgeCases:
 
         mock_file = MockFileObject()
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Data added",
-            "data_id": str(uuid4()),
-        }
+        mock_response = httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "message": "Data added",
+                "data_id": str(_DATA_ID),
+            },
+        )
 
         with patch.object(client.client, "request", return_value=mock_response):
             # 应该能处理seek错误
             result = await client.add(data=mock_file, dataset_name="test-dataset")
             assert result is not None
 
-    @pytest.mark.asyncio
-    async def test_file_object_read_error(self):
+    async def test_file_object_read_error(self, client):
         """测试文件对象读取错误（610-617行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         class FailingFileObject:
             def read(self):
                 raise Exception("Read error")
@@ -1012,11 +904,8 @@ class TestOtherEdgeCases:
             await client.add(data=failing_file, dataset_name="test-dataset")
         assert "Failed to read file object" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_fallback_to_string(self):
+    async def test_fallback_to_string(self, client):
         """测试回退到字符串转换（615-617行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 创建一个不支持常见操作的对象
         class UnusualObject:
             def __str__(self):
@@ -1024,112 +913,94 @@ class TestOtherEdgeCases:
 
         unusual_obj = UnusualObject()
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Data added",
-            "data_id": str(uuid4()),
-        }
+        mock_response = httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "message": "Data added",
+                "data_id": str(_DATA_ID),
+            },
+        )
 
         with patch.object(client.client, "request", return_value=mock_response):
             result = await client.add(data=unusual_obj, dataset_name="test-dataset")
             assert result is not None
 
-    @pytest.mark.asyncio
-    async def test_add_file_close_error(self):
+    async def test_add_file_close_error(self, client, tmp_path):
         """测试add文件关闭错误（723-724行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 创建一个临时文件
-        with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".txt") as f:
-            f.write("test content")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "test.txt"
+        temp_path.write_text("test content")
 
-        try:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
+        mock_response = httpx.Response(
+            200,
+            json={
                 "status": "success",
                 "message": "Data added",
-                "data_id": str(uuid4()),
-            }
-
-            # 模拟文件关闭时出错
-            mock_file = MagicMock()
-            mock_file.close = MagicMock(side_effect=Exception("Close error"))
-            mock_file.read = MagicMock(return_value=b"test content")
-            mock_file.seek = MagicMock()
-            mock_file.tell = MagicMock(return_value=0)
-
-            with patch.object(client.client, "request", return_value=mock_response):
-                with patch("builtins.open", return_value=mock_file):
-                    # 应该能正常处理，即使关闭文件时出错
-                    result = await client.add(data=temp_path, dataset_name="test-dataset")
-                    assert result is not None
-        finally:
-            if temp_path.exists():
-                os.unlink(temp_path)
+                "data_id": str(_DATA_ID),
+            },
+        )
 
-    @pytest.mark.asyncio
-    async def test_search_parse_exception(self):
-        """测试搜索解析异常（906-909行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
+        # 模拟文件关闭时出错
+        mock_file = MagicMock()
+        mock_file.close = MagicMock(side_effect=Exception("Close error"))
+        mock_file.read = MagicMock(return_value=b"test content")
+        mock_file.seek = MagicMock()
+        mock_file.tell = MagicMock(return_value=0)
+
+        with patch.object(client.client, "request", return_value=mock_response):
+            with patch("builtins.open", return_value=mock_file):
+                # 应该能正常处理，即使关闭文件时出错
+                result = await client.add(data=temp_path, dataset_name="test-dataset")
+                assert result is not None
 
+    async def test_search_parse_exception(self, client):
+        """测试搜索解析异常（906-909行）"""
         # 返回一个会导致解析异常的数据结构
-        mock_response = MagicMock()
-        mock_response.status_code = 200
         # 返回一个列表，但其中的项无法解析为SearchResult
-        mock_response.json.return_value = [
-            {"invalid": "data"},  # 缺少必需字段，会导致解析失败
-        ]
+        mock_response = httpx.Response(
+            200,
+            json=[
+                {"invalid": "data"},  # 缺少必需字段，会导致解析失败
+            ],
+        )
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             results = await client.search("test query", return_type="parsed")
             # 应该回退到原始数据
             assert isinstance(results, list)
             assert len(results) == 1
 
-    @pytest.mark.asyncio
-    async def test_login_no_token(self):
+    async def test_login_no_token(self, client):
         """测试login没有token（1151行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
+        mock_response = httpx.Response(200, json={})  # 没有token字段
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {}  # 没有token字段
-
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             with pytest.raises(AuthenticationError) as exc_info:
                 await client.login("test@example.com", "password")
             assert "Token not found in response" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_sync_result_single_dict(self):
+    async def test_sync_result_single_dict(self, client):
         """测试sync单个字典结果（1309行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
         # 返回单个字典，但不是包含run_id的格式
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Synced",
-            "run_id": str(uuid4()),
-            "dataset_ids": [str(uuid4())],
-            "dataset_names": ["dataset1"],
-        }
+        mock_response = httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "message": "Synced",
+                "run_id": str(_RUN_ID),
+                "dataset_ids": [str(_DATASET_ID)],
+                "dataset_names": ["dataset1"],
+            },
+        )
 
-        with patch.object(client.client, "request", return_value=mock_response):
-            result = await client.sync_to_cloud(dataset_ids=[uuid4()])
+        with _respond(mock_response):
+            result = await client.sync_to_cloud(dataset_ids=[_DATASET_ID])
             assert result is not None
             assert result.status == "success"
 
-    @pytest.mark.asyncio
-    async def test_add_batch_task_exception_direct(self):
+    async def test_add_batch_task_exception_direct(self, client):
         """测试批量操作任务直接抛出异常（1470-1471行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 模拟asyncio.gather返回Exception对象（当return_exceptions=True时）
         async def failing_add(*args, **kwargs):
             raise Exception("Task failed directly")
@@ -1146,21 +1017,18 @@ class TestOtherEdgeCases:
             assert all(r is None for r in results)
             assert len(errors) == 2
 
-    @pytest.mark.asyncio
-    async def test_add_batch_stop_on_error_with_errors(self):
+    async def test_add_batch_stop_on_error_with_errors(self, client):
         """测试stop on error，return_errors=True，有错误（1497-1498行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         call_count = 0
 
         async def mock_add(*args, **kwargs):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                return AddResult(status="success", message="Added", data_id=uuid4())
+                return _ADD_RESULT
             elif call_count == 2:
                 raise ServerError("Error", 500)
-            return AddResult(status="success", message="Added", data_id=uuid4())
+            return _ADD_RESULT
 
         with patch.object(client, "add", side_effect=mock_add):
             with pytest.raises(ServerError):
@@ -1171,57 +1039,38 @@ class TestOtherEdgeCases:
                     return_errors=True,
                 )
 
-    @pytest.mark.asyncio
-    async def test_health_check_invalid_format(self):
+    async def test_health_check_invalid_format(self, client):
         """测试health_check无效格式（383行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = "not a dict"  # 不是字典
+        mock_response = httpx.Response(200, json="not a dict")  # 不是字典
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             with pytest.raises(CogneeAPIError) as exc_info:
                 await client.health_check()
             assert "Invalid health check response format" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_large_file_warning_path(self):
+    async def test_large_file_warning_path(self, client, tmp_path):
         """测试大文件警告（Path对象，464行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        # 创建一个大于50MB的临时文件
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as f:
-            # 写入超过50MB的数据
-            large_data = b"x" * (51 * 1024 * 1024)  # 51MB
-            f.write(large_data)
-            temp_path = Path(f.name)
-
-        try:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
+        # 创建一个大于50MB的临时文件：只设置文件大小（稀疏文件），不实际写入数据
+        temp_path = tmp_path / "large.txt"
+        with open(temp_path, "wb") as f:
+            f.truncate(51 * 1024 * 1024)
+
+        mock_response = httpx.Response(
+            200,
+            json={
                 "status": "success",
                 "message": "Data added",
-                "data_id": str(uuid4()),
-            }
-
-            with patch.object(client.client, "request", return_value=mock_response):
-                with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-                    await client.add(data=temp_path, dataset_name="test-dataset")
-                    # 应该产生警告
-                    assert len(w) > 0
-                    assert any("exceeds recommended limit" in str(warning.message) for warning in w)
-        finally:
-            if temp_path.exists():
-                os.unlink(temp_path)
+                "data_id": str(_DATA_ID),
+            },
+        )
 
-    @pytest.mark.asyncio
-    async def test_path_open_error_streaming_direct(self):
-        """测试Path对象打开错误（流式上传，539-540行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
+        with patch.object(client.client, "request", return_value=mock_response):
+            # 应该产生警告
+            with pytest.warns(UserWarning, match="exceeds recommended limit"):
+                await client.add(data=temp_path, dataset_name="test-dataset")
 
+    async def test_path_open_error_streaming_direct(self, client):
+        """测试Path对象打开错误（流式上传，539-540行）"""
         # 创建一个不存在的Path对象，但模拟为存在
         non_existent_path = Path("/nonexistent/path/to/large_file.txt")
 
@@ -1235,35 +1084,25 @@ class TestOtherEdgeCases:
                             await client.add(data=non_existent_path, dataset_name="test-dataset")
                         assert "Failed to open file" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_path_read_error_small_file(self):
+    async def test_path_read_error_small_file(self, client, tmp_path):
         """测试Path对象读取错误（小文件，498-499行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 创建一个临时文件
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as f:
-            f.write(b"test content")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "test.txt"
+        temp_path.write_bytes(b"test content")
 
-        try:
-            # 模拟文件读取失败（小文件场景）
-            with patch.object(Path, "exists", return_value=True):
-                with patch.object(Path, "is_file", return_value=True):
-                    with patch.object(Path, "stat") as mock_stat:
-                        mock_stat.return_value.st_size = 5 * 1024 * 1024  # 小于10MB，不触发流式上传
-                        with patch("builtins.open", side_effect=OSError("Permission denied")):
-                            with pytest.raises(CogneeSDKError) as exc_info:
-                                await client.add(data=temp_path, dataset_name="test-dataset")
-                            assert "Failed to read file" in str(exc_info.value)
-        finally:
-            if temp_path.exists():
-                os.unlink(temp_path)
+        # 模拟文件读取失败（小文件场景）
+        with patch.object(Path, "exists", return_value=True):
+            with patch.object(Path, "is_file", return_value=True):
+                with patch.object(Path, "stat") as mock_stat:
+                    # 小于流式上传阈值（1MB），走内存读取路径
+                    mock_stat.return_value.st_size = 512 * 1024
+                    with patch("builtins.open", side_effect=OSError("Permission denied")):
+                        with pytest.raises(CogneeSDKError) as exc_info:
+                            await client.add(data=temp_path, dataset_name="test-dataset")
+                        assert "Failed to read file" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_binary_io_seek_error_streaming(self):
+    async def test_binary_io_seek_error_streaming(self, client):
         """测试BinaryIO seek错误（流式上传，582-583行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         class NonSeekableIO:
             def read(self):
                 return b"test content" * (2 * 1024 * 1024)  # 大内容
@@ -1276,53 +1115,50 @@ class TestOtherEdgeCases:
 
         non_seekable = NonSeekableIO()
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Data added",
-            "data_id": str(uuid4()),
-        }
+        mock_response = httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "message": "Data added",
+                "data_id": str(_DATA_ID),
+            },
+        )
 
         with patch.object(client.client, "request", return_value=mock_response):
             # 应该能处理不支持seek的文件对象
             result = await client.add(data=non_seekable, dataset_name="test-dataset")
             assert result is not None
 
-    @pytest.mark.asyncio
-    async def test_cognify_single_result_dict(self):
+    async def test_cognify_single_result_dict(self, client):
         """测试cognify单个结果字典（817行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
         # 返回单个字典，不是包含多个数据集的字典
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Cognify completed",
-            "pipeline_run_id": str(uuid4()),
-        }
+        mock_response = httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "message": "Cognify completed",
+                "pipeline_run_id": str(_PIPELINE_RUN_ID),
+            },
+        )
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             result = await client.cognify(datasets=["test-dataset"])
             assert result is not None
             assert "default" in result
 
-    @pytest.mark.asyncio
-    async def test_search_parse_exception_detailed(self):
+    async def test_search_parse_exception_detailed(self, client):
         """测试搜索解析异常详细（906-909行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 返回一个会导致解析异常的数据结构
         # 需要确保解析失败，但Pydantic可能会使用默认值，所以我们需要一个真正无法解析的情况
-        mock_response = MagicMock()
-        mock_response.status_code = 200
         # 返回一个列表，但其中的项不是字典，或者包含无法解析的数据
-        mock_response.json.return_value = [
-            "not a dict",  # 不是字典，会导致解析失败
-        ]
+        mock_response = httpx.Response(
+            200,
+            json=[
+                "not a dict",  # 不是字典，会导致解析失败
+            ],
+        )
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             results = await client.search("test query", return_type="parsed")
             # 应该回退到原始数据
             assert isinstance(results, list)
@@ -1330,81 +1166,67 @@ class TestOtherEdgeCases:
             # 由于解析失败，应该返回原始数据（字符串）
             assert results[0] == "not a dict"
 
-    @pytest.mark.asyncio
-    async def test_update_result_fallback_detailed(self):
+    async def test_update_result_fallback_detailed(self, client):
         """测试update结果回退详细（1021行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
         # 返回非字典，触发fallback
-        mock_response.json.return_value = None
+        mock_response = httpx.Response(200, content=b"null")
 
-        with patch.object(client.client, "request", return_value=mock_response):
+        with _respond(mock_response):
             result = await client.update(
-                data_id=uuid4(),
-                dataset_id=uuid4(),
+                data_id=_DATA_ID,
+                dataset_id=_DATASET_ID,
                 data="test data",
             )
             assert result.status == "success"
             assert result.data_id is None  # fallback时data_id为None
 
-    @pytest.mark.asyncio
-    async def test_update_file_close_error_detailed(self):
+    async def test_update_file_close_error_detailed(self, client, tmp_path):
         """测试update文件关闭错误详细（1027-1028行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
-
         # 创建一个临时文件
-        with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".txt") as f:
-            f.write("test content")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "test.txt"
+        temp_path.write_text("test content")
 
-        try:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
+        mock_response = httpx.Response(
+            200,
+            json={
                 "status": "success",
                 "message": "Updated",
-                "data_id": str(uuid4()),
-            }
-
-            # 模拟文件关闭时出错
-            mock_file = MagicMock()
-            mock_file.close = MagicMock(side_effect=Exception("Close error"))
-            mock_file.read = MagicMock(return_value=b"test content")
-            mock_file.seek = MagicMock()
-            mock_file.tell = MagicMock(return_value=0)
-
-            with patch.object(client.client, "request", return_value=mock_response):
-                with patch("builtins.open", return_value=mock_file):
-                    # 应该能正常处理，即使关闭文件时出错
-                    result = await client.update(
-                        data_id=uuid4(),
-                        dataset_id=uuid4(),
-                        data=temp_path,
-                    )
-                    assert result is not None
-        finally:
-            if temp_path.exists():
-                os.unlink(temp_path)
+                "data_id": str(_DATA_ID),
+            },
+        )
 
-    @pytest.mark.asyncio
-    async def test_sync_result_fallback(self):
-        """测试sync结果回退（1309行）"""
-        client = CogneeClient(api_url="http://localhost:8000")
+        # 模拟文件关闭时出错
+        mock_file = MagicMock()
+        mock_file.close = MagicMock(side_effect=Exception("Close error"))
+        mock_file.read = MagicMock(return_value=b"test content")
+        mock_file.seek = MagicMock()
+        mock_file.tell = MagicMock(return_value=0)
+
+        with patch.object(client.client, "request", return_value=mock_response):
+            with patch("builtins.open", return_value=mock_file):
+                # 应该能正常处理，即使关闭文件时出错
+                result = await client.update(
+                    data_id=_DATA_ID,
+                    dataset_id=_DATASET_ID,
+                    data=temp_path,
+                )
+                assert result is not None
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+    async def test_sync_result_fallback(self, client):
+        """测试sync结果回退（1309行）"""
         # 返回单个字典，但不是包含run_id的格式，也不是多个结果的格式
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Synced",
-            "run_id": str(uuid4()),
-            "dataset_ids": [str(uuid4())],
-            "dataset_names": ["dataset1"],
-        }
+        mock_response = httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "message": "Synced",
+                "run_id": str(_RUN_ID),
+                "dataset_ids": [str(_DATASET_ID)],
+                "dataset_names": ["dataset1"],
+            },
+        )
 
-        with patch.object(client.client, "request", return_value=mock_response):
-            result = await client.sync_to_cloud(dataset_ids=[uuid4()])
+        with _respond(mock_response):
+            result = await client.sync_to_cloud(dataset_ids=[_DATASET_ID])
             assert result is not None
             assert result.status == "success"
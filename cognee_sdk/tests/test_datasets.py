@@ -2,14 +2,16 @@
 Unit tests for dataset management API.
 """
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import httpx
 import pytest
 
 from cognee_sdk import CogneeClient
-from cognee_sdk.exceptions import ValidationError
-from cognee_sdk.models import DataItem, GraphData, PipelineRunStatus
+from cognee_sdk.exceptions import NotFoundError, ValidationError
+from cognee_sdk.models import DataItem, GraphData, GraphDataRaw, PipelineRunStatus
 
 
 @pytest.fixture
@@ -61,6 +63,35 @@ async def test_delete_dataset(client):
         assert str(dataset_id) in call_args[0][1]
 
 
+@pytest.mark.asyncio
+async def test_delete_datasets_reports_failures(client):
+    """Test that delete_datasets deletes every dataset and reports failures in order."""
+    dataset_ids = [uuid4(), uuid4(), uuid4()]
+    failure = NotFoundError("Dataset not found", 404)
+
+    async def fake_request(method, endpoint, **kwargs):
+        if str(dataset_ids[1]) in endpoint:
+            raise failure
+        return MagicMock(status_code=200)
+
+    with patch.object(client, "_request", side_effect=fake_request) as mock_request:
+        errors = await client.delete_datasets(dataset_ids, concurrency=2)
+
+    assert errors == [None, failure, None]
+    assert mock_request.call_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_delete_datasets_invalid_concurrency(client, concurrency):
+    """Test delete_datasets rejects a concurrency below 1."""
+    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+        with pytest.raises(ValidationError, match="concurrency"):
+            await client.delete_datasets([uuid4()], concurrency=concurrency)
+
+    mock_request.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_dataset_data(client):
     """Test getting dataset data."""
@@ -122,6 +153,47 @@ async def test_get_dataset_graph(client):
         assert len(graph.edges) == 1
 
 
+@pytest.mark.asyncio
+async def test_get_dataset_graph_raw(client):
+    """Test getting dataset graph in columnar form."""
+    node_id = uuid4()
+    body = {
+        "nodes": [{"id": str(node_id), "label": "Node1", "properties": {"key": "value"}}],
+        "edges": [{"source": str(node_id), "target": str(uuid4()), "label": "RELATED_TO"}],
+    }
+    response = httpx.Response(200, content=json.dumps(body))
+
+    with patch.object(client, "_request", new_callable=AsyncMock, return_value=response):
+        graph = await client.get_dataset_graph_raw(uuid4())
+
+    assert isinstance(graph, GraphDataRaw)
+    assert graph.node_ids == [str(node_id)]
+    assert graph.edge_labels == ["RELATED_TO"]
+
+
+@pytest.mark.asyncio
+async def test_graph_labels_share_one_string(client):
+    """Test repeated node and edge labels decode to a single shared string object."""
+    ids = [str(uuid4()) for _ in range(3)]
+    body = json.dumps(
+        {
+            "nodes": [{"id": node_id, "label": "Person"} for node_id in ids],
+            "edges": [{"source": ids[0], "target": node_id, "label": "KNOWS"} for node_id in ids],
+        }
+    )
+
+    with patch.object(
+        client, "_request", new_callable=AsyncMock, return_value=httpx.Response(200, content=body)
+    ):
+        raw = await client.get_dataset_graph_raw(uuid4())
+        graph = await client.get_dataset_graph(uuid4())
+
+    assert len({id(label) for label in raw.node_labels}) == 1
+    assert len({id(label) for label in raw.edge_labels}) == 1
+    assert len({id(node.label) for node in graph.nodes}) == 1
+    assert len({id(edge.label) for edge in graph.edges}) == 1
+
+
 @pytest.mark.asyncio
 async def test_get_dataset_status(client):
     """Test getting dataset status."""
@@ -160,6 +232,20 @@ async def test_download_raw_data(client):
         mock_request.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_dataset_status_from_raw_body(client):
+    """Test status keys and values are parsed straight from the response bytes."""
+    dataset_id = uuid4()
+    response = httpx.Response(200, content=json.dumps({str(dataset_id): "failed"}))
+
+    with patch.object(client, "_request", new_callable=AsyncMock, return_value=response):
+        with patch.object(client, "_parse_json_response", side_effect=AssertionError):
+            statuses = await client.get_dataset_status([dataset_id])
+
+    assert statuses == {dataset_id: PipelineRunStatus.FAILED}
+    assert isinstance(statuses[dataset_id], PipelineRunStatus)
+
+
 @pytest.mark.asyncio
 async def test_get_dataset_status_empty_list(client):
     """Test getting dataset status with empty list."""
@@ -342,3 +428,44 @@ async def test_get_dataset_graph_complex(client):
         assert graph.nodes[0].id == node1_id
         assert graph.edges[0].source == node1_id
         assert graph.edges[0].target == node2_id
+
+
+@pytest.mark.asyncio
+async def test_get_dataset_graph_from_raw_body(client):
+    """Test graph data is validated straight from the response bytes."""
+    node1, node2 = uuid4(), uuid4()
+    body = json.dumps(
+        {
+            "nodes": [
+                {"id": str(node1), "label": "Person", "properties": {"name": "Alice"}},
+                {"id": str(node2), "label": "Company"},
+            ],
+            "edges": [{"source": str(node1), "target": str(node2), "label": "WORKS_AT"}],
+        }
+    ).encode()
+
+    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = httpx.Response(200, content=body)
+        graph = await client.get_dataset_graph(uuid4())
+
+    assert isinstance(graph, GraphData)
+    assert [node.id for node in graph.nodes] == [node1, node2]
+    assert graph.nodes[1].properties == {}
+    assert graph.edges[0].label == "WORKS_AT"
+
+
+@pytest.mark.asyncio
+async def test_get_dataset_data_from_raw_body(client):
+    """Test data items accept camelCase keys when validated from bytes."""
+    data_id = uuid4()
+    body = json.dumps(
+        [{"id": str(data_id), "name": "doc.txt", "mimeType": "text/plain"}]
+    ).encode()
+
+    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = httpx.Response(200, content=body)
+        items = await client.get_dataset_data(uuid4())
+
+    assert isinstance(items[0], DataItem)
+    assert items[0].id == data_id
+    assert items[0].mime_type == "text/plain"
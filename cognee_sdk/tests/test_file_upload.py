@@ -261,9 +261,21 @@ class TestAddMethod:
 
                 # MIME type should be detected
                 mock_request.assert_called_once()
+                files = mock_request.call_args.kwargs["files"]
+                assert files[0][1][2] == "application/pdf"
         finally:
             temp_path.unlink()
 
+    def test_guess_mime_cached_and_fallback(self):
+        """Test MIME guessing uses the extension cache and falls back to mimetypes."""
+        from cognee_sdk.client import _guess_mime
+
+        assert _guess_mime("report.PDF") == "application/pdf"
+        assert _guess_mime("/tmp/notes.md") == "text/markdown"
+        assert _guess_mime("image.png") == "image/png"
+        assert _guess_mime("blob.unknownext") == "application/octet-stream"
+        assert _guess_mime("no_extension") == "application/octet-stream"
+
 
 class TestUpdateMethod:
     """Tests for update() method with various input types."""
@@ -481,6 +493,21 @@ class TestAddBatchMethod:
 
         assert len(results) == 0
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrent", [0, -1])
+    async def test_add_batch_invalid_max_concurrent(self, client, max_concurrent):
+        """Test batch add rejects a worker count below 1 instead of uploading nothing."""
+        with patch.object(client, "add", new_callable=AsyncMock) as mock_add:
+            with pytest.raises(ValidationError, match="max_concurrent"):
+                await client.add_batch(
+                    data_list=["data1", "data2"],
+                    dataset_name="test-dataset",
+                    max_concurrent=max_concurrent,
+                    return_errors=True,
+                )
+
+        mock_add.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_add_batch_concurrent_execution(self, client):
         """Test that add_batch executes operations concurrently."""
@@ -504,6 +531,275 @@ class TestAddBatchMethod:
             duration = end_time - start_time
             assert duration < 0.5  # Should be much less than 3 * 0.1 = 0.3s
 
+    @pytest.mark.asyncio
+    async def test_add_batch_bounded_in_flight(self, client):
+        """Test add_batch never runs more than max_concurrent adds at once."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def mock_add(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return AddResult(status="success", message="Data added", data_id=uuid4())
+
+        with patch.object(client, "add", side_effect=mock_add) as mock:
+            results = await client.add_batch(
+                data_list=[f"data{i}" for i in range(25)],
+                dataset_name="test-dataset",
+                max_concurrent=4,
+            )
+
+        assert len(results) == 25
+        assert mock.call_count == 25
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_add_batch_capped_at_connection_pool(self):
+        """Test add_batch never runs more workers than the connection pool allows."""
+        import asyncio
+
+        client = CogneeClient(api_url="http://localhost:8000", max_connections=3)
+        in_flight = 0
+        peak = 0
+
+        async def mock_add(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return AddResult(status="success", message="Data added")
+
+        with patch.object(client, "add", side_effect=mock_add):
+            results = await client.add_batch(
+                data_list=[f"data{i}" for i in range(12)],
+                dataset_name="test-dataset",
+                max_concurrent=10,
+            )
+
+        assert len(results) == 12
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_add_batch_stop_on_error_skips_remaining(self, client):
+        """Test stop-on-error mode does not start items after the first failure."""
+        from cognee_sdk.exceptions import ServerError
+
+        async def mock_add(data, **kwargs):
+            if data == "bad":
+                raise ServerError("boom", 500)
+            return AddResult(status="success", message="Data added", data_id=uuid4())
+
+        with patch.object(client, "add", side_effect=mock_add) as mock:
+            with pytest.raises(ServerError):
+                await client.add_batch(
+                    data_list=["ok", "bad", "ok", "ok", "ok"],
+                    dataset_name="test-dataset",
+                    max_concurrent=1,
+                )
+
+        assert mock.call_count == 2
+
+
+    @pytest.mark.asyncio
+    async def test_add_batch_uses_batch_endpoint(self, client):
+        """Test use_batch_endpoint uploads all items in one request."""
+        import json
+
+        import httpx
+
+        body = [{"status": "success", "data_id": str(uuid4())} for _ in range(3)]
+        response = httpx.Response(200, content=json.dumps(body))
+
+        with patch.object(
+            client, "_request", new_callable=AsyncMock, return_value=response
+        ) as mock_request, patch.object(client, "add", new_callable=AsyncMock) as mock_add:
+            results = await client.add_batch(
+                data_list=["data1", "data2", "data3"],
+                dataset_name="test-dataset",
+                use_batch_endpoint=True,
+            )
+
+        assert [str(r.data_id) for r in results] == [item["data_id"] for item in body]
+        mock_request.assert_called_once()
+        assert mock_request.call_args[0][1] == "/api/v1/add/batch"
+        assert len(mock_request.call_args[1]["files"]) == 3
+        mock_add.assert_not_called()
+        assert client._batch_add_supported is True
+
+    @pytest.mark.asyncio
+    async def test_add_batch_endpoint_missing_falls_back(self, client):
+        """Test a missing batch endpoint falls back to per-item adds and is remembered."""
+        from cognee_sdk.exceptions import NotFoundError
+
+        missing_route = NotFoundError("Not Found", 404, {"detail": "Not Found"})
+
+        with patch.object(
+            client, "_request", new_callable=AsyncMock, side_effect=missing_route
+        ) as mock_request, patch.object(
+            client, "add", new_callable=AsyncMock, return_value=AddResult(status="success")
+        ) as mock_add:
+            for _ in range(2):
+                results = await client.add_batch(
+                    data_list=["data1", "data2"],
+                    dataset_name="test-dataset",
+                    use_batch_endpoint=True,
+                )
+                assert len(results) == 2
+
+        # Probed once, then skipped
+        mock_request.assert_called_once()
+        assert mock_add.call_count == 4
+        assert client._batch_add_supported is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("supported", [None, True])
+    async def test_add_batch_endpoint_resource_404_not_cached(self, client, supported):
+        """Test a resource 404 never marks the batch endpoint unsupported."""
+        from cognee_sdk.exceptions import NotFoundError
+
+        client._batch_add_supported = supported
+        missing_dataset = NotFoundError("Dataset not found", 404, {"detail": "Dataset not found"})
+
+        with patch.object(client, "_request", new_callable=AsyncMock, side_effect=missing_dataset):
+            with pytest.raises(NotFoundError):
+                await client.add_batch(
+                    data_list=["data1", "data2"],
+                    dataset_id=uuid4(),
+                    use_batch_endpoint=True,
+                )
+
+        assert client._batch_add_supported is supported
+
+    @pytest.mark.asyncio
+    async def test_add_batch_endpoint_error_honors_continue_on_error(self, client):
+        """Test a failed batch request reports per-item errors instead of raising."""
+        from cognee_sdk.exceptions import ServerError
+
+        failure = ServerError("boom", 500)
+
+        with patch.object(
+            client, "_request", new_callable=AsyncMock, side_effect=failure
+        ), patch.object(client, "add", new_callable=AsyncMock, side_effect=failure):
+            results, errors = await client.add_batch(
+                data_list=["data1", "data2"],
+                dataset_name="test-dataset",
+                use_batch_endpoint=True,
+                continue_on_error=True,
+                return_errors=True,
+            )
+
+        assert results == [None, None]
+        assert errors == [failure, failure]
+        assert client._batch_add_supported is None
+
+    @pytest.mark.asyncio
+    async def test_add_batch_endpoint_confirmed_not_downgraded(self, client):
+        """Test a route-level 404 after the endpoint was confirmed is raised, not cached."""
+        from cognee_sdk.exceptions import NotFoundError
+
+        client._batch_add_supported = True
+        missing_route = NotFoundError("Not Found", 404, {"detail": "Not Found"})
+
+        with patch.object(client, "_request", new_callable=AsyncMock, side_effect=missing_route):
+            with pytest.raises(NotFoundError):
+                await client.add_batch(
+                    data_list=["data1"],
+                    dataset_name="test-dataset",
+                    use_batch_endpoint=True,
+                )
+
+        assert client._batch_add_supported is True
+
+
+    @pytest.mark.asyncio
+    async def test_add_batch_endpoint_splits_large_batches(self, client):
+        """Test batches above the item limit are sent as several batch requests."""
+        import json
+
+        import httpx
+
+        def respond(method, endpoint, files, **kwargs):
+            body = [{"status": "success", "data_id": str(uuid4())} for _ in files]
+            return httpx.Response(200, content=json.dumps(body))
+
+        with patch("cognee_sdk.client._ADD_BATCH_MAX_ITEMS", 2), patch.object(
+            client, "_request", new_callable=AsyncMock, side_effect=respond
+        ) as mock_request:
+            results = await client.add_batch(
+                data_list=["data1", "data2", "data3", "data4", "data5"],
+                dataset_name="test-dataset",
+                use_batch_endpoint=True,
+            )
+
+        assert len(results) == 5
+        assert [len(call[1]["files"]) for call in mock_request.call_args_list] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_add_batch_endpoint_keeps_stored_chunks_on_failure(self, client):
+        """Test a failed later chunk keeps earlier results and uploads only the rest per item."""
+        import json
+
+        import httpx
+
+        from cognee_sdk.exceptions import ServerError
+
+        stored_ids = [str(uuid4()), str(uuid4())]
+        responses = [
+            httpx.Response(
+                200, content=json.dumps([{"status": "success", "data_id": i} for i in stored_ids])
+            ),
+            ServerError("boom", 500),
+        ]
+
+        with patch("cognee_sdk.client._ADD_BATCH_MAX_ITEMS", 2), patch.object(
+            client, "_request", new_callable=AsyncMock, side_effect=responses
+        ) as mock_request, patch.object(
+            client, "add", new_callable=AsyncMock, return_value=AddResult(status="success")
+        ) as mock_add:
+            results = await client.add_batch(
+                data_list=["data1", "data2", "data3", "data4", "data5"],
+                dataset_name="test-dataset",
+                use_batch_endpoint=True,
+            )
+
+        assert len(results) == 5
+        assert [str(r.data_id) for r in results[:2]] == stored_ids
+        assert mock_request.call_count == 2
+        assert sorted(call[1]["data"] for call in mock_add.call_args_list) == [
+            "data3",
+            "data4",
+            "data5",
+        ]
+        assert client._batch_add_supported is True
+
+    @pytest.mark.asyncio
+    async def test_add_batch_endpoint_skipped_for_large_files(self, client, tmp_path):
+        """Test batches with files above the streaming threshold upload per item."""
+        large_file = tmp_path / "large.bin"
+        large_file.write_bytes(b"x" * 16)
+
+        with patch("cognee_sdk.client._STREAMING_THRESHOLD", 8), patch.object(
+            client, "_request", new_callable=AsyncMock
+        ) as mock_request, patch.object(
+            client, "add", new_callable=AsyncMock, return_value=AddResult(status="success")
+        ) as mock_add:
+            results = await client.add_batch(
+                data_list=["data1", large_file],
+                dataset_name="test-dataset",
+                use_batch_endpoint=True,
+            )
+
+        assert len(results) == 2
+        mock_request.assert_not_called()
+        assert mock_add.call_count == 2
+        assert client._batch_add_supported is None
+
 
 class TestStreamingUpload:
     """Tests for streaming upload functionality for large files."""
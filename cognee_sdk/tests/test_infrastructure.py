@@ -221,6 +221,76 @@ class TestHandleErrorResponse:
         assert "HTTP 500" in str(exc_info.value)
 
 
+class TestParseJsonResponse:
+    """Tests for _parse_json_response() and _load_json()."""
+
+    def test_parse_real_response_from_bytes(self, client):
+        """Test parsing decodes the raw body without going through response.json()."""
+        response = httpx.Response(200, content=b'{"status": "ok", "items": [1, 2]}')
+
+        with patch.object(httpx.Response, "json", side_effect=AssertionError("not used")):
+            data = client._parse_json_response(response)
+
+        assert data == {"status": "ok", "items": [1, 2]}
+
+    def test_parse_uses_module_json_loader(self, client):
+        """Test bodies are handed to the module-level (orjson or stdlib) loader as bytes."""
+        import json
+
+        response = httpx.Response(200, content=b'[{"id": "1"}]')
+
+        with patch("cognee_sdk.client._json_loads", side_effect=json.loads) as mock_loads:
+            data = client._parse_json_response(response)
+
+        mock_loads.assert_called_once_with(b'[{"id": "1"}]')
+        assert data == [{"id": "1"}]
+
+    def test_parse_invalid_body(self, client):
+        """Test invalid JSON body is reported as CogneeAPIError."""
+        response = httpx.Response(200, content=b"not json")
+
+        with pytest.raises(CogneeAPIError) as exc_info:
+            client._parse_json_response(response)
+
+        assert "Invalid JSON response" in str(exc_info.value)
+        assert "not json" in str(exc_info.value)
+
+    def test_try_validate_json_matching_body(self, client):
+        """Test a body matching the adapter is validated straight from bytes."""
+        from cognee_sdk.client import _HEALTH_STATUS_ADAPTER
+
+        response = httpx.Response(200, content=b'{"status": "healthy", "version": "1.0.0"}')
+
+        with patch.object(httpx.Response, "json", side_effect=AssertionError("not used")):
+            status = client._try_validate_json(response, _HEALTH_STATUS_ADAPTER)
+
+        assert status.status == "healthy"
+
+    @pytest.mark.parametrize("body", [b'["not", "a", "dict"]', b"not json", b""])
+    def test_try_validate_json_irregular_body(self, client, body):
+        """Test irregular shapes and invalid JSON return None for the caller's fallback."""
+        from cognee_sdk.client import _HEALTH_STATUS_ADAPTER
+
+        response = httpx.Response(200, content=body)
+
+        assert client._try_validate_json(response, _HEALTH_STATUS_ADAPTER) is None
+
+    @pytest.mark.asyncio
+    async def test_handle_error_real_response(self, client):
+        """Test error handling decodes the already-read error body."""
+        response = httpx.Response(
+            404,
+            content=b'{"detail": "Dataset not found"}',
+            request=httpx.Request("GET", "http://localhost:8000/api/v1/datasets"),
+        )
+
+        with pytest.raises(NotFoundError) as exc_info:
+            await client._handle_error_response(response)
+
+        assert "Dataset not found" in str(exc_info.value)
+        assert exc_info.value.response == {"detail": "Dataset not found"}
+
+
 class TestRequest:
     """Tests for _request() method."""
 
@@ -2,13 +2,15 @@
 Unit tests for memify and search history API.
 """
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import httpx
 import pytest
 
 from cognee_sdk import CogneeClient
-from cognee_sdk.exceptions import ValidationError
+from cognee_sdk.exceptions import CogneeAPIError, ValidationError
 from cognee_sdk.models import MemifyResult, SearchHistoryItem
 
 
@@ -39,6 +41,12 @@ async def test_memify(client):
         assert isinstance(result, MemifyResult)
         assert result.status == "completed"
         mock_request.assert_called_once()
+        assert mock_request.call_args[1]["json"] == {
+            "run_in_background": False,
+            "dataset_name": "test-dataset",
+            "extraction_tasks": ["task1"],
+            "enrichment_tasks": ["task2"],
+        }
 
 
 @pytest.mark.asyncio
@@ -75,3 +83,37 @@ async def test_get_search_history(client):
         assert all(isinstance(item, SearchHistoryItem) for item in history)
         assert history[0].text == "test query 1"
         mock_request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_search_history_from_raw_body(client):
+    """Test search history is validated straight from the response bytes."""
+    body = json.dumps(
+        [
+            {
+                "id": str(uuid4()),
+                "text": "raw query",
+                "user": "user@example.com",
+                "created_at": "2025-01-01T00:00:00Z",
+            }
+        ]
+    ).encode()
+
+    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = httpx.Response(200, content=body)
+        history = await client.get_search_history()
+
+    assert len(history) == 1
+    assert isinstance(history[0], SearchHistoryItem)
+    assert history[0].text == "raw query"
+
+
+@pytest.mark.asyncio
+async def test_get_search_history_invalid_json(client):
+    """Test malformed search history bodies raise CogneeAPIError."""
+    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = httpx.Response(200, content=b"[{not json")
+        with pytest.raises(CogneeAPIError) as exc_info:
+            await client.get_search_history()
+
+    assert "Invalid JSON response" in str(exc_info.value)
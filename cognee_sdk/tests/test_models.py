@@ -4,10 +4,12 @@ Unit tests for data models.
 Tests all Pydantic models and enumerations.
 """
 
+import typing
 from datetime import datetime
 from uuid import uuid4
 
 import pytest
+from pydantic import TypeAdapter
 from pydantic import ValidationError as PydanticValidationError
 
 from cognee_sdk.models import (
@@ -18,6 +20,7 @@ from cognee_sdk.models import (
     Dataset,
     DeleteResult,
     GraphData,
+    GraphDataRaw,
     GraphEdge,
     GraphNode,
     HealthStatus,
@@ -54,6 +57,23 @@ class TestEnumerations:
         assert SearchType.CODING_RULES == "CODING_RULES"
         assert SearchType.CHUNKS_LEXICAL == "CHUNKS_LEXICAL"
 
+    def test_enum_lookup_tables(self):
+        """Test the precomputed enum lookups cover every member and wire value."""
+        from cognee_sdk.models import _PIPELINE_RUN_STATUSES, _SEARCH_TYPE_VALUES
+
+        for member in SearchType:
+            assert _SEARCH_TYPE_VALUES[member] == member.value
+            assert _SEARCH_TYPE_VALUES[member.value] == member.value
+            assert type(_SEARCH_TYPE_VALUES[member]) is str
+        for member in PipelineRunStatus:
+            assert _PIPELINE_RUN_STATUSES[member.value] is member
+
+    def test_search_type_value_literal_matches_enum(self):
+        """Test the SearchTypeValue literal lists exactly the SearchType wire values."""
+        from cognee_sdk.models import SearchTypeValue
+
+        assert set(typing.get_args(SearchTypeValue)) == {member.value for member in SearchType}
+
     def test_pipeline_run_status_values(self):
         """Test all PipelineRunStatus enum values."""
         assert PipelineRunStatus.PENDING == "pending"
@@ -186,6 +206,59 @@ class TestAddResult:
         assert result.data_id is None
         assert result.dataset_id is None
 
+    def test_add_result_data_id_from_ingestion_info(self):
+        """Test data_id is extracted from data_ingestion_info and message defaulted."""
+        data_id = uuid4()
+        payload = {
+            "status": "PipelineRunCompleted",
+            "data_ingestion_info": [{"data_id": str(data_id), "run_info": {}}],
+        }
+
+        result = AddResult(**payload)
+
+        assert result.data_id == data_id
+        assert result.message == "Data added successfully. Status: PipelineRunCompleted"
+        # The caller's dict is left untouched
+        assert "data_id" not in payload
+
+    def test_add_result_explicit_data_id_wins(self):
+        """Test an explicit data_id is not overridden by data_ingestion_info."""
+        data_id = uuid4()
+        result = AddResult(
+            status="success",
+            data_id=data_id,
+            data_ingestion_info=[{"data_id": str(uuid4())}],
+        )
+
+        assert result.data_id == data_id
+
+    def test_add_result_validate_json(self):
+        """Test derived fields are filled when validating from JSON bytes."""
+        data_id = uuid4()
+        body = f'{{"status": "ok", "data_ingestion_info": [{{"data_id": "{data_id}"}}]}}'
+
+        result = TypeAdapter(AddResult).validate_json(body.encode())
+
+        assert result.data_id == data_id
+        assert result.message == "Data added successfully. Status: ok"
+
+    def test_add_result_is_frozen(self):
+        """Test AddResult rejects assignment after construction."""
+        result = AddResult(status="ok")
+
+        with pytest.raises(PydanticValidationError):
+            result.message = "changed"
+        assert "message" in result.model_dump(exclude_unset=True)
+
+    def test_add_result_message_defaulted_after_validation(self):
+        """Test the default message is derived from the validated status."""
+        result = AddResult(status="queued", message=None)
+
+        assert result.message == "Data added successfully. Status: queued"
+        assert AddResult.model_validate({"status": "ok"}).message == (
+            "Data added successfully. Status: ok"
+        )
+
 
 class TestDeleteResult:
     """Tests for DeleteResult model."""
@@ -197,10 +270,36 @@ class TestDeleteResult:
         assert result.status == "success"
         assert result.message == "Data deleted"
 
+    def test_result_positional_pattern_matching(self):
+        """Test flat result models support positional match patterns."""
+        match DeleteResult(status="success", message="Data deleted"):
+            case DeleteResult("success", message):
+                assert message == "Data deleted"
+            case _:
+                pytest.fail("DeleteResult did not match positionally")
+
+        match HealthStatus(status="healthy", version="1.0"):
+            case HealthStatus(status, version):
+                assert (status, version) == ("healthy", "1.0")
+            case _:
+                pytest.fail("HealthStatus did not match positionally")
+
 
 class TestCognifyResult:
     """Tests for CognifyResult model."""
 
+    def test_cognify_result_is_frozen_and_hashable(self):
+        """Test result models are immutable and usable as dict keys."""
+        pipeline_run_id = uuid4()
+        result = CognifyResult(pipeline_run_id=pipeline_run_id, status="completed")
+
+        with pytest.raises(PydanticValidationError):
+            result.status = "failed"
+
+        assert hash(result) == hash(
+            CognifyResult(pipeline_run_id=pipeline_run_id, status="completed")
+        )
+
     def test_cognify_result_creation(self):
         """Test creating CognifyResult with all fields."""
         pipeline_run_id = uuid4()
@@ -416,6 +515,39 @@ class TestGraphData:
         assert len(graph.edges) == 0
 
 
+class TestGraphDataRaw:
+    """Tests for GraphDataRaw columnar model."""
+
+    def test_graph_data_raw_from_json_data(self):
+        """Test columns are built in row order and rows materialize lazily."""
+        node1_id, node2_id = uuid4(), uuid4()
+        data = {
+            "nodes": [
+                {"id": str(node1_id), "label": "Node1", "properties": {"k": "v"}},
+                {"id": str(node2_id), "label": "Node2"},
+            ],
+            "edges": [{"source": str(node1_id), "target": str(node2_id), "label": "REL"}],
+        }
+
+        graph = GraphDataRaw.from_json_data(data)
+
+        assert graph.node_ids == [str(node1_id), str(node2_id)]
+        assert graph.node_labels == ["Node1", "Node2"]
+        assert graph.node_properties == [{"k": "v"}, {}]
+        nodes = list(graph.nodes())
+        assert all(isinstance(node, GraphNode) for node in nodes)
+        assert nodes[0].id == node1_id
+        edges = list(graph.edges())
+        assert edges[0] == GraphEdge(source=node1_id, target=node2_id, label="REL")
+
+    def test_graph_data_raw_empty(self):
+        """Test missing or empty node/edge lists give empty columns."""
+        graph = GraphDataRaw.from_json_data({"nodes": []})
+
+        assert graph.node_ids == []
+        assert list(graph.edges()) == []
+
+
 class TestSyncResult:
     """Tests for SyncResult model."""
 
@@ -539,3 +671,28 @@ class TestModelValidation:
         user_json = user.model_dump_json()
         assert str(user_id) in user_json
         assert "user@example.com" in user_json
+
+    def test_schemas_built_lazily(self):
+        """Test importing the SDK builds no model validators until first use."""
+        import subprocess
+        import sys
+
+        code = (
+            "import inspect, cognee_sdk, cognee_sdk.models as m;"
+            "print([n for n, c in inspect.getmembers(m, inspect.isclass)"
+            " if issubclass(c, m.BaseModel) and c is not m.BaseModel"
+            " and c.__pydantic_complete__])"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+        assert out == "[]"
+
+    def test_models_exported_from_package(self):
+        """Test model classes are importable from the package namespace."""
+        import cognee_sdk
+
+        assert "Dataset" in cognee_sdk.__all__
+        assert cognee_sdk.Dataset is Dataset
+        assert cognee_sdk.AddResult is AddResult
@@ -66,6 +66,20 @@ class TestConnectionPoolOptimization:
         
         assert client.enable_http2 is False
 
+    def test_request_url_cached_per_endpoint(self):
+        """测试请求 URL 按端点解析一次并缓存，缓存有上限"""
+        client = CogneeClient(api_url="http://localhost:8000/")
+
+        url = client._url("/api/v1/datasets")
+        assert isinstance(url, httpx.URL)
+        assert str(url) == "http://localhost:8000/api/v1/datasets"
+        assert client._url("/api/v1/datasets") is url
+
+        with patch("cognee_sdk.client._URL_CACHE_MAX_SIZE", 1):
+            other = client._url("/api/v1/search")
+            assert str(other) == "http://localhost:8000/api/v1/search"
+            assert "/api/v1/search" not in client._urls
+
 
 class TestDataCompression:
     """测试数据压缩功能"""
@@ -178,6 +192,34 @@ class TestDataCompression:
                     assert content[:2] == b'\x1f\x8b' or "json" in call_args.kwargs
 
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_json_payload_serializes_uuids(self, use_orjson):
+        """测试JSON请求体直接序列化UUID（orjson与标准库两种路径）"""
+        import cognee_sdk.client as client_module
+
+        client = CogneeClient(api_url="http://localhost:8000", enable_compression=False)
+        dataset_id = uuid4()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+
+        orjson_module = client_module.orjson if use_orjson else None
+        if use_orjson and orjson_module is None:
+            pytest.skip("orjson not installed")
+
+        with patch.object(client_module, "orjson", orjson_module), patch.object(
+            client.client, "request", return_value=mock_response
+        ) as mock_request:
+            await client._request("POST", "/api/v1/sync", json={"dataset_ids": [dataset_id]})
+
+        call_kwargs = mock_request.call_args.kwargs
+        assert "json" not in call_kwargs
+        assert json.loads(call_kwargs["content"]) == {"dataset_ids": [str(dataset_id)]}
+        assert call_kwargs["headers"]["Content-Type"] == "application/json"
+
+
 class TestStreamingOptimization:
     """测试流式传输优化"""
 
@@ -264,6 +306,28 @@ class TestLocalCache:
         # 不同参数应该生成不同键
         assert key1 != key3
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_cache_key_ignores_payload_key_order(self, use_orjson):
+        """测试缓存键与JSON负载的键顺序无关，且支持UUID（orjson与标准库两种路径）"""
+        import cognee_sdk.client as client_module
+
+        orjson_module = client_module.orjson if use_orjson else None
+        if use_orjson and orjson_module is None:
+            pytest.skip("orjson not installed")
+
+        client = CogneeClient(api_url="http://localhost:8000")
+        dataset_id = uuid4()
+
+        with patch.object(client_module, "orjson", orjson_module):
+            key1 = client._get_cache_key(
+                "POST", "/api/v1/search", json={"query": "q", "dataset_ids": [dataset_id]}
+            )
+            key2 = client._get_cache_key(
+                "POST", "/api/v1/search", json={"dataset_ids": [dataset_id], "query": "q"}
+            )
+
+        assert key1 == key2
+
     def test_cache_get_set(self):
         """测试缓存获取和设置"""
         client = CogneeClient(
@@ -358,6 +422,24 @@ class TestLocalCache:
             # 注意：由于缓存是在方法内部处理的，实际调用次数可能不同
             # 但结果应该相同
 
+    @pytest.mark.asyncio
+    async def test_list_datasets_cache_holds_raw_body(self):
+        """测试list_datasets缓存原始响应字节，命中时直接从JSON校验"""
+        client = CogneeClient(api_url="http://localhost:8000", enable_cache=True)
+
+        test_uuid = uuid4()
+        body = json.dumps([{"id": str(test_uuid), "name": "test"}]).encode()
+        response = httpx.Response(200, content=body)
+
+        with patch.object(client, "_request", new_callable=AsyncMock, return_value=response) as mock_request:
+            await client.list_datasets()
+            cached = await client.list_datasets()
+
+        mock_request.assert_called_once()
+        assert [value for value, _ in client._cache.values()] == [body]
+        assert isinstance(cached[0], Dataset)
+        assert cached[0].id == test_uuid
+
     @pytest.mark.asyncio
     async def test_search_cache(self):
         """测试search使用缓存"""
@@ -62,6 +62,7 @@ class TestSearchTypes:
             call_args = mock_request.call_args
             payload = call_args[1]["json"]
             assert payload["search_type"] == search_type.value
+            assert type(payload["search_type"]) is str
 
 
 class TestSearchReturnTypes:
@@ -153,6 +154,22 @@ class TestSearchReturnTypes:
             assert isinstance(results, list)
             assert len(results) == 0
 
+    @pytest.mark.asyncio
+    async def test_search_mixed_list_keeps_non_dict_items(self, client):
+        """Test dict items are parsed while plain strings pass through unchanged."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = ["Plain answer", {"id": "1", "text": "Result"}]
+
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response
+            results = await client.search(
+                query="test query", search_type=SearchType.GRAPH_COMPLETION
+            )
+
+        assert results[0] == "Plain answer"
+        assert isinstance(results[1], SearchResult)
+        assert results[1].text == "Result"
+
 
 class TestSearchParameters:
     """Tests for various parameter combinations."""
@@ -365,6 +382,29 @@ class TestSearchValidation:
 
         assert "cannot be empty" in str(exc_info.value).lower()
 
+    @pytest.mark.asyncio
+    async def test_search_accepts_string_search_type(self, client):
+        """Test search accepts the plain string value of a search type."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = []
+
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response
+            await client.search(query="test", search_type="CHUNKS")
+
+            payload = mock_request.call_args[1]["json"]
+            assert payload["search_type"] == "CHUNKS"
+
+    @pytest.mark.asyncio
+    async def test_search_unknown_search_type(self, client):
+        """Test search with an unknown search type string raises ValidationError."""
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+            with pytest.raises(ValidationError) as exc_info:
+                await client.search(query="test", search_type="NOT_A_TYPE")
+
+            mock_request.assert_not_called()
+        assert "unknown search type" in str(exc_info.value).lower()
+
     @pytest.mark.asyncio
     async def test_search_whitespace_only_query(self, client):
         """Test search with whitespace-only query."""
@@ -2,15 +2,13 @@
 Quick connection test to verify server accessibility.
 
 Run this first to verify the server is accessible before running full integration tests.
+Run from the project root: python -m tests.test_server_connection
 """
 
 import asyncio
 import os
 import sys
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 from cognee_sdk import CogneeClient
 
 # Note: API_URL should be the base URL without /api
@@ -5,6 +5,7 @@ Unit tests for sync API.
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import httpx
 import pytest
 
 from cognee_sdk import CogneeClient
@@ -107,3 +108,40 @@ async def test_get_sync_status_no_running(client):
         assert status.has_running_sync is False
         assert status.running_sync_count == 0
         assert status.latest_running_sync is None
+
+
+@pytest.mark.asyncio
+async def test_get_sync_status_from_raw_body(client):
+    """Test sync status is validated straight from the response bytes."""
+    body = b'{"has_running_sync": true, "running_sync_count": 2, "latest_running_sync": null}'
+
+    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = httpx.Response(200, content=body)
+        status = await client.get_sync_status()
+
+    assert isinstance(status, SyncStatus)
+    assert status.has_running_sync is True
+    assert status.running_sync_count == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_to_cloud_from_raw_body(client):
+    """Test sync results are decoded from raw bytes, including the keyed wrapper shape."""
+    result = {
+        "run_id": "run-1",
+        "status": "started",
+        "dataset_ids": [str(uuid4())],
+        "dataset_names": ["ds"],
+        "message": "Sync started",
+    }
+
+    with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = httpx.Response(200, json=result)
+        direct = await client.sync_to_cloud()
+
+        mock_request.return_value = httpx.Response(200, json={"ds": result})
+        wrapped = await client.sync_to_cloud()
+
+    assert isinstance(direct, SyncResult)
+    assert direct == wrapped
+    assert direct.run_id == "run-1"
@@ -1,8 +1,8 @@
 """
 Unit tests for WebSocket support.
 
-Note: WebSocket tests are simplified due to the complexity of mocking
-the websockets library which is imported inside the method.
+The websockets module is imported once at module scope in cognee_sdk.client;
+tests substitute a fake module by patching cognee_sdk.client._websockets.
 """
 
 import json
@@ -28,8 +28,8 @@ async def test_subscribe_cognify_progress_import_error():
     client = CogneeClient(api_url="http://localhost:8000")
     pipeline_run_id = uuid4()
 
-    # Mock import to raise ImportError
-    with patch("builtins.__import__", side_effect=ImportError("No module named 'websockets'")):
+    # Simulate the optional dependency failing to import
+    with patch("cognee_sdk.client._websockets", None):
         with pytest.raises(ImportError) as exc_info:
             async for _ in client.subscribe_cognify_progress(pipeline_run_id):
                 pass
@@ -43,8 +43,8 @@ async def test_subscribe_cognify_progress_no_websockets():
     client = CogneeClient(api_url="http://localhost:8000")
     pipeline_run_id = uuid4()
 
-    # Mock import to raise ImportError
-    with patch("builtins.__import__", side_effect=ImportError("No module named 'websockets'")):
+    # Simulate the optional dependency failing to import
+    with patch("cognee_sdk.client._websockets", None):
         with pytest.raises(ImportError) as exc_info:
             async for _ in client.subscribe_cognify_progress(pipeline_run_id):
                 pass
@@ -252,3 +252,132 @@ async def test_subscribe_cognify_progress_server_error(client):
                 pass
 
         assert "WebSocket error" in str(exc_info.value)
+
+
+class _FakeConnectionClosed(Exception):
+    """Stand-in for websockets.exceptions.ConnectionClosed."""
+
+
+def _fake_websockets(frames):
+    """Build a fake websockets module whose connection replays frames."""
+    websocket = MagicMock()
+    websocket.reads = 0
+
+    async def recv():
+        if websocket.reads >= len(frames):
+            raise _FakeConnectionClosed()
+        frame = frames[websocket.reads]
+        websocket.reads += 1
+        if isinstance(frame, Exception):
+            raise frame
+        return frame
+
+    websocket.recv = recv
+    connection = MagicMock()
+    connection.__aenter__ = AsyncMock(return_value=websocket)
+    connection.__aexit__ = AsyncMock(return_value=None)
+
+    module = MagicMock()
+    module.connect = MagicMock(return_value=connection)
+    module.exceptions.ConnectionClosed = _FakeConnectionClosed
+    return module, websocket
+
+
+@pytest.mark.asyncio
+async def test_subscribe_cognify_progress_stops_on_completed(client):
+    """Test updates are yielded in order until the completed status."""
+    frames = [
+        json.dumps({"status": "running", "progress": 50}),
+        json.dumps({"status": "completed"}),
+        json.dumps({"status": "ignored"}),
+    ]
+    module, _ = _fake_websockets(frames)
+
+    with patch("cognee_sdk.client._websockets", module):
+        updates = [u async for u in client.subscribe_cognify_progress(uuid4())]
+
+    assert [u["status"] for u in updates] == ["running", "completed"]
+    assert module.connect.call_args[1]["extra_headers"]["Authorization"] == "Bearer test-token"
+
+
+@pytest.mark.asyncio
+async def test_subscribe_cognify_progress_bounded_buffer(client):
+    """Test reading pauses once buffer_size updates are waiting for the consumer."""
+    import asyncio
+
+    frames = [json.dumps({"status": "running", "step": i}) for i in range(100)]
+    module, websocket = _fake_websockets(frames)
+
+    with patch("cognee_sdk.client._websockets", module):
+        stream = client.subscribe_cognify_progress(uuid4(), buffer_size=4)
+        await stream.__anext__()
+        await asyncio.sleep(0.01)
+        # One consumed, buffer_size queued, and one read blocked on put()
+        assert websocket.reads <= 6
+        await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_cognify_progress_connection_closed_ends_stream(client):
+    """Test a closed connection ends the stream without error."""
+    module, _ = _fake_websockets([json.dumps({"status": "running"})])
+
+    with patch("cognee_sdk.client._websockets", module):
+        updates = [u async for u in client.subscribe_cognify_progress(uuid4())]
+
+    assert len(updates) == 1
+
+
+@pytest.mark.asyncio
+async def test_subscribe_cognify_progress_recv_error(client):
+    """Test receive failures are surfaced as ServerError."""
+    module, _ = _fake_websockets([RuntimeError("boom")])
+
+    with patch("cognee_sdk.client._websockets", module):
+        with pytest.raises(ServerError) as exc_info:
+            async for _ in client.subscribe_cognify_progress(uuid4()):
+                pass
+
+    assert "WebSocket error" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_cognify_progress_https_url():
+    """Test the precomputed WebSocket base URL maps https to wss."""
+    https_client = CogneeClient(api_url="https://api.example.com/")
+    pipeline_run_id = uuid4()
+    module, _ = _fake_websockets([json.dumps({"status": "completed"})])
+
+    with patch("cognee_sdk.client._websockets", module):
+        async for _ in https_client.subscribe_cognify_progress(pipeline_run_id):
+            pass
+
+    url = module.connect.call_args[0][0]
+    assert url == f"wss://api.example.com/api/v1/cognify/subscribe/{pipeline_run_id}"
+    assert module.connect.call_args[1]["extra_headers"] == {}
+
+
+@pytest.mark.asyncio
+async def test_subscribe_cognify_progress_receives_raw_bytes(client):
+    """Test the websockets >= 14 client gets additional_headers and undecoded frames."""
+    module, websocket = _fake_websockets([])
+    legacy_connect = module.connect
+    calls = []
+
+    def connect(uri, *, additional_headers=None):
+        return legacy_connect(uri, additional_headers=additional_headers)
+
+    async def recv(decode=None):
+        calls.append(decode)
+        return json.dumps({"status": "completed"}).encode()
+
+    module.connect = connect
+    websocket.recv = recv
+
+    with patch("cognee_sdk.client._websockets", module):
+        updates = [u async for u in client.subscribe_cognify_progress(uuid4())]
+
+    assert updates == [{"status": "completed"}]
+    assert calls[0] is False
+    headers = legacy_connect.call_args[1]["additional_headers"]
+    assert headers["Authorization"] == "Bearer test-token"